@@ -1,10 +1,12 @@
-from typing import Callable, Optional, TypeVar
+from typing import Callable, Optional, Set, TypeVar
 
 from aioarango.connection import Connection
+from aioarango.cursor import Cursor
 from aioarango.executor import ApiExecutor
 from aioarango.request import Request
 from aioarango.response import Response
 from aioarango.result import Result
+from aioarango.tracing import Span, query_hash
 
 T = TypeVar("T")
 
@@ -58,6 +60,21 @@ class ApiGroup:
         """
         return self._executor.context
 
+    def _trace_request(self, span: Span, request: Request) -> None:
+        """Set the span attributes describing the request.
+
+        :param span: Active span.
+        :type span: aioarango.tracing.Span
+        :param request: HTTP request.
+        :type request: aioarango.request.Request
+        """
+        span.set_attribute("db.name", self._conn.db_name)
+        span.set_attribute("http.method", request.method)
+        span.set_attribute("http.endpoint", request.endpoint)
+        span.set_attribute("arango.context", self._executor.context)
+        if isinstance(request.data, dict) and "query" in request.data:
+            span.set_attribute("arango.query_hash", query_hash(request.data["query"]))
+
     async def _execute(
         self, request: Request, response_handler: Callable[[Response], T]
     ) -> Result[T]:
@@ -69,4 +86,70 @@ class ApiGroup:
         :type response_handler: callable
         :return: API execution result.
         """
-        return await self._executor.execute(request, response_handler)
+        with self._conn.tracer.span("arangodb.request") as span:
+            if not span.is_recording:
+                return await self._executor.execute(request, response_handler)
+
+            self._trace_request(span, request)
+            result = await self._executor.execute(request, response_handler)
+            if isinstance(result, Cursor):
+                result._trace(span)
+            return result
+
+    async def _execute_metadata(
+        self, request: Request, response_handler: Callable[[Response], T]
+    ) -> Result[T]:
+        """Execute a metadata API, using the metadata cache if enabled.
+
+        :param request: HTTP request.
+        :type request: aioarango.request.Request
+        :param response_handler: HTTP response handler.
+        :type response_handler: callable
+        :return: API execution result.
+        """
+        cache = self._conn.metadata_cache
+        if cache is None or self._executor.context != "default":
+            return await self._execute(request, response_handler)
+
+        key = cache.key(request.endpoint, request.params)
+        resp = cache.get(key)
+        if resp is not None:
+            return response_handler(self._conn.prep_response(resp, request.deserialize))
+
+        version = cache.version
+
+        def caching_response_handler(resp: Response) -> T:
+            assert cache is not None
+            if resp.is_success:
+                cache.put(key, resp, version)
+            return response_handler(resp)
+
+        return await self._execute(request, caching_response_handler)
+
+    def _invalidate_metadata(self, *keys: str) -> None:
+        """Discard cached metadata changed by a successful DDL operation.
+
+        Cached query plans using the changed collections are discarded too.
+
+        :param keys: Cache keys (see :func:`aioarango.cache.MetadataCache.key`).
+        :type keys: str
+        """
+        cache = self._conn.metadata_cache
+        if cache is not None:
+            cache.invalidate(keys)
+
+        plan_cache = self._conn.plan_cache
+        if plan_cache is None:
+            return
+        collections: Optional[Set[str]] = set()
+        for key in keys:
+            if key.startswith("/_api/index?collection="):
+                collections.add(key.partition("=")[2])
+            elif key.startswith("/_api/collection/"):
+                collections.add(key.split("/")[3])
+            elif key != "/_api/collection":
+                # Views and graphs change the plans of any query using them.
+                collections = None
+                break
+        if collections is None or collections:
+            plan_cache.invalidate(collections)
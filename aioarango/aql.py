@@ -1,9 +1,25 @@
+import asyncio
+import re
+from collections import namedtuple
 from numbers import Number
-from typing import MutableMapping, Optional, Sequence, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    List,
+    Match,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from aioarango.api import ApiGroup
+from aioarango.cache import PlanCache, QueryResultCache
 from aioarango.connection import Connection
-from aioarango.cursor import Cursor
+from aioarango.cursor import AdaptiveBatchSize, Cursor, _bounded_map
 from aioarango.exceptions import (
     AQLCacheClearError,
     AQLCacheConfigureError,
@@ -29,11 +45,17 @@ from aioarango.formatter import (
     format_body,
     format_query_cache_entry,
 )
+from aioarango.job import AsyncJob
+from aioarango.querylog import QueryLog
 from aioarango.request import Request
 from aioarango.response import Response
 from aioarango.result import Result
 from aioarango.typings import Json, Jsons
 
+JOB_POLL_INTERVAL = 0.05
+
+T = TypeVar("T")
+
 
 class AQLQueryCache(ApiGroup):
     """AQL Query Cache API wrapper."""
@@ -163,6 +185,157 @@ class AQL(ApiGroup):
         """
         return AQLQueryCache(self._conn, self._executor)
 
+    @property
+    def query_log(self) -> Optional[QueryLog]:
+        """Return the client-side query log.
+
+        :return: Query log, or None if it is not enabled.
+        :rtype: aioarango.querylog.QueryLog | None
+        """
+        return self._conn.query_log
+
+    def enable_query_log(
+        self, top_k: int = 10, max_queries: int = 1000, max_samples: int = 1000
+    ) -> QueryLog:
+        """Start recording statistics of queries executed through this client.
+
+        The log is shared by all API wrappers of the same database connection.
+        Calling this method again replaces the existing log.
+
+        :param top_k: Number of slowest samples (with bind variables) kept per
+            query.
+        :type top_k: int
+        :param max_queries: Max number of distinct normalized queries tracked.
+        :type max_queries: int
+        :param max_samples: Number of most recent execution times kept per
+            query for computing percentiles.
+        :type max_samples: int
+        :return: Query log.
+        :rtype: aioarango.querylog.QueryLog
+        """
+        query_log = QueryLog(top_k, max_queries, max_samples)
+        self._conn.query_log = query_log
+        return query_log
+
+    def disable_query_log(self) -> None:
+        """Stop recording query statistics and discard the query log."""
+        self._conn.query_log = None
+
+    @property
+    def result_cache(self) -> Optional[QueryResultCache]:
+        """Return the client-side query result cache.
+
+        :return: Result cache, or None if it is not enabled.
+        :rtype: aioarango.cache.QueryResultCache | None
+        """
+        return self._conn.result_cache
+
+    def enable_result_cache(
+        self,
+        max_entries: int = 1000,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> QueryResultCache:
+        """Enable the client-side cache of query results.
+
+        Only executions with parameter **client_cache** set to True use the
+        cache (see :func:`aioarango.aql.AQL.execute`). The collections read by
+        a query are taken from its execution plan. Cached results are discarded
+        when this client writes to any of these collections, and all results
+        are discarded when a query executed through this client modifies
+        documents. The cache is shared by all API wrappers of the same database
+        connection. Calling this method again replaces the existing cache.
+
+        :param max_entries: Max number of cached results.
+        :type max_entries: int
+        :param max_bytes: Max total size of cached results in bytes.
+        :type max_bytes: int | None
+        :param ttl: Number of seconds a result is served. If set to None,
+            results are discarded only when invalidated or evicted.
+        :type ttl: float | None
+        :return: Result cache.
+        :rtype: aioarango.cache.QueryResultCache
+        """
+        result_cache = QueryResultCache(max_entries, max_bytes, ttl)
+        self._conn.result_cache = result_cache
+        return result_cache
+
+    def disable_result_cache(self) -> None:
+        """Disable the client-side cache of query results and discard it."""
+        self._conn.result_cache = None
+
+    @property
+    def plan_cache(self) -> Optional[PlanCache]:
+        """Return the client-side cache of validation and explain results.
+
+        :return: Plan cache, or None if it is not enabled.
+        :rtype: aioarango.cache.PlanCache | None
+        """
+        return self._conn.plan_cache
+
+    def enable_plan_cache(self, max_entries: int = 1000) -> PlanCache:
+        """Enable the client-side cache of validation and explain results.
+
+        Results of :func:`aioarango.aql.AQL.validate` and
+        :func:`aioarango.aql.AQL.explain` are cached outside of async
+        execution, batch execution and transactions. See
+        :class:`aioarango.cache.PlanCache` for how results are keyed and
+        invalidated. The cache is shared by all API wrappers of the same
+        database connection. Calling this method again replaces the existing
+        cache.
+
+        :param max_entries: Max number of cached results.
+        :type max_entries: int
+        :return: Plan cache.
+        :rtype: aioarango.cache.PlanCache
+        """
+        plan_cache = PlanCache(max_entries)
+        self._conn.plan_cache = plan_cache
+        return plan_cache
+
+    def disable_plan_cache(self) -> None:
+        """Disable the client-side cache of validation and explain results."""
+        self._conn.plan_cache = None
+
+    async def _execute_plan_cached(
+        self,
+        kind: str,
+        query: str,
+        bind_vars: Optional[MutableMapping[str, Any]],
+        options: Optional[Json],
+        request: Request,
+        response_handler: Callable[[Response], T],
+    ) -> Result[T]:
+        """Execute a validation or explain request, using the plan cache.
+
+        :param kind: Request kind.
+        :type kind: str
+        :param query: Query text.
+        :type query: str
+        :param bind_vars: Bind variables.
+        :type bind_vars: dict | None
+        :param options: Request options.
+        :type options: dict | None
+        :param request: HTTP request.
+        :type request: aioarango.request.Request
+        :param response_handler: HTTP response handler.
+        :type response_handler: callable
+        :return: API execution result.
+        """
+        plan_cache = self._conn.plan_cache
+        if plan_cache is None or self.context != "default":
+            return await self._execute(request, response_handler)
+
+        key = plan_cache.key(kind, query, bind_vars, options)
+        cached: Optional[T] = plan_cache.get(key)
+        if cached is not None:
+            return cached
+
+        clock = plan_cache.clock
+        result: T = await self._execute(request, response_handler)
+        plan_cache.put(key, result, clock)
+        return result
+
     async def explain(
         self,
         query: str,
@@ -173,6 +346,10 @@ class AQL(ApiGroup):
     ) -> Result[Union[Json, Jsons]]:
         """Inspect the query and return its metadata without executing it.
 
+        If the plan cache is enabled (see
+        :func:`aioarango.aql.AQL.enable_plan_cache`), cached results are
+        returned without asking the server.
+
         :param query: Query to inspect.
         :type query: str
         :param all_plans: If set to True, all possible execution plans are
@@ -215,11 +392,17 @@ class AQL(ApiGroup):
                 plans: Jsons = resp.body["plans"]
                 return plans
 
-        return await self._execute(request, response_handler)
+        return await self._execute_plan_cached(
+            "explain", query, bind_vars, options, request, response_handler
+        )
 
     async def validate(self, query: str) -> Result[Json]:
         """Parse and validate the query without executing it.
 
+        If the plan cache is enabled (see
+        :func:`aioarango.aql.AQL.enable_plan_cache`), cached results are
+        returned without asking the server.
+
         :param query: Query to validate.
         :type query: str
         :return: Query details.
@@ -237,7 +420,9 @@ class AQL(ApiGroup):
 
             raise AQLQueryValidateError(resp, request)
 
-        return await self._execute(request, response_handler)
+        return await self._execute_plan_cached(
+            "validate", query, None, None, request, response_handler
+        )
 
     async def execute(
         self,
@@ -252,7 +437,7 @@ class AQL(ApiGroup):
         cache: Optional[bool] = None,
         memory_limit: int = 0,
         fail_on_warning: Optional[bool] = None,
-        profile: Optional[bool] = None,
+        profile: Union[bool, int, None] = None,
         max_transaction_size: Optional[int] = None,
         max_warning_count: Optional[int] = None,
         intermediate_commit_count: Optional[int] = None,
@@ -261,6 +446,15 @@ class AQL(ApiGroup):
         stream: Optional[bool] = None,
         skip_inaccessible_cols: Optional[bool] = None,
         max_runtime: Optional[Number] = None,
+        client_cache: bool = False,
+        prefetch: Optional[int] = None,
+        allow_retry: Optional[bool] = None,
+        max_retries: int = 3,
+        adaptive_batch_size: Union[bool, AdaptiveBatchSize, None] = None,
+        keep_alive: bool = False,
+        row_fields: Optional[Sequence[str]] = None,
+        row_type: str = "namedtuple",
+        shard_ids: Optional[Sequence[str]] = None,
     ) -> Result[Cursor]:
         """Execute the query and return the result cursor.
 
@@ -301,8 +495,10 @@ class AQL(ApiGroup):
             this behaviour so it does not need to be set per-query.
         :type fail_on_warning: bool
         :param profile: Return additional profiling details in the cursor,
-            unless the query cache is used.
-        :type profile: bool
+            unless the query cache is used. If set to 2, the execution plan
+            and the statistics of each plan node are included as well (see
+            :func:`aioarango.plan.analyze_plan`).
+        :type profile: bool | int
         :param max_transaction_size: Transaction size limit in bytes.
         :type max_transaction_size: int
         :param max_warning_count: Max number of warnings returned.
@@ -343,11 +539,61 @@ class AQL(ApiGroup):
             it is killed. The value is specified in seconds. Default value
             is 0.0 (no timeout).
         :type max_runtime: int | float
+        :param client_cache: If set to True and the client-side result cache
+            is enabled (see :func:`aioarango.aql.AQL.enable_result_cache`),
+            results of read-only queries are fully fetched and stored in the
+            cache, and later executions with the same query, bind variables
+            and result options are served from it. Ignored outside of the
+            default execution context and for profiled queries.
+        :type client_cache: bool
+        :param prefetch: Max number of result batches fetched ahead in the
+            background while the current batch is consumed. Close the cursor
+            to stop prefetching early.
+        :type prefetch: int | None
+        :param allow_retry: If set to True, batches are requested by ID so
+            that the latest batch can be requested again after a failure
+            (ArangoDB 3.11+). The cursor then retries failed batch requests
+            transparently, without duplicating or skipping results.
+        :type allow_retry: bool | None
+        :param max_retries: Max number of times a failed batch request is
+            retried when **allow_retry** is set to True.
+        :type max_retries: int
+        :param adaptive_batch_size: Adjust the size of subsequent batches to
+            the observed response size and fetch time, starting from
+            **batch_size**. Pass True for the default policy or a policy
+            instance to set the targets. Requires a server accepting
+            ``batchSize`` on cursor continuation.
+        :type adaptive_batch_size: bool | aioarango.cursor.AdaptiveBatchSize |
+            None
+        :param keep_alive: Keep the cursor alive on the server while results
+            are consumed slower than its **ttl** (30 seconds by default), so
+            that small TTLs can be used safely. Cursors with **allow_retry**
+            are kept alive without fetching ahead. Close the cursor to stop.
+        :type keep_alive: bool
+        :param row_fields: Names of the values of array results. If set, the
+            query must return each result as an array with one value per
+            field (e.g. "RETURN [doc._key, doc.age]"), and the cursor yields
+            compact records instead of the arrays. The query is not modified,
+            so streaming is not affected.
+        :type row_fields: [str] | None
+        :param row_type: Record type used with **row_fields**: "namedtuple"
+            (field access by name, invalid identifiers are renamed to
+            positional names) or "tuple".
+        :type row_type: str
+        :param shard_ids: Restrict the query to these shards. Available only
+            for clusters.
+        :type shard_ids: [str] | None
         :return: Result cursor.
         :rtype: aioarango.cursor.Cursor
         :raise aioarango.exceptions.AQLQueryExecuteError: If execute fails.
         """
         data: Json = {"query": query, "count": count}
+        row_factory: Optional[Callable[[Any], Any]] = None
+        if row_fields is not None:
+            if row_type == "tuple":
+                row_factory = tuple
+            else:
+                row_factory = namedtuple("Row", row_fields, rename=True)._make
         if batch_size is not None:
             data["batchSize"] = batch_size
         if ttl is not None:
@@ -386,20 +632,382 @@ class AQL(ApiGroup):
             options["skipInaccessibleCollections"] = skip_inaccessible_cols
         if max_runtime is not None:
             options["maxRuntime"] = max_runtime
+        if allow_retry is not None:
+            options["allowRetry"] = allow_retry
+        if shard_ids is not None:
+            options["shardIds"] = shard_ids
 
         if options:
             data["options"] = options
         data.update(options)
 
         request = Request(method="post", endpoint="/_api/cursor", data=data)
+        query_log = self._conn.query_log
+        result_cache = self._conn.result_cache
+        retries = max_retries if allow_retry else 0
+        batch_sizer = None
+        if isinstance(adaptive_batch_size, AdaptiveBatchSize):
+            batch_sizer = adaptive_batch_size
+        elif adaptive_batch_size:
+            batch_sizer = AdaptiveBatchSize()
+
+        def record_stats(cursor: Cursor) -> None:
+            stats: Json = cursor.statistics() or {}
+            if query_log is not None:
+                query_log.record(query, bind_vars, stats, cursor.warnings())
+            if result_cache is not None and stats.get("modified"):
+                # Collections written by the query are not known here.
+                result_cache.invalidate()
 
         def response_handler(resp: Response) -> Cursor:
             if not resp.is_success:
+                if query_log is not None:
+                    query_log.record_error(query)
                 raise AQLQueryExecuteError(resp, request)
-            return Cursor(self._conn, resp.body)
+            return Cursor(
+                self._conn,
+                resp.body,
+                stats_callback=(
+                    None if query_log is None and result_cache is None else record_stats
+                ),
+                prefetch=prefetch,
+                retries=retries,
+                batch_sizer=batch_sizer,
+                keep_alive=(30 if ttl is None else ttl) if keep_alive else None,
+                row_factory=row_factory,
+            )
+
+        if (
+            client_cache
+            and result_cache is not None
+            and self.context == "default"
+            and not profile
+        ):
+            result_options = {
+                "count": count,
+                "fullCount": full_count,
+                "failOnWarning": fail_on_warning,
+                "maxWarningCount": max_warning_count,
+                "skipInaccessibleCollections": skip_inaccessible_cols,
+            }
+            key = result_cache.key(data["query"], bind_vars, result_options)
+            return await self._execute_cached(
+                result_cache,
+                key,
+                data["query"],
+                bind_vars,
+                request,
+                response_handler,
+                row_factory,
+            )
 
         return await self._execute(request, response_handler)
 
+    async def _execute_cached(
+        self,
+        result_cache: QueryResultCache,
+        key: str,
+        query: str,
+        bind_vars: Optional[MutableMapping[str, str]],
+        request: Request,
+        response_handler: Callable[[Response], Cursor],
+        row_factory: Optional[Callable[[Any], Any]] = None,
+    ) -> Cursor:
+        """Execute the query using the client-side result cache.
+
+        :param result_cache: Result cache.
+        :type result_cache: aioarango.cache.QueryResultCache
+        :param key: Cache key of the execution.
+        :type key: str
+        :param query: Query to execute.
+        :type query: str
+        :param bind_vars: Bind variables for the query.
+        :type bind_vars: dict | None
+        :param request: Cursor request.
+        :type request: aioarango.request.Request
+        :param response_handler: Cursor response handler.
+        :type response_handler: callable
+        :param row_factory: Converter of results, for cursors served from
+            the cache.
+        :type row_factory: callable | None
+        :return: Result cursor with all results fetched.
+        :rtype: aioarango.cursor.Cursor
+        """
+        raw_data = result_cache.get(key)
+        if raw_data is not None:
+            cached = self._conn.deserialize(raw_data)
+            return Cursor(self._conn, cached, row_factory=row_factory)
+
+        clock = result_cache.clock
+        known, dependencies = result_cache.dependencies(key)
+        if known:
+            cursor: Cursor = await self._execute(request, response_handler)
+        else:
+            # The execution plan is retrieved while the query runs.
+            explained, cursor = await asyncio.gather(
+                self._explain_query(query, bind_vars),
+                self._execute(request, response_handler),
+            )
+            if explained is None:
+                return cursor
+            dependencies = result_cache.set_dependencies(
+                key, explained["plan"], explained.get("cacheable", False)
+            )
+
+        if dependencies is None:
+            return cursor
+
+        while cursor.has_more():
+            await cursor.fetch()
+
+        data: Json = {"result": list(cursor.batch()), "hasMore": False, "cached": True}
+        if cursor.count() is not None:
+            data["count"] = cursor.count()
+        extra: Json = {}
+        if cursor.statistics() is not None:
+            extra["stats"] = cursor.statistics()
+        if cursor.warnings() is not None:
+            extra["warnings"] = cursor.warnings()
+        if extra:
+            data["extra"] = extra
+
+        result_cache.put(key, self._conn.serialize(data), dependencies, clock)
+        return cursor
+
+    async def _open_cursor(self, options: Json) -> Cursor:
+        """Execute a query and return its cursor, waiting for async jobs.
+
+        :param options: Keyword arguments of
+            :func:`aioarango.aql.AQL.execute`.
+        :type options: dict
+        :return: Result cursor.
+        :rtype: aioarango.cursor.Cursor
+        """
+        result = await self.execute(**options)
+        if isinstance(result, AsyncJob):
+            while await result.status() == "pending":
+                await asyncio.sleep(JOB_POLL_INTERVAL)
+            result = await result.result()
+        return result
+
+    def _close_abandoned(self, execution: "asyncio.Future[Cursor]") -> None:
+        """Close the cursor of an execution whose caller was cancelled.
+
+        :param execution: Finished execution.
+        :type execution: asyncio.Future
+        """
+        if execution.cancelled() or execution.exception() is not None:
+            return
+        cursor = execution.result()
+        if cursor.has_more():
+            self._conn.cursors.close_later(cursor)
+
+    async def _execute_drained(self, options: Json) -> List[Any]:
+        """Execute a query and return all of its results.
+
+        If the caller is cancelled before the cursor is returned, the
+        execution is completed in the background and its cursor is closed on
+        the server.
+
+        :param options: Keyword arguments of
+            :func:`aioarango.aql.AQL.execute`.
+        :type options: dict
+        :return: Query results.
+        :rtype: list
+        """
+        # Shielded so that the cursor created by the server is not lost.
+        execution = asyncio.ensure_future(self._open_cursor(options))
+        try:
+            cursor = await asyncio.shield(execution)
+        except asyncio.CancelledError:
+            execution.add_done_callback(self._close_abandoned)
+            raise
+
+        try:
+            return await cursor.drain()
+        finally:
+            if cursor.has_more():
+                await cursor.close(ignore_missing=True)
+
+    async def execute_completed(
+        self,
+        queries: Sequence[Json],
+        concurrency: int = 10,
+        timeout: Optional[Number] = None,
+    ) -> AsyncIterator[Tuple[int, Union[List[Any], Exception]]]:
+        """Execute queries concurrently, yielding results as they complete.
+
+        Each query is executed with :func:`aioarango.aql.AQL.execute` and its
+        cursor is read to the end. Queries which fail, or which do not finish
+        before the deadline, yield the exception instead of their results
+        without affecting the others. Unfinished queries are cancelled and
+        their cursors closed when the deadline passes (for queries still
+        executing, once the server returns the cursor).
+
+        In async execution context, the query jobs are polled until done. In
+        transactions, queries are executed one at a time. Not available in
+        batch execution context.
+
+        :param queries: Keyword arguments of
+            :func:`aioarango.aql.AQL.execute` per query (e.g.
+            ``{"query": "...", "bind_vars": {...}}``).
+        :type queries: [dict]
+        :param concurrency: Max number of queries executed at the same time.
+        :type concurrency: int
+        :param timeout: Number of seconds until the deadline for all queries.
+        :type timeout: int | float | None
+        :return: Async iterator of query positions in **queries** and query
+            results (or exceptions).
+        :rtype: typing.AsyncIterator[(int, list | Exception)]
+        """
+        assert self.context != "batch", "not available in batch execution context"
+        if self.context == "transaction":
+            concurrency = 1
+
+        loop = asyncio.get_event_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        async def items() -> AsyncIterator[Tuple[int, Json]]:
+            for item in enumerate(queries):
+                yield item
+
+        async def run(
+            item: Tuple[int, Json]
+        ) -> Tuple[int, Union[List[Any], Exception]]:
+            index, options = item
+            try:
+                if deadline is None:
+                    return index, await self._execute_drained(options)
+                remaining = max(deadline - loop.time(), 0)
+                execution = self._execute_drained(options)
+                return index, await asyncio.wait_for(execution, remaining)
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                return index, err
+
+        async for result in _bounded_map(items(), run, concurrency, ordered=False):
+            yield result
+
+    async def execute_all(
+        self,
+        queries: Sequence[Json],
+        concurrency: int = 10,
+        timeout: Optional[Number] = None,
+    ) -> List[Union[List[Any], Exception]]:
+        """Execute queries concurrently and return their results.
+
+        See :func:`aioarango.aql.AQL.execute_completed` for details.
+
+        .. note::
+
+            If a query fails, the exception is not raised but returned in
+            place of its results. It is up to you to inspect the list to
+            determine which queries were successful (returns a list of query
+            results) and which were not (returns exception object).
+
+        :param queries: Keyword arguments of
+            :func:`aioarango.aql.AQL.execute` per query (e.g.
+            ``{"query": "...", "bind_vars": {...}}``).
+        :type queries: [dict]
+        :param concurrency: Max number of queries executed at the same time.
+        :type concurrency: int
+        :param timeout: Number of seconds until the deadline for all queries.
+        :type timeout: int | float | None
+        :return: Query results (or exceptions), in the order of **queries**.
+        :rtype: [list | Exception]
+        """
+        results: List[Union[List[Any], Exception]] = [[] for _ in queries]
+        async for index, result in self.execute_completed(
+            queries, concurrency, timeout
+        ):
+            results[index] = result
+        return results
+
+    async def execute_many(
+        self,
+        query: str,
+        bind_vars_list: Sequence[MutableMapping[str, Any]],
+        concurrency: int = 10,
+        timeout: Optional[Number] = None,
+        options: Optional[Json] = None,
+    ) -> List[Union[List[Any], Exception]]:
+        """Execute a query with each set of bind variables concurrently.
+
+        See :func:`aioarango.aql.AQL.execute_completed` for details.
+
+        .. note::
+
+            If a query fails, the exception is not raised but returned in
+            place of its results. It is up to you to inspect the list to
+            determine which queries were successful (returns a list of query
+            results) and which were not (returns exception object).
+
+        :param query: Query to execute.
+        :type query: str
+        :param bind_vars_list: Bind variables per execution.
+        :type bind_vars_list: [dict]
+        :param concurrency: Max number of queries executed at the same time.
+        :type concurrency: int
+        :param timeout: Number of seconds until the deadline for all queries.
+        :type timeout: int | float | None
+        :param options: Other keyword arguments of
+            :func:`aioarango.aql.AQL.execute` (e.g. ``{"batch_size": 1000}``).
+        :type options: dict | None
+        :return: Query results (or exceptions), in the order of
+            **bind_vars_list**.
+        :rtype: [list | Exception]
+        """
+        queries = [
+            dict(options or {}, query=query, bind_vars=bind_vars)
+            for bind_vars in bind_vars_list
+        ]
+        return await self.execute_all(queries, concurrency, timeout)
+
+    def group(self) -> "AQLQueryGroup":
+        """Return a group for executing independent read queries together.
+
+        **Example:**
+
+        .. code-block:: python
+
+            group = db.aql.group()
+            group.add("RETURN LENGTH(students)")
+            group.add("FOR s IN students FILTER s.age > @age RETURN s", {"age": 20})
+            count, students = await group.execute()
+
+        :return: Query group.
+        :rtype: aioarango.aql.AQLQueryGroup
+        """
+        return AQLQueryGroup(self)
+
+    async def _explain_query(
+        self, query: str, bind_vars: Optional[MutableMapping[str, str]]
+    ) -> Optional[Json]:
+        """Return the explain result of the query, or None on failure.
+
+        :param query: Query to explain.
+        :type query: str
+        :param bind_vars: Bind variables for the query.
+        :type bind_vars: dict | None
+        :return: Execution plan ("plan") and whether the query results can be
+            cached ("cacheable").
+        :rtype: dict | None
+        """
+        data: Json = {"query": query}
+        if bind_vars is not None:
+            data["bindVars"] = bind_vars
+        request = Request(method="post", endpoint="/_api/explain", data=data)
+
+        def response_handler(resp: Response) -> Optional[Json]:
+            if not resp.is_success or "plan" not in resp.body:
+                return None
+            result: Json = resp.body
+            return result
+
+        result = await self._execute(request, response_handler)
+        return result if isinstance(result, dict) else None
+
     async def kill(self, query_id: str) -> Result[bool]:
         """Kill a running query.
 
@@ -617,3 +1225,108 @@ class AQL(ApiGroup):
             return {"deleted": resp.body["deletedCount"]}
 
         return await self._execute(request, response_handler)
+
+
+class AQLQueryGroup:
+    """Group of independent read queries executed in one round trip.
+
+    The queries are composed into one query which runs each of them as a
+    subquery and returns all their results at once. Bind variables of each
+    query are renamed with a per-query prefix so that they do not collide.
+    The subquery results are assigned to variables prefixed with
+    ``aioarango_``, which the queries must not use.
+
+    See :func:`aioarango.aql.AQL.group`.
+
+    :param aql: AQL API wrapper.
+    :type aql: aioarango.aql.AQL
+    """
+
+    def __init__(self, aql: AQL) -> None:
+        self._aql = aql
+        self._queries: List[Tuple[str, Json]] = []
+
+    def __repr__(self) -> str:
+        return f"<AQLQueryGroup {len(self._queries)} queries>"
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def add(
+        self, query: str, bind_vars: Optional[MutableMapping[str, Any]] = None
+    ) -> int:
+        """Add a query to the group.
+
+        The query must not modify data, nor start with a WITH statement.
+
+        :param query: Query to execute.
+        :type query: str
+        :param bind_vars: Bind variables for the query.
+        :type bind_vars: dict | None
+        :return: Position of the query results in
+            :func:`aioarango.aql.AQLQueryGroup.execute`.
+        :rtype: int
+        """
+        self._queries.append((query, dict(bind_vars or {})))
+        return len(self._queries) - 1
+
+    def compose(self) -> Tuple[str, Json]:
+        """Return the combined query and its bind variables.
+
+        :return: Query and bind variables.
+        :rtype: (str, dict)
+        """
+        parts = []
+        bind_vars: Json = {}
+        for index, (query, query_vars) in enumerate(self._queries):
+            prefix = f"q{index}_"
+            query = _BIND_VAR.sub(lambda m: _rename_bind_var(m, prefix), query)
+            parts.append(f"LET aioarango_q{index} = (\n{query}\n)\n")
+            for name, value in query_vars.items():
+                if name.startswith("@"):
+                    bind_vars[f"@{prefix}{name[1:]}"] = value
+                else:
+                    bind_vars[prefix + name] = value
+        names = ", ".join(f"aioarango_q{index}" for index in range(len(self._queries)))
+        return "".join(parts) + f"RETURN [{names}]", bind_vars
+
+    async def execute(self, options: Optional[Json] = None) -> List[List[Any]]:
+        """Execute the queries in one round trip.
+
+        Not available in batch execution context.
+
+        :param options: Other keyword arguments of
+            :func:`aioarango.aql.AQL.execute` (e.g. ``{"max_runtime": 5}``).
+        :type options: dict | None
+        :return: Results of each query, in the order they were added.
+        :rtype: [list]
+        :raise aioarango.exceptions.AQLQueryExecuteError: If execute fails.
+        """
+        assert self._queries, "no queries added"
+        assert self._aql.context != "batch", "not available in batch execution context"
+        query, bind_vars = self.compose()
+        options = dict(options or {}, query=query, bind_vars=bind_vars)
+        results: List[List[List[Any]]] = await self._aql._execute_drained(options)
+        return results[0]
+
+
+_BIND_VAR = re.compile(
+    r"""("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|`[^`]*`|´[^´]*´|//[^\n]*|/\*.*?\*/)"""
+    r"|@(@?)(\w+)",
+    re.DOTALL,
+)
+
+
+def _rename_bind_var(match: Match[str], prefix: str) -> str:
+    """Return a bind parameter with a prefixed name, or a literal unchanged.
+
+    :param match: Match of a string literal, comment or bind parameter.
+    :type match: re.Match
+    :param prefix: Prefix of the bind parameter name.
+    :type prefix: str
+    :return: Replacement text.
+    :rtype: str
+    """
+    if match.group(1) is not None:
+        return match.group(1)
+    return f"@{match.group(2)}{prefix}{match.group(3)}"
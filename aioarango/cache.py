@@ -0,0 +1,741 @@
+import json
+import re
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, FrozenSet, Iterable, MutableMapping, Optional, Tuple
+from urllib.parse import urlencode
+
+from aioarango.response import Response
+from aioarango.typings import Json
+
+
+class CachedDocument:
+    """Document body stored in :class:`aioarango.cache.DocumentCache`.
+
+    :param rev: Document revision.
+    :type rev: str
+    :param raw_body: Serialized document body.
+    :type raw_body: str
+    :param expires: Monotonic time after which the entry must be revalidated,
+        or None if it never expires.
+    :type expires: float | None
+    :ivar size: Size of the UTF-8 encoded body in bytes.
+    :vartype size: int
+    """
+
+    __slots__ = ("rev", "raw_body", "expires", "size")
+
+    def __init__(self, rev: str, raw_body: str, expires: Optional[float]) -> None:
+        self.rev = rev
+        self.raw_body = raw_body
+        self.expires = expires
+        self.size = len(raw_body.encode())
+
+    @property
+    def fresh(self) -> bool:
+        """Return True if the entry can be served without revalidation.
+
+        :return: True if the entry has not expired.
+        :rtype: bool
+        """
+        return self.expires is None or monotonic() < self.expires
+
+
+class DocumentCache:
+    """Bounded LRU cache of documents keyed by document ID.
+
+    Documents are stored serialized, so every lookup returns a separate copy
+    and memory usage can be bounded by the size of the stored bodies. Expired
+    entries are not discarded but revalidated against the server using their
+    revision.
+
+    :param max_size: Max number of cached documents. The least recently used
+        document is evicted first.
+    :type max_size: int
+    :param ttl: Number of seconds a document is served without revalidation.
+        If set to None, documents are only refreshed when invalidated.
+    :type ttl: float | None
+    :param max_bytes: Max total size of cached document bodies in bytes. If not
+        set, only **max_size** applies.
+    :type max_bytes: int | None
+
+    :ivar hits: Number of lookups served from the cache.
+    :vartype hits: int
+    :ivar misses: Number of lookups of documents not in the cache.
+    :vartype misses: int
+    :ivar revalidations: Number of lookups of expired documents.
+    :vartype revalidations: int
+    :ivar not_modified: Number of revalidations where the document had not
+        changed and its body was not transferred again.
+    :vartype not_modified: int
+    :ivar evictions: Number of documents evicted due to size limits.
+    :vartype evictions: int
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: Optional[float] = 60.0,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CachedDocument]" = OrderedDict()
+        self._bytes = 0
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.not_modified = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return f"<DocumentCache {len(self._entries)} documents>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._entries
+
+    @property
+    def bytes(self) -> int:
+        """Return the total size of cached document bodies.
+
+        :return: Size in bytes.
+        :rtype: int
+        """
+        return self._bytes
+
+    @property
+    def version(self) -> int:
+        """Return the invalidation counter.
+
+        The counter is incremented on every invalidation. Documents fetched
+        while an invalidation happened are not stored (see
+        :func:`aioarango.cache.DocumentCache.put`).
+
+        :return: Invalidation counter.
+        :rtype: int
+        """
+        return self._version
+
+    def lookup(self, doc_id: str) -> Optional[CachedDocument]:
+        """Return the cache entry of the document.
+
+        :param doc_id: Document ID.
+        :type doc_id: str
+        :return: Cache entry, or None if the document is not cached. The entry
+            must be revalidated if it is not fresh.
+        :rtype: aioarango.cache.CachedDocument | None
+        """
+        entry = self._entries.get(doc_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(doc_id)
+        if entry.fresh:
+            self.hits += 1
+        else:
+            self.revalidations += 1
+        return entry
+
+    def put(
+        self, doc_id: str, rev: str, raw_body: str, version: Optional[int] = None
+    ) -> None:
+        """Store the document.
+
+        :param doc_id: Document ID.
+        :type doc_id: str
+        :param rev: Document revision.
+        :type rev: str
+        :param raw_body: Serialized document body.
+        :type raw_body: str
+        :param version: Value of :attr:`version` when the document was
+            requested. If the cache was invalidated since, the document may be
+            outdated and is not stored.
+        :type version: int | None
+        """
+        if version is not None and version != self._version:
+            return
+
+        self._discard(doc_id)
+        expires = None if self._ttl is None else monotonic() + self._ttl
+        entry = CachedDocument(rev, raw_body, expires)
+        if self._max_bytes is not None and entry.size > self._max_bytes:
+            return
+
+        self._entries[doc_id] = entry
+        self._bytes += entry.size
+
+        while len(self._entries) > self._max_size or (
+            self._max_bytes is not None and self._bytes > self._max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+    def refresh(self, doc_id: str, entry: CachedDocument) -> None:
+        """Mark the entry as revalidated by the server.
+
+        :param doc_id: Document ID.
+        :type doc_id: str
+        :param entry: Revalidated cache entry.
+        :type entry: aioarango.cache.CachedDocument
+        """
+        self.not_modified += 1
+        if self._entries.get(doc_id) is entry:
+            entry.expires = None if self._ttl is None else monotonic() + self._ttl
+
+    def invalidate(self, doc_ids: Optional[Iterable[str]] = None) -> None:
+        """Discard cached documents.
+
+        :param doc_ids: IDs of the documents to discard. If not set, all
+            documents are discarded.
+        :type doc_ids: [str] | None
+        """
+        self._version += 1
+        if doc_ids is None:
+            self._entries.clear()
+            self._bytes = 0
+        else:
+            for doc_id in doc_ids:
+                self._discard(doc_id)
+
+    def _discard(self, doc_id: str) -> None:
+        entry = self._entries.pop(doc_id, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def clear(self) -> None:
+        """Discard all cached documents and reset the counters."""
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.not_modified = 0
+        self.evictions = 0
+
+
+_ResultEntry = Tuple[str, FrozenSet[str], Optional[float], int]
+
+
+class QueryResultCache:
+    """Bounded LRU cache of fully materialized AQL query results.
+
+    Each entry depends on the collections read by its query. Entries are
+    invalidated when the client writes to one of these collections, or when
+    :func:`aioarango.cache.QueryResultCache.invalidate` is called (e.g. on a
+    change notification from another process).
+
+    :param max_entries: Max number of cached results. The least recently used
+        result is evicted first.
+    :type max_entries: int
+    :param max_bytes: Max total size of cached results in bytes. If not set,
+        only **max_entries** applies.
+    :type max_bytes: int | None
+    :param ttl: Number of seconds a result is served. If set to None, results
+        are only discarded when invalidated or evicted.
+    :type ttl: float | None
+
+    :ivar hits: Number of executions served from the cache.
+    :vartype hits: int
+    :ivar misses: Number of executions sent to the server.
+    :vartype misses: int
+    :ivar invalidations: Number of results discarded due to writes or
+        invalidation signals.
+    :vartype invalidations: int
+    :ivar evictions: Number of results discarded due to size limits.
+    :vartype evictions: int
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        # Key -> (serialized cursor data, collections read, expiry time, size)
+        self._entries: "OrderedDict[str, _ResultEntry]" = OrderedDict()
+        # Key -> collections read, or None if the query is not cacheable
+        self._dependencies: "OrderedDict[str, Optional[FrozenSet[str]]]" = OrderedDict()
+        self._bytes = 0
+        self._clock = 0
+        self._cleared_at = 0
+        self._invalidated_at: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return f"<QueryResultCache {len(self._entries)} results>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(query: str, bind_vars: Optional[Json], options: Json) -> str:
+        """Return the cache key of a query execution.
+
+        :param query: Query text.
+        :type query: str
+        :param bind_vars: Bind variables.
+        :type bind_vars: dict | None
+        :param options: Query options affecting the result.
+        :type options: dict
+        :return: Cache key.
+        :rtype: str
+        """
+        return json.dumps([query, bind_vars or {}, options], sort_keys=True, default=str)
+
+    @property
+    def bytes(self) -> int:
+        """Return the total size of cached results.
+
+        :return: Size in bytes.
+        :rtype: int
+        """
+        return self._bytes
+
+    @property
+    def clock(self) -> int:
+        """Return the invalidation clock.
+
+        The clock advances on every invalidation. Results of executions that
+        started before an invalidation of their collections are not stored
+        (see :func:`aioarango.cache.QueryResultCache.put`).
+
+        :return: Invalidation clock.
+        :rtype: int
+        """
+        return self._clock
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached result.
+
+        :param key: Cache key.
+        :type key: str
+        :return: Serialized cursor data, or None if not cached.
+        :rtype: str | None
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[2] is not None and monotonic() >= entry[2]:
+            self._discard(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def dependencies(self, key: str) -> Tuple[bool, Optional[FrozenSet[str]]]:
+        """Return the collections read by the query.
+
+        :param key: Cache key.
+        :type key: str
+        :return: Whether the dependencies are known, and the names of the
+            collections read (None if the result must not be cached).
+        :rtype: (bool, frozenset | None)
+        """
+        if key not in self._dependencies:
+            return False, None
+        self._dependencies.move_to_end(key)
+        return True, self._dependencies[key]
+
+    def set_dependencies(
+        self, key: str, plan: Optional[Json], cacheable: bool = True
+    ) -> Optional[FrozenSet[str]]:
+        """Set the collections read by the query from its execution plan.
+
+        Queries which write to collections, read from views or are reported
+        as not cacheable by the server (e.g. using RAND() or user functions)
+        are marked as not cacheable.
+
+        :param key: Cache key.
+        :type key: str
+        :param plan: Execution plan returned by
+            :func:`aioarango.aql.AQL.explain`, or None if not available.
+        :type plan: dict | None
+        :param cacheable: The "cacheable" flag of the explain result.
+        :type cacheable: bool
+        :return: Names of the collections read, or None if the query is not
+            cacheable.
+        :rtype: frozenset | None
+        """
+        dependencies: Optional[FrozenSet[str]] = None
+        if plan is not None and cacheable:
+            collections = plan.get("collections", [])
+            nodes = plan.get("nodes", [])
+            if not any(col.get("type") != "read" for col in collections) and not any(
+                node.get("type") == "EnumerateViewNode" for node in nodes
+            ):
+                dependencies = frozenset(col["name"] for col in collections)
+
+        self._dependencies[key] = dependencies
+        if len(self._dependencies) > self._max_entries:
+            self._dependencies.popitem(last=False)
+        return dependencies
+
+    def put(self, key: str, raw_data: str, collections: Iterable[str], clock: int) -> None:
+        """Store the result.
+
+        :param key: Cache key.
+        :type key: str
+        :param raw_data: Serialized cursor data.
+        :type raw_data: str
+        :param collections: Names of the collections read by the query.
+        :type collections: [str]
+        :param clock: Value of :attr:`clock` when the execution started. If
+            any of the collections was invalidated since, the result may be
+            outdated and is not stored.
+        :type clock: int
+        """
+        collections = frozenset(collections)
+        if self._cleared_at > clock or any(
+            self._invalidated_at.get(name, 0) > clock for name in collections
+        ):
+            return
+
+        self._discard(key)
+        size = len(raw_data.encode())
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+
+        expires = None if self._ttl is None else monotonic() + self._ttl
+        self._entries[key] = (raw_data, collections, expires, size)
+        self._bytes += size
+
+        while len(self._entries) > self._max_entries or (
+            self._max_bytes is not None and self._bytes > self._max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted[3]
+            self.evictions += 1
+
+    def invalidate(self, collections: Optional[Iterable[str]] = None) -> None:
+        """Discard cached results.
+
+        :param collections: Names of modified collections. Results of queries
+            reading any of them are discarded. If not set, all results are
+            discarded.
+        :type collections: [str] | None
+        """
+        self._clock += 1
+        if collections is None:
+            self._cleared_at = self._clock
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            return
+
+        names = set(collections)
+        for name in names:
+            self._invalidated_at[name] = self._clock
+        for key in [k for k, v in self._entries.items() if not names.isdisjoint(v[1])]:
+            self._discard(key)
+            self.invalidations += 1
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[3]
+
+    def clear(self) -> None:
+        """Discard all cached results and query dependencies, and reset the
+        counters.
+        """
+        self.invalidate()
+        self._dependencies.clear()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+
+class MetadataCache:
+    """Cache of metadata API responses with time-to-live.
+
+    Successful responses of metadata reads (collection lists and properties,
+    indexes, graphs and views) are stored by endpoint and URL parameters, so
+    API methods reading the same endpoint share one entry. Every lookup
+    returns a separate copy of the response.
+
+    :param ttl: Number of seconds a response is served. If set to None,
+        responses are only discarded when invalidated.
+    :type ttl: float | None
+
+    :ivar hits: Number of requests served from the cache.
+    :vartype hits: int
+    :ivar misses: Number of requests sent to the server.
+    :vartype misses: int
+    """
+
+    def __init__(self, ttl: Optional[float] = 60.0) -> None:
+        self._ttl = ttl
+        self._entries: Dict[str, Tuple[Response, Optional[float]]] = {}
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"<MetadataCache {len(self._entries)} entries>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[MutableMapping[str, str]] = None) -> str:
+        """Return the cache key of a request.
+
+        :param endpoint: API endpoint.
+        :type endpoint: str
+        :param params: URL parameters.
+        :type params: dict | None
+        :return: Cache key.
+        :rtype: str
+        """
+        if not params:
+            return endpoint
+        return f"{endpoint}?{urlencode(sorted(params.items()))}"
+
+    @property
+    def version(self) -> int:
+        """Return the invalidation counter.
+
+        :return: Invalidation counter.
+        :rtype: int
+        """
+        return self._version
+
+    def get(self, key: str) -> Optional[Response]:
+        """Return a copy of the cached response.
+
+        :param key: Cache key.
+        :type key: str
+        :return: Response with raw body only, or None if not cached or
+            expired.
+        :rtype: aioarango.response.Response | None
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] is not None and monotonic() >= entry[1]:
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        resp = entry[0]
+        return Response(
+            method=resp.method,
+            url=resp.url,
+            headers=resp.headers,
+            status_code=resp.status_code,
+            status_text=resp.status_text,
+            raw_body=resp.raw_body,
+        )
+
+    def put(self, key: str, resp: Response, version: Optional[int] = None) -> None:
+        """Store the response.
+
+        :param key: Cache key.
+        :type key: str
+        :param resp: Successful response.
+        :type resp: aioarango.response.Response
+        :param version: Value of :attr:`version` when the request was sent. If
+            the cache was invalidated since, the response is not stored.
+        :type version: int | None
+        """
+        if version is not None and version != self._version:
+            return
+        expires = None if self._ttl is None else monotonic() + self._ttl
+        self._entries[key] = (resp, expires)
+
+    def invalidate(self, keys: Optional[Iterable[str]] = None) -> None:
+        """Discard cached responses.
+
+        :param keys: Keys of the responses to discard (see
+            :func:`aioarango.cache.MetadataCache.key`). If not set, all
+            responses are discarded.
+        :type keys: [str] | None
+        """
+        self._version += 1
+        if keys is None:
+            self._entries.clear()
+        else:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Discard all cached responses and reset the counters."""
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+
+
+class PlanCache:
+    """Bounded LRU cache of AQL query validation and explain results.
+
+    Results are keyed by query text, options and the shape of the bind
+    variables: the values of collection bind parameters (e.g. "@@col") and of
+    bind parameters used as attribute names (e.g. "doc.@field") are part of
+    the key, while other bind parameters only contribute their type. Explain
+    results are therefore shared by executions differing only in such values,
+    and values embedded in the cached plan are those of the first execution.
+
+    Results are stored serialized, so every lookup returns a separate copy.
+    Results depending on a collection are discarded when the client changes
+    the collection or its indexes, and all results are discarded when views
+    or graphs change.
+
+    :param max_entries: Max number of cached results. The least recently used
+        result is evicted first.
+    :type max_entries: int
+
+    :ivar hits: Number of lookups served from the cache.
+    :vartype hits: int
+    :ivar misses: Number of lookups sent to the server.
+    :vartype misses: int
+    :ivar invalidations: Number of results discarded due to changes.
+    :vartype invalidations: int
+    :ivar evictions: Number of results discarded due to size limits.
+    :vartype evictions: int
+    """
+
+    def __init__(self, max_entries: int = 1000) -> None:
+        self._max_entries = max_entries
+        # Key -> (serialized result, collections used)
+        self._entries: "OrderedDict[str, Tuple[str, FrozenSet[str]]]" = OrderedDict()
+        self._clock = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return f"<PlanCache {len(self._entries)} results>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(
+        kind: str, query: str, bind_vars: Optional[Json] = None, options: Any = None
+    ) -> str:
+        """Return the cache key of a validation or explain request.
+
+        :param kind: Request kind (e.g. "validate" or "explain").
+        :type kind: str
+        :param query: Query text.
+        :type query: str
+        :param bind_vars: Bind variables.
+        :type bind_vars: dict | None
+        :param options: Request options affecting the result.
+        :type options: Any
+        :return: Cache key.
+        :rtype: str
+        """
+        shape: Json = {}
+        if bind_vars:
+            attributes = set(_ATTRIBUTE_BIND_VAR.findall(query))
+            for name, value in bind_vars.items():
+                if name.startswith("@") or name in attributes:
+                    shape[name] = value
+                else:
+                    shape[name] = type(value).__name__
+        return json.dumps([kind, query, shape, options], sort_keys=True, default=str)
+
+    @property
+    def clock(self) -> int:
+        """Return the invalidation clock.
+
+        The clock advances on every invalidation. Results of requests sent
+        before an invalidation are not stored.
+
+        :return: Invalidation clock.
+        :rtype: int
+        """
+        return self._clock
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached result.
+
+        :param key: Cache key.
+        :type key: str
+        :return: Validation or explain result, or None if not cached.
+        :rtype: Any
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return json.loads(entry[0])
+
+    def put(self, key: str, result: Any, clock: int) -> None:
+        """Store a validation or explain result.
+
+        :param key: Cache key.
+        :type key: str
+        :param result: Validation result, or explain plan or plans.
+        :type result: Any
+        :param clock: Value of :attr:`clock` when the request was sent. If the
+            cache was invalidated since, the result is not stored.
+        :type clock: int
+        """
+        if clock != self._clock:
+            return
+
+        plans = result if isinstance(result, list) else [result]
+        collections = frozenset(
+            col["name"] if isinstance(col, dict) else col
+            for plan in plans
+            for col in plan.get("collections", [])
+        )
+        self._entries[key] = (json.dumps(result), collections)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, collections: Optional[Iterable[str]] = None) -> None:
+        """Discard cached results.
+
+        :param collections: Names of changed collections. Results using any
+            of them are discarded. If not set, all results are discarded.
+        :type collections: [str] | None
+        """
+        self._clock += 1
+        if collections is None:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            return
+
+        names = set(collections)
+        for key in [k for k, v in self._entries.items() if not names.isdisjoint(v[1])]:
+            del self._entries[key]
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Discard all cached results and reset the counters."""
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+
+_ATTRIBUTE_BIND_VAR = re.compile(r"(?:\.|\[)\s*@(\w+)")
@@ -1,3 +1,4 @@
+import weakref
 from json import dumps, loads
 from typing import Any, Callable, Optional, Sequence, Union
 
@@ -18,6 +19,7 @@ from aioarango.resolver import (
     RoundRobinHostResolver,
     SingleHostResolver,
 )
+from aioarango.tracing import Tracer
 
 
 class ArangoClient:
@@ -40,6 +42,9 @@ class ArangoClient:
         the de-serialized object. If not given, ``json.loads`` is used by
         default.
     :type deserializer: callable
+    :param tracer: Tracer used to wrap requests in spans and propagate the W3C
+        ``traceparent`` header. If not given, nothing is traced.
+    :type tracer: aioarango.tracing.Tracer
     """
 
     def __init__(
@@ -49,6 +54,7 @@ class ArangoClient:
         http_client: Optional[HTTPClient] = None,
         serializer: Callable[..., str] = lambda x: dumps(x),
         deserializer: Callable[[str], Any] = lambda x: loads(x),
+        tracer: Optional[Tracer] = None,
     ) -> None:
         if isinstance(hosts, str):
             self._hosts = [host.strip("/") for host in hosts.split(",")]
@@ -68,12 +74,17 @@ class ArangoClient:
         self._http = http_client or DefaultHTTPClient()
         self._serializer = serializer
         self._deserializer = deserializer
+        self._tracer = tracer
         self._sessions = [self._http.create_session(h) for h in self._hosts]
+        self._connections: "weakref.WeakSet[Connection]" = weakref.WeakSet()
 
     def __repr__(self) -> str:
         return f"<ArangoClient {','.join(self._hosts)}>"
 
     async def close(self):
+        """Close all cursors still open on the server and the HTTP sessions."""
+        for connection in list(self._connections):
+            await connection.cursors.close_all()
         for session in self._sessions:
             await session.aclose()
 
@@ -103,6 +114,10 @@ class ArangoClient:
         verify: bool = False,
         auth_method: str = "basic",
         superuser_token: Optional[str] = None,
+        coalesce_reads: bool = False,
+        auto_batch: bool = False,
+        auto_batch_window: float = 0.001,
+        auto_batch_size: int = 100,
     ) -> StandardDatabase:
         """Connect to an ArangoDB database and return the database API wrapper.
 
@@ -123,6 +138,22 @@ class ArangoClient:
             If set, parameters **username**, **password** and **auth_method**
             are ignored. This token is not refreshed automatically.
         :type superuser_token: str
+        :param coalesce_reads: If set to True, identical concurrent read
+            requests (same method, endpoint, parameters, headers and database)
+            share one in-flight HTTP call. Each caller still receives its own
+            copy of the result.
+        :type coalesce_reads: bool
+        :param auto_batch: If set to True, single-document reads, inserts,
+            updates, replacements and deletes issued concurrently on the same
+            collection are merged into bulk requests. Each caller still
+            receives its own result or exception.
+        :type auto_batch: bool
+        :param auto_batch_window: Max number of seconds an operation waits to
+            be batched with others. Applies only when **auto_batch** is set.
+        :type auto_batch_window: float
+        :param auto_batch_size: Max number of operations per bulk request.
+            Applies only when **auto_batch** is set.
+        :type auto_batch_size: int
         :return: Standard database API wrapper.
         :rtype: aioarango.database.StandardDatabase
         :raise aioarango.exceptions.ServerConnectionError: If **verify** was set
@@ -140,6 +171,7 @@ class ArangoClient:
                 serializer=self._serializer,
                 deserializer=self._deserializer,
                 superuser_token=superuser_token,
+                tracer=self._tracer,
             )
         elif auth_method.lower() == "basic":
             connection = BasicConnection(
@@ -152,6 +184,7 @@ class ArangoClient:
                 http_client=self._http,
                 serializer=self._serializer,
                 deserializer=self._deserializer,
+                tracer=self._tracer,
             )
         elif auth_method.lower() == "jwt":
             connection = JwtConnection(
@@ -164,6 +197,7 @@ class ArangoClient:
                 http_client=self._http,
                 serializer=self._serializer,
                 deserializer=self._deserializer,
+                tracer=self._tracer,
             )
             await connection.refresh_token()
         else:
@@ -177,4 +211,11 @@ class ArangoClient:
             except Exception as err:
                 raise ServerConnectionError(f"bad connection: {err}")
 
-        return StandardDatabase(connection)
+        self._connections.add(connection)
+        return StandardDatabase(
+            connection,
+            coalesce_reads,
+            auto_batch,
+            auto_batch_window,
+            auto_batch_size,
+        )
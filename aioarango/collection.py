@@ -1,9 +1,24 @@
+import asyncio
+import warnings
+from json import dumps
 from numbers import Number
-from typing import List, Optional, Sequence, Tuple, Union
+from random import randrange
+from typing import (
+    AsyncIterator,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from aioarango.api import ApiGroup
+from aioarango.aql import AQL
+from aioarango.cache import DocumentCache
 from aioarango.connection import Connection
-from aioarango.cursor import Cursor
+from aioarango.cursor import Cursor, merge_cursors
 from aioarango.exceptions import (
     ArangoServerError,
     CollectionChecksumError,
@@ -41,12 +56,16 @@ from aioarango.formatter import (
     format_index,
     format_vertex,
 )
+from aioarango.pagination import Page, decode_token, encode_token
 from aioarango.request import Request
 from aioarango.response import Response
 from aioarango.result import Result
+from aioarango.tracing import Span
 from aioarango.typings import Fields, Headers, Json, Params
 from aioarango.utils import get_doc_id, is_none_or_int, is_none_or_str
 
+T = TypeVar("T")
+
 
 class Collection(ApiGroup):
     """Base class for collection API wrappers.
@@ -83,6 +102,10 @@ class Collection(ApiGroup):
     # def __contains__(self, document: Union[str, Json]) -> Result[bool]:
     #     return self.has(document, check_rev=False)
 
+    def _trace_request(self, span: Span, request: Request) -> None:
+        super()._trace_request(span, request)
+        span.set_attribute("db.collection", self._name)
+
     def _get_status_text(self, code: int) -> str:  # pragma: no cover
         """Return the collection status text.
 
@@ -204,6 +227,124 @@ class Collection(ApiGroup):
             body["_key"] = doc_id[len(self._id_prefix) :]
         return body
 
+    def _field_path(self, field: str, prefix: str, bind_vars: Json) -> str:
+        """Return the AQL attribute access of a field of variable "doc".
+
+        :param field: Field name. Names with dots refer to sub-attributes.
+        :type field: str
+        :param prefix: Prefix of the bind parameters holding the names.
+        :type prefix: str
+        :param bind_vars: Bind parameters, updated in place.
+        :type bind_vars: dict
+        :return: Attribute access (e.g. "doc.@f0_0.@f0_1").
+        :rtype: str
+        """
+        path = "doc"
+        for depth, name in enumerate(field.split(".")):
+            bind_vars[f"{prefix}_{depth}"] = name
+            path += f".@{prefix}_{depth}"
+        return path
+
+    def _match_clauses(
+        self,
+        filters: Json,
+        bind_vars: Json,
+        skip: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> str:
+        """Return AQL FILTER and LIMIT clauses for matching documents.
+
+        Each filter compares one attribute of variable "doc" for equality, so
+        that indexes on the filtered fields can be used. Field names with dots
+        refer to sub-attributes (e.g. "address.city"). A limit of None means
+        no limit.
+
+        :param filters: Document filters.
+        :type filters: dict
+        :param bind_vars: Bind parameters, updated in place.
+        :type bind_vars: dict
+        :param skip: Number of documents to skip.
+        :type skip: int | None
+        :param limit: Max number of documents matched.
+        :type limit: int | None
+        :return: AQL clauses.
+        :rtype: str
+        """
+        conditions = []
+        for index, (field, value) in enumerate(filters.items()):
+            path = self._field_path(field, f"f{index}", bind_vars)
+            bind_vars[f"v{index}"] = value
+            conditions.append(f"{path} == @v{index}")
+
+        clauses = ""
+        if conditions:
+            clauses += "FILTER " + " && ".join(conditions) + "\n"
+        if skip or limit is not None:
+            bind_vars["skip"] = skip or 0
+            bind_vars["limit"] = 2147483647 if limit is None else limit  # 2 ^ 31 - 1
+            clauses += "LIMIT @skip, @limit\n"
+        return clauses
+
+    def _projection(self, fields: Optional[Sequence[str]], bind_vars: Json) -> str:
+        """Return the AQL expression returned for variable "doc".
+
+        :param fields: Document fields returned, or None for whole documents.
+            Names with dots refer to sub-attributes and are kept as keys.
+        :type fields: [str] | None
+        :param bind_vars: Bind parameters, updated in place.
+        :type bind_vars: dict
+        :return: AQL expression (e.g. "{[@p0]: doc.@p0_0}").
+        :rtype: str
+        """
+        if fields is None:
+            return "doc"
+        attributes = []
+        for index, field in enumerate(fields):
+            path = self._field_path(field, f"p{index}", bind_vars)
+            bind_vars[f"p{index}"] = field
+            attributes.append(f"[@p{index}]: {path}")
+        return "{" + ", ".join(attributes) + "}"
+
+    def _query_request(
+        self,
+        query: str,
+        bind_vars: Json,
+        batch_size: Optional[int] = None,
+        stream: bool = False,
+        write: bool = False,
+    ) -> Request:
+        """Return a request running an AQL query on the collection.
+
+        :param query: AQL query.
+        :type query: str
+        :param bind_vars: Bind parameters.
+        :type bind_vars: dict
+        :param batch_size: Max number of results in one batch.
+        :type batch_size: int | None
+        :param stream: Run the query lazily, producing results only as the
+            cursor is read instead of materializing all of them on the server.
+            Otherwise, the cursor includes the result count.
+        :type stream: bool
+        :param write: Whether the query modifies the collection.
+        :type write: bool
+        :return: Cursor request.
+        :rtype: aioarango.request.Request
+        """
+        data: Json = {"query": query, "bindVars": bind_vars}
+        if batch_size is not None:
+            data["batchSize"] = batch_size
+        if stream:
+            data["options"] = {"stream": True}
+        else:
+            data["count"] = True
+        return Request(
+            method="post",
+            endpoint="/_api/cursor",
+            data=data,
+            read=None if write else self.name,
+            write=self.name if write else None,
+        )
+
     @property
     def name(self) -> str:
         """Return collection name.
@@ -213,6 +354,112 @@ class Collection(ApiGroup):
         """
         return self._name
 
+    @property
+    def cache(self) -> Optional[DocumentCache]:
+        """Return the document cache of the collection.
+
+        :return: Document cache, or None if it is not enabled.
+        :rtype: aioarango.cache.DocumentCache | None
+        """
+        return self._conn.document_caches.get(self._name)
+
+    def enable_cache(
+        self,
+        max_size: int = 1000,
+        ttl: Optional[float] = 60.0,
+        max_bytes: Optional[int] = None,
+    ) -> DocumentCache:
+        """Start caching documents retrieved by ID or key.
+
+        The cache is shared by all API wrappers of this collection using the
+        same database connection, and is used only outside of async execution,
+        batch execution and transactions. Documents are invalidated when they
+        are modified through this client. Calling this method again replaces
+        the existing cache.
+
+        :param max_size: Max number of cached documents.
+        :type max_size: int
+        :param ttl: Number of seconds a document is returned without asking
+            the server. Expired documents are revalidated using their revision,
+            so unchanged documents are not transferred again. If set to None,
+            documents are only refreshed when modified through this client.
+        :type ttl: float | None
+        :param max_bytes: Max total size of cached documents in bytes.
+        :type max_bytes: int | None
+        :return: Document cache.
+        :rtype: aioarango.cache.DocumentCache
+        """
+        cache = DocumentCache(max_size, ttl, max_bytes)
+        self._conn.document_caches[self._name] = cache
+        return cache
+
+    def disable_cache(self) -> None:
+        """Stop caching documents and discard the document cache."""
+        self._conn.document_caches.pop(self._name, None)
+
+    def _uncache(self, documents: Optional[Sequence[Union[str, Json]]] = None) -> None:
+        """Invalidate cached documents and query results of the collection.
+
+        :param documents: Document IDs, keys or bodies. If not set, the whole
+            document cache of the collection is invalidated.
+        :type documents: [str | dict] | None
+        """
+        if self._conn.result_cache is not None:
+            self._conn.result_cache.invalidate([self._name])
+
+        cache = self._conn.document_caches.get(self._name)
+        if cache is None:
+            return
+        if documents is None:
+            cache.invalidate()
+            return
+
+        doc_ids = []
+        for document in documents:
+            if isinstance(document, dict):
+                doc_id = document.get("_id")
+                if doc_id is None and "_key" in document:
+                    doc_id = self._id_prefix + document["_key"]
+            elif isinstance(document, str) and "/" not in document:
+                doc_id = self._id_prefix + document
+            else:
+                doc_id = document
+            if isinstance(doc_id, str):
+                doc_ids.append(doc_id)
+        cache.invalidate(doc_ids)
+
+    def _uncaching(
+        self,
+        response_handler: Callable[[Response], T],
+        documents: Optional[Sequence[Union[str, Json]]] = None,
+    ) -> Callable[[Response], T]:
+        """Invalidate cached data modified by a write request.
+
+        Documents and query results are invalidated when the request is sent,
+        and again once its response arrives, so that reads which overlapped
+        with the write are not cached.
+
+        :param response_handler: Response handler of the write request.
+        :type response_handler: callable
+        :param documents: Document IDs, keys or bodies. If not set, the whole
+            document cache of the collection is invalidated.
+        :type documents: [str | dict] | None
+        :return: Response handler.
+        :rtype: callable
+        """
+        if (
+            self._name not in self._conn.document_caches
+            and self._conn.result_cache is None
+        ):
+            return response_handler
+        self._uncache(documents)
+
+        def uncaching_response_handler(resp: Response) -> T:
+            self._uncache(documents)
+            return response_handler(resp)
+
+        return uncaching_response_handler
+
     async def recalculate_count(self) -> Result[bool]:
         """Recalculate the document count.
 
@@ -275,8 +522,14 @@ class Collection(ApiGroup):
         )
 
         def response_handler(resp: Response) -> bool:
+            self._invalidate_metadata(
+                "/_api/collection",
+                f"/_api/collection/{self.name}/properties",
+                f"/_api/index?collection={self.name}",
+            )
             if not resp.is_success:
                 raise CollectionRenameError(resp, request)
+            self._conn.document_caches.pop(self._name, None)
             self._name = new_name
             self._id_prefix = new_name + "/"
             return True
@@ -301,7 +554,7 @@ class Collection(ApiGroup):
                 return format_collection(resp.body)
             raise CollectionPropertiesError(resp, request)
 
-        return await self._execute(request, response_handler)
+        return await self._execute_metadata(request, response_handler)
 
     async def configure(
         self, sync: Optional[bool] = None, schema: Optional[Json] = None
@@ -329,6 +582,7 @@ class Collection(ApiGroup):
         )
 
         def response_handler(resp: Response) -> Json:
+            self._invalidate_metadata(f"/_api/collection/{self.name}/properties")
             if not resp.is_success:
                 raise CollectionConfigureError(resp, request)
             return format_collection(resp.body)
@@ -429,6 +683,10 @@ class Collection(ApiGroup):
         request = Request(method="put", endpoint=f"/_api/collection/{self.name}/load")
 
         def response_handler(resp: Response) -> bool:
+            self._invalidate_metadata(
+                "/_api/collection",
+                f"/_api/collection/{self.name}/properties",
+            )
             if not resp.is_success:
                 raise CollectionLoadError(resp, request)
             return True
@@ -445,6 +703,10 @@ class Collection(ApiGroup):
         request = Request(method="put", endpoint=f"/_api/collection/{self.name}/unload")
 
         def response_handler(resp: Response) -> bool:
+            self._invalidate_metadata(
+                "/_api/collection",
+                f"/_api/collection/{self.name}/properties",
+            )
             if not resp.is_success:
                 raise CollectionUnloadError(resp, request)
             return True
@@ -467,7 +729,7 @@ class Collection(ApiGroup):
                 raise CollectionTruncateError(resp, request)
             return True
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler))
 
     async def count(self) -> Result[int]:
         """Return the total document count.
@@ -528,18 +790,27 @@ class Collection(ApiGroup):
 
         return await self._execute(request, response_handler)
 
-    async def ids(self) -> Result[Cursor]:
+    async def ids(
+        self, batch_size: Optional[int] = None, stream: bool = False
+    ) -> Result[Cursor]:
         """Return the IDs of all documents in the collection.
 
+        :param batch_size: Max number of IDs in the batch fetched by the
+            cursor in one round trip.
+        :type batch_size: int | None
+        :param stream: Produce the results lazily as the cursor is read instead
+            of materializing them on the server. The cursor count is then not
+            available.
+        :type stream: bool
         :return: Document ID cursor.
         :rtype: aioarango.cursor.Cursor
         :raise aioarango.exceptions.DocumentIDsError: If retrieval fails.
         """
-        request = Request(
-            method="put",
-            endpoint="/_api/simple/all-keys",
-            data={"collection": self.name, "type": "id"},
-            read=self.name,
+        request = self._query_request(
+            "FOR doc IN @@collection RETURN doc._id",
+            {"@collection": self.name},
+            batch_size,
+            stream,
         )
 
         def response_handler(resp: Response) -> Cursor:
@@ -549,18 +820,27 @@ class Collection(ApiGroup):
 
         return await self._execute(request, response_handler)
 
-    async def keys(self) -> Result[Cursor]:
+    async def keys(
+        self, batch_size: Optional[int] = None, stream: bool = False
+    ) -> Result[Cursor]:
         """Return the keys of all documents in the collection.
 
+        :param batch_size: Max number of keys in the batch fetched by the
+            cursor in one round trip.
+        :type batch_size: int | None
+        :param stream: Produce the results lazily as the cursor is read instead
+            of materializing them on the server. The cursor count is then not
+            available.
+        :type stream: bool
         :return: Document key cursor.
         :rtype: aioarango.cursor.Cursor
         :raise aioarango.exceptions.DocumentKeysError: If retrieval fails.
         """
-        request = Request(
-            method="put",
-            endpoint="/_api/simple/all-keys",
-            data={"collection": self.name, "type": "key"},
-            read=self.name,
+        request = self._query_request(
+            "FOR doc IN @@collection RETURN doc._key",
+            {"@collection": self.name},
+            batch_size,
+            stream,
         )
 
         def response_handler(resp: Response) -> Cursor:
@@ -571,7 +851,13 @@ class Collection(ApiGroup):
         return await self._execute(request, response_handler)
 
     async def all(
-        self, skip: Optional[int] = None, limit: Optional[int] = None
+        self,
+        skip: Optional[int] = None,
+        limit: Optional[int] = None,
+        prefetch: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        stream: bool = False,
     ) -> Result[Cursor]:
         """Return all documents in the collection.
 
@@ -579,6 +865,18 @@ class Collection(ApiGroup):
         :type skip: int | None
         :param limit: Max number of documents returned.
         :type limit: int | None
+        :param prefetch: Max number of batches fetched ahead in the background.
+        :type prefetch: int | None
+        :param batch_size: Max number of documents in the batch fetched by
+            the cursor in one round trip.
+        :type batch_size: int | None
+        :param fields: Document fields returned. If not set, whole documents
+            are returned. Names with dots refer to sub-attributes.
+        :type fields: [str] | None
+        :param stream: Produce the results lazily as the cursor is read instead
+            of materializing them on the server. The cursor count is then not
+            available.
+        :type stream: bool
         :return: Document cursor.
         :rtype: aioarango.cursor.Cursor
         :raise aioarango.exceptions.DocumentGetError: If retrieval fails.
@@ -586,20 +884,16 @@ class Collection(ApiGroup):
         assert is_none_or_int(skip), "skip must be a non-negative int"
         assert is_none_or_int(limit), "limit must be a non-negative int"
 
-        data: Json = {"collection": self.name}
-        if skip is not None:
-            data["skip"] = skip
-        if limit is not None:
-            data["limit"] = limit
-
-        request = Request(
-            method="put", endpoint="/_api/simple/all", data=data, read=self.name
-        )
+        bind_vars: Json = {"@collection": self.name}
+        clauses = self._match_clauses({}, bind_vars, skip, limit)
+        projection = self._projection(fields, bind_vars)
+        query = f"FOR doc IN @@collection\n{clauses}RETURN {projection}"
+        request = self._query_request(query, bind_vars, batch_size, stream)
 
         def response_handler(resp: Response) -> Cursor:
             if not resp.is_success:
                 raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
+            return Cursor(self._conn, resp.body, prefetch=prefetch)
 
         return await self._execute(request, response_handler)
 
@@ -613,6 +907,8 @@ class Collection(ApiGroup):
         ttl: Optional[Number] = None,
         filter_fields: Optional[Sequence[str]] = None,
         filter_type: str = "include",
+        prefetch: Optional[int] = None,
+        keep_alive: bool = False,
     ) -> Result[Cursor]:
         """Export all documents in the collection using a server cursor.
 
@@ -635,6 +931,11 @@ class Collection(ApiGroup):
         :type filter_fields: [str] | None
         :param filter_type: Allowed values are "include" or "exclude".
         :type filter_type: str
+        :param prefetch: Max number of batches fetched ahead in the background.
+        :type prefetch: int | None
+        :param keep_alive: Keep the cursor alive on the server while results
+            are consumed slower than its **ttl** (30 seconds by default).
+        :type keep_alive: bool
         :return: Document cursor.
         :rtype: aioarango.cursor.Cursor
         :raise aioarango.exceptions.DocumentGetError: If export fails.
@@ -660,21 +961,178 @@ class Collection(ApiGroup):
         def response_handler(resp: Response) -> Cursor:
             if not resp.is_success:
                 raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body, "export")
+            return Cursor(
+                self._conn,
+                resp.body,
+                "export",
+                prefetch=prefetch,
+                keep_alive=(30 if ttl is None else ttl) if keep_alive else None,
+            )
 
         return await self._execute(request, response_handler)
 
+    async def _key_bounds(self, partitions: int) -> List[str]:
+        """Return document keys splitting the collection into even ranges.
+
+        :param partitions: Number of ranges.
+        :type partitions: int
+        :return: Sorted distinct range boundaries (at most partitions - 1).
+        :rtype: [str]
+        """
+        total = await self.count()
+        aql = AQL(self._conn, self._executor)
+        query = "FOR doc IN @@col SORT doc._key LIMIT @offset, 1 RETURN doc._key"
+        offsets = sorted({total * i // partitions for i in range(1, partitions)})
+        cursors = await asyncio.gather(
+            *(
+                aql.execute(query, bind_vars={"@col": self.name, "offset": offset})
+                for offset in offsets
+                if 0 < offset < total
+            )
+        )
+        keys = {key for cursor in cursors for key in cursor.batch()}
+        return sorted(keys)
+
+    async def scan_partitions(
+        self,
+        partitions: int = 4,
+        batch_size: Optional[int] = None,
+        ttl: Optional[Number] = None,
+        prefetch: Optional[int] = None,
+    ) -> List[Cursor]:
+        """Open streaming cursors over disjoint partitions of the collection.
+
+        Sharded collections are partitioned by shard (the shards are spread
+        over the partitions). Other collections are partitioned into ranges
+        of document keys with similar document counts, sampled from the data.
+        Together, the cursors return every document exactly once. If a
+        partition query fails, the cursors opened for the other partitions
+        are closed. Available only in the default execution context.
+
+        :param partitions: Max number of partitions.
+        :type partitions: int
+        :param batch_size: Max number of documents per batch.
+        :type batch_size: int | None
+        :param ttl: Time-to-live for the cursors on the server.
+        :type ttl: int | float | None
+        :param prefetch: Max number of batches fetched ahead per cursor.
+        :type prefetch: int | None
+        :return: Cursors, one per partition.
+        :rtype: [aioarango.cursor.Cursor]
+        :raise aioarango.exceptions.AQLQueryExecuteError: If a query fails.
+        """
+        assert partitions > 0, "partitions must be a positive int"
+        assert self.context == "default", "only available in default execution context"
+        aql = AQL(self._conn, self._executor)
+        options: Json = {"batch_size": batch_size, "ttl": ttl, "prefetch": prefetch}
+        scan = "FOR doc IN @@col RETURN doc"
+        col = {"@col": self.name}
+
+        shards = list((await self.properties()).get("shards") or [])
+        if len(shards) > 1:
+            count = min(partitions, len(shards))
+            executions = [
+                aql.execute(
+                    scan,
+                    bind_vars=col,
+                    stream=True,
+                    shard_ids=shards[index::count],
+                    **options,
+                )
+                for index in range(count)
+            ]
+        else:
+            bounds: List[Optional[str]] = [None]
+            bounds.extend(await self._key_bounds(partitions))
+            bounds.append(None)
+            executions = []
+            for low, high in zip(bounds, bounds[1:]):
+                filters = []
+                bind_vars = dict(col)
+                if low is not None:
+                    filters.append("doc._key >= @low")
+                    bind_vars["low"] = low
+                if high is not None:
+                    filters.append("doc._key < @high")
+                    bind_vars["high"] = high
+                query = scan
+                if filters:
+                    condition = " AND ".join(filters)
+                    query = f"FOR doc IN @@col FILTER {condition} RETURN doc"
+                executions.append(
+                    aql.execute(query, bind_vars=bind_vars, stream=True, **options)
+                )
+
+        results = await asyncio.gather(*executions, return_exceptions=True)
+        cursors = [result for result in results if isinstance(result, Cursor)]
+        for result in results:
+            if isinstance(result, BaseException):
+                await asyncio.gather(
+                    *(cursor.close(ignore_missing=True) for cursor in cursors),
+                    return_exceptions=True,
+                )
+                raise result
+        return cursors
+
+    async def scan_parallel(
+        self,
+        partitions: int = 4,
+        batch_size: Optional[int] = None,
+        ttl: Optional[Number] = None,
+        prefetch: Optional[int] = None,
+    ) -> AsyncIterator[Json]:
+        """Return all documents in the collection using concurrent cursors.
+
+        The collection is split as described in
+        :func:`aioarango.collection.Collection.scan_partitions`, the partition
+        cursors are read concurrently and their documents are merged into one
+        stream, in no particular order. All cursors are closed when the
+        iteration ends. Available only in the default execution context.
+
+        :param partitions: Max number of partitions.
+        :type partitions: int
+        :param batch_size: Max number of documents per batch.
+        :type batch_size: int | None
+        :param ttl: Time-to-live for the cursors on the server.
+        :type ttl: int | float | None
+        :param prefetch: Max number of batches fetched ahead per cursor.
+        :type prefetch: int | None
+        :return: Async iterator of documents.
+        :rtype: typing.AsyncIterator[dict]
+        :raise aioarango.exceptions.AQLQueryExecuteError: If a query fails.
+        :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
+        """
+        cursors = await self.scan_partitions(partitions, batch_size, ttl, prefetch)
+        return merge_cursors(cursors)
+
     async def find(
-        self, filters: Json, skip: Optional[int] = None, limit: Optional[int] = None
+        self,
+        filters: Json,
+        skip: Optional[int] = None,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        stream: bool = False,
     ) -> Result[Cursor]:
         """Return all documents that match the given filters.
 
-        :param filters: Document filters.
+        :param filters: Document filters. Field names with dots refer to
+            sub-attributes (e.g. "address.city").
         :type filters: dict
         :param skip: Number of documents to skip.
         :type skip: int | None
         :param limit: Max number of documents returned.
         :type limit: int | None
+        :param batch_size: Max number of documents in the batch fetched by
+            the cursor in one round trip.
+        :type batch_size: int | None
+        :param fields: Document fields returned. If not set, whole documents
+            are returned. Names with dots refer to sub-attributes.
+        :type fields: [str] | None
+        :param stream: Produce the results lazily as the cursor is read instead
+            of materializing them on the server. The cursor count is then not
+            available.
+        :type stream: bool
         :return: Document cursor.
         :rtype: aioarango.cursor.Cursor
         :raise aioarango.exceptions.DocumentGetError: If retrieval fails.
@@ -683,17 +1141,11 @@ class Collection(ApiGroup):
         assert is_none_or_int(skip), "skip must be a non-negative int"
         assert is_none_or_int(limit), "limit must be a non-negative int"
 
-        data: Json = {
-            "collection": self.name,
-            "example": filters,
-            "skip": skip,
-        }
-        if limit is not None:
-            data["limit"] = limit
-
-        request = Request(
-            method="put", endpoint="/_api/simple/by-example", data=data, read=self.name
-        )
+        bind_vars: Json = {"@collection": self.name}
+        clauses = self._match_clauses(filters, bind_vars, skip, limit)
+        projection = self._projection(fields, bind_vars)
+        query = f"FOR doc IN @@collection\n{clauses}RETURN {projection}"
+        request = self._query_request(query, bind_vars, batch_size, stream)
 
         def response_handler(resp: Response) -> Cursor:
             if not resp.is_success:
@@ -702,8 +1154,110 @@ class Collection(ApiGroup):
 
         return await self._execute(request, response_handler)
 
+    async def paginate(
+        self,
+        page_size: int = 100,
+        token: Optional[str] = None,
+        sort_field: str = "_key",
+        filters: Optional[Json] = None,
+        backward: bool = False,
+    ) -> Result[Page]:
+        """Return one page of documents using keyset pagination.
+
+        Instead of skipping the documents of the preceding pages, each page
+        continues after the sort field value and key of the last document
+        read, so every page costs the same regardless of its position. Use
+        the tokens of a page to read the following or preceding page.
+
+        Documents are sorted by **sort_field** and then by key. Sorting by
+        "_key" uses the primary index. For other fields, define a persistent
+        index on the filtered fields followed by **sort_field** and "_key".
+
+        :param page_size: Max number of documents in the page.
+        :type page_size: int
+        :param token: Continuation token of the page before or after, as
+            returned in :attr:`aioarango.pagination.Page.next_token` or
+            :attr:`aioarango.pagination.Page.previous_token`. If not set, the
+            first page is returned.
+        :type token: str | None
+        :param sort_field: Document field to sort by. Names with dots refer to
+            sub-attributes. Tokens are valid only with the same sort field.
+        :type sort_field: str
+        :param filters: Document filters, as in
+            :func:`aioarango.collection.Collection.find`.
+        :type filters: dict | None
+        :param backward: Return the last page instead of the first one. This
+            parameter is ignored if **token** is set.
+        :type backward: bool
+        :return: Page of documents in sort order.
+        :rtype: aioarango.pagination.Page
+        :raise ValueError: If the token is invalid.
+        :raise aioarango.exceptions.DocumentGetError: If retrieval fails.
+        """
+        assert isinstance(page_size, int), "page_size must be an int"
+        assert page_size > 0, "page_size must be a positive int"
+        assert filters is None or isinstance(filters, dict), "filters must be a dict"
+
+        bind_vars: Json = {"@collection": self.name, "size": page_size + 1}
+        clauses = self._match_clauses(filters or {}, bind_vars)
+        if sort_field == "_key":
+            path = "doc._key"
+        else:
+            path = self._field_path(sort_field, "sort", bind_vars)
+
+        first = token is None
+        if token is not None:
+            value, bind_vars["key"], backward = decode_token(token, sort_field)
+            op = "<" if backward else ">"
+            if sort_field == "_key":
+                clauses += f"FILTER doc._key {op} @key\n"
+            else:
+                # The range on the sort field uses the index, while the key
+                # only breaks ties between documents with the same value.
+                bind_vars["value"] = value
+                tie = f"{path} {op} @value || doc._key {op} @key"
+                clauses += f"FILTER {path} {op}= @value && ({tie})\n"
+
+        order = "DESC" if backward else "ASC"
+        sort = f"{path} {order}"
+        if sort_field != "_key":
+            sort += f", doc._key {order}"
+        query = (
+            f"FOR doc IN @@collection\n{clauses}SORT {sort}\nLIMIT @size\nRETURN doc"
+        )
+        request = self._query_request(query, bind_vars, page_size + 1)
+
+        def response_handler(resp: Response) -> Page:
+            if not resp.is_success:
+                raise DocumentGetError(resp, request)
+            documents: List[Json] = resp.body["result"]
+            more = len(documents) > page_size
+            del documents[page_size:]
+            if not documents:
+                return Page(documents)
+            if backward:
+                documents.reverse()
+
+            # Going forward, a next page exists if more documents were found,
+            # and a previous one if the page did not start at the beginning.
+            next_token: Optional[str] = None
+            previous_token: Optional[str] = None
+            if (not first) if backward else more:
+                next_token = encode_token(sort_field, documents[-1], backward=False)
+            if more if backward else not first:
+                previous_token = encode_token(sort_field, documents[0], backward=True)
+            return Page(documents, next_token, previous_token)
+
+        return await self._execute(request, response_handler)
+
     async def find_near(
-        self, latitude: Number, longitude: Number, limit: Optional[int] = None
+        self,
+        latitude: Number,
+        longitude: Number,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        stream: bool = False,
     ) -> Result[Cursor]:
         """Return documents near a given coordinate.
 
@@ -718,6 +1272,16 @@ class Collection(ApiGroup):
         :type longitude: int | float
         :param limit: Max number of documents returned.
         :type limit: int | None
+        :param batch_size: Max number of documents in the batch fetched by
+            the cursor in one round trip.
+        :type batch_size: int | None
+        :param fields: Document fields returned. If not set, whole documents
+            are returned. Names with dots refer to sub-attributes.
+        :type fields: [str] | None
+        :param stream: Produce the results lazily as the cursor is read instead
+            of materializing them on the server. The cursor count is then not
+            available.
+        :type stream: bool
         :returns: Document cursor.
         :rtype: aioarango.cursor.Cursor
         :raises aioarango.exceptions.DocumentGetError: If retrieval fails.
@@ -726,14 +1290,7 @@ class Collection(ApiGroup):
         assert isinstance(longitude, Number), "longitude must be a number"
         assert is_none_or_int(limit), "limit must be a non-negative int"
 
-        query = """
-        FOR doc IN NEAR(@collection, @latitude, @longitude{})
-            RETURN doc
-        """.format(
-            "" if limit is None else ", @limit "
-        )
-
-        bind_vars = {
+        bind_vars: Json = {
             "collection": self._name,
             "latitude": latitude,
             "longitude": longitude,
@@ -741,12 +1298,13 @@ class Collection(ApiGroup):
         if limit is not None:
             bind_vars["limit"] = limit
 
-        request = Request(
-            method="post",
-            endpoint="/_api/cursor",
-            data={"query": query, "bindVars": bind_vars, "count": True},
-            read=self.name,
+        query = """
+        FOR doc IN NEAR(@collection, @latitude, @longitude{})
+            RETURN {}
+        """.format(
+            "" if limit is None else ", @limit ", self._projection(fields, bind_vars)
         )
+        request = self._query_request(query, bind_vars, batch_size, stream)
 
         def response_handler(resp: Response) -> Cursor:
             if not resp.is_success:
@@ -762,6 +1320,9 @@ class Collection(ApiGroup):
         upper: int,
         skip: Optional[int] = None,
         limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        stream: bool = False,
     ) -> Result[Cursor]:
         """Return documents within a given range in a random order.
 
@@ -777,6 +1338,16 @@ class Collection(ApiGroup):
         :type skip: int | None
         :param limit: Max number of documents returned.
         :type limit: int | None
+        :param batch_size: Max number of documents in the batch fetched by
+            the cursor in one round trip.
+        :type batch_size: int | None
+        :param fields: Document fields returned. If not set, whole documents
+            are returned. Names with dots refer to sub-attributes.
+        :type fields: [str] | None
+        :param stream: Produce the results lazily as the cursor is read instead
+            of materializing them on the server. The cursor count is then not
+            available.
+        :type stream: bool
         :returns: Document cursor.
         :rtype: aioarango.cursor.Cursor
         :raises aioarango.exceptions.DocumentGetError: If retrieval fails.
@@ -784,7 +1355,7 @@ class Collection(ApiGroup):
         assert is_none_or_int(skip), "skip must be a non-negative int"
         assert is_none_or_int(limit), "limit must be a non-negative int"
 
-        bind_vars = {
+        bind_vars: Json = {
             "@collection": self._name,
             "field": field,
             "lower": lower,
@@ -797,15 +1368,11 @@ class Collection(ApiGroup):
         FOR doc IN @@collection
             FILTER doc.@field >= @lower && doc.@field < @upper
             LIMIT @skip, @limit
-            RETURN doc
-        """
-
-        request = Request(
-            method="post",
-            endpoint="/_api/cursor",
-            data={"query": query, "bindVars": bind_vars, "count": True},
-            read=self.name,
+            RETURN {}
+        """.format(
+            self._projection(fields, bind_vars)
         )
+        request = self._query_request(query, bind_vars, batch_size, stream)
 
         def response_handler(resp: Response) -> Cursor:
             if not resp.is_success:
@@ -820,6 +1387,9 @@ class Collection(ApiGroup):
         longitude: Number,
         radius: Number,
         distance_field: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        stream: bool = False,
     ) -> Result[Cursor]:
         """Return documents within a given radius around a coordinate.
 
@@ -834,6 +1404,16 @@ class Collection(ApiGroup):
         :param distance_field: Document field used to indicate the distance to
             the given coordinate. This parameter is ignored in transactions.
         :type distance_field: str
+        :param batch_size: Max number of documents in the batch fetched by
+            the cursor in one round trip.
+        :type batch_size: int | None
+        :param fields: Document fields returned. If not set, whole documents
+            are returned. Names with dots refer to sub-attributes.
+        :type fields: [str] | None
+        :param stream: Produce the results lazily as the cursor is read instead
+            of materializing them on the server. The cursor count is then not
+            available.
+        :type stream: bool
         :returns: Document cursor.
         :rtype: aioarango.cursor.Cursor
         :raises aioarango.exceptions.DocumentGetError: If retrieval fails.
@@ -843,14 +1423,7 @@ class Collection(ApiGroup):
         assert isinstance(radius, Number), "radius must be a number"
         assert is_none_or_str(distance_field), "distance_field must be a str"
 
-        query = """
-        FOR doc IN WITHIN(@@collection, @latitude, @longitude, @radius{})
-            RETURN doc
-        """.format(
-            "" if distance_field is None else ", @distance"
-        )
-
-        bind_vars = {
+        bind_vars: Json = {
             "@collection": self._name,
             "latitude": latitude,
             "longitude": longitude,
@@ -859,12 +1432,14 @@ class Collection(ApiGroup):
         if distance_field is not None:
             bind_vars["distance"] = distance_field
 
-        request = Request(
-            method="post",
-            endpoint="/_api/cursor",
-            data={"query": query, "bindVars": bind_vars, "count": True},
-            read=self.name,
+        query = """
+        FOR doc IN WITHIN(@@collection, @latitude, @longitude, @radius{})
+            RETURN {}
+        """.format(
+            "" if distance_field is None else ", @distance",
+            self._projection(fields, bind_vars),
         )
+        request = self._query_request(query, bind_vars, batch_size, stream)
 
         def response_handler(resp: Response) -> Cursor:
             if not resp.is_success:
@@ -882,9 +1457,14 @@ class Collection(ApiGroup):
         skip: Optional[int] = None,
         limit: Optional[int] = None,
         index: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        stream: bool = False,
     ) -> Result[Cursor]:
         """Return all documents in an rectangular area.
 
+        A geo index must be defined in the collection to use this method.
+
         :param latitude1: First latitude.
         :type latitude1: int | float
         :param longitude1: First longitude.
@@ -895,11 +1475,23 @@ class Collection(ApiGroup):
         :type longitude2: int | float
         :param skip: Number of documents to skip.
         :type skip: int | None
-        :param limit: Max number of documents returned.
+        :param limit: Max number of documents returned. A limit of 0 means no
+            limit.
         :type limit: int | None
-        :param index: ID of the geo index to use (without the collection
-            prefix). This parameter is ignored in transactions.
+        :param index: Deprecated and ignored: the query uses the geo index of
+            the collection chosen by the optimizer. A DeprecationWarning is
+            issued if set.
         :type index: str | None
+        :param batch_size: Max number of documents in the batch fetched by
+            the cursor in one round trip.
+        :type batch_size: int | None
+        :param fields: Document fields returned. If not set, whole documents
+            are returned. Names with dots refer to sub-attributes.
+        :type fields: [str] | None
+        :param stream: Produce the results lazily as the cursor is read instead
+            of materializing them on the server. The cursor count is then not
+            available.
+        :type stream: bool
         :returns: Document cursor.
         :rtype: aioarango.cursor.Cursor
         :raises aioarango.exceptions.DocumentGetError: If retrieval fails.
@@ -911,26 +1503,29 @@ class Collection(ApiGroup):
         assert is_none_or_int(skip), "skip must be a non-negative int"
         assert is_none_or_int(limit), "limit must be a non-negative int"
 
-        data: Json = {
+        bind_vars: Json = {
             "collection": self._name,
             "latitude1": latitude1,
             "longitude1": longitude1,
             "latitude2": latitude2,
             "longitude2": longitude2,
         }
-        if skip is not None:
-            data["skip"] = skip
-        if limit is not None:
-            data["limit"] = limit
         if index is not None:
-            data["geo"] = self._name + "/" + index
-
-        request = Request(
-            method="put",
-            endpoint="/_api/simple/within-rectangle",
-            data=data,
-            read=self.name,
+            warnings.warn(
+                "the index parameter of find_in_box is ignored",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
+        clauses = self._match_clauses({}, bind_vars, skip, limit or None)
+        projection = self._projection(fields, bind_vars)
+        query = f"""
+        FOR doc IN WITHIN_RECTANGLE(
+            @collection, @latitude1, @longitude1, @latitude2, @longitude2
         )
+        {clauses}RETURN {projection}
+        """
+        request = self._query_request(query, bind_vars, batch_size, stream)
 
         def response_handler(resp: Response) -> Cursor:
             if not resp.is_success:
@@ -940,7 +1535,13 @@ class Collection(ApiGroup):
         return await self._execute(request, response_handler)
 
     async def find_by_text(
-        self, field: str, query: str, limit: Optional[int] = None
+        self,
+        field: str,
+        query: str,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        stream: bool = False,
     ) -> Result[Cursor]:
         """Return documents that match the given fulltext query.
 
@@ -950,6 +1551,16 @@ class Collection(ApiGroup):
         :type query: str
         :param limit: Max number of documents returned.
         :type limit: int | None
+        :param batch_size: Max number of documents in the batch fetched by
+            the cursor in one round trip.
+        :type batch_size: int | None
+        :param fields: Document fields returned. If not set, whole documents
+            are returned. Names with dots refer to sub-attributes.
+        :type fields: [str] | None
+        :param stream: Produce the results lazily as the cursor is read instead
+            of materializing them on the server. The cursor count is then not
+            available.
+        :type stream: bool
         :returns: Document cursor.
         :rtype: aioarango.cursor.Cursor
         :raises aioarango.exceptions.DocumentGetError: If retrieval fails.
@@ -966,17 +1577,11 @@ class Collection(ApiGroup):
 
         aql = """
         FOR doc IN FULLTEXT(@collection, @field, @query{})
-            RETURN doc
+            RETURN {}
         """.format(
-            "" if limit is None else ", @limit"
-        )
-
-        request = Request(
-            method="post",
-            endpoint="/_api/cursor",
-            data={"query": aql, "bindVars": bind_vars, "count": True},
-            read=self.name,
+            "" if limit is None else ", @limit", self._projection(fields, bind_vars)
         )
+        request = self._query_request(aql, bind_vars, batch_size, stream)
 
         def response_handler(resp: Response) -> Cursor:
             if not resp.is_success:
@@ -997,39 +1602,55 @@ class Collection(ApiGroup):
         """
         handles = [self._extract_id(d) if isinstance(d, dict) else d for d in documents]
 
-        request = Request(
-            method="put",
-            endpoint="/_api/simple/lookup-by-keys",
-            data={"collection": self.name, "keys": handles},
-            read=self.name,
+        request = self._query_request(
+            "RETURN DOCUMENT(@collection, @handles)",
+            {"collection": self.name, "handles": handles},
         )
 
         def response_handler(resp: Response) -> List[Json]:
             if not resp.is_success:
                 raise DocumentGetError(resp, request)
-            docs = resp.body["documents"]
-            return [doc for doc in docs if "_id" in doc]
+            docs: List[Json] = resp.body["result"][0]
+            return docs
 
         return await self._execute(request, response_handler)
 
-    async def random(self) -> Result[Json]:
+    async def random(self) -> Result[Optional[Json]]:
         """Return a random document from the collection.
 
-        :return: A random document.
-        :rtype: dict
+        In the default and transaction execution contexts, the document count
+        is retrieved first and the query skips to a random offset. Otherwise,
+        the documents are sorted randomly, which reads the whole collection.
+
+        :return: A random document, or None if the collection is empty.
+        :rtype: dict | None
         :raise aioarango.exceptions.DocumentGetError: If retrieval fails.
         """
-        request = Request(
-            method="put",
-            endpoint="/_api/simple/any",
-            data={"collection": self.name},
-            read=self.name,
-        )
+        bind_vars: Json = {"@collection": self.name}
+        if self.context in ("default", "transaction"):
+            count_request = Request(
+                method="get", endpoint=f"/_api/collection/{self.name}/count"
+            )
 
-        def response_handler(resp: Response) -> Json:
-            if resp.is_success:
-                result: Json = resp.body["document"]
+            def count_handler(resp: Response) -> int:
+                if not resp.is_success:
+                    raise DocumentGetError(resp, count_request)
+                result: int = resp.body["count"]
                 return result
+
+            count = await self._execute(count_request, count_handler)
+            if count == 0:
+                return None
+            bind_vars["offset"] = randrange(count)
+            query = "FOR doc IN @@collection LIMIT @offset, 1 RETURN doc"
+        else:
+            query = "FOR doc IN @@collection SORT RAND() LIMIT 1 RETURN doc"
+        request = self._query_request(query, bind_vars)
+
+        def response_handler(resp: Response) -> Optional[Json]:
+            if resp.is_success:
+                result: List[Json] = resp.body["result"]
+                return result[0] if result else None
             raise DocumentGetError(resp, request)
 
         return await self._execute(request, response_handler)
@@ -1057,7 +1678,7 @@ class Collection(ApiGroup):
             result = resp.body["indexes"]
             return [format_index(index) for index in result]
 
-        return await self._execute(request, response_handler)
+        return await self._execute_metadata(request, response_handler)
 
     async def _add_index(self, data: Json) -> Result[Json]:
         """Helper method for creating a new index.
@@ -1076,6 +1697,7 @@ class Collection(ApiGroup):
         )
 
         def response_handler(resp: Response) -> Json:
+            self._invalidate_metadata(f"/_api/index?collection={self.name}")
             if not resp.is_success:
                 raise IndexCreateError(resp, request)
             return format_index(resp.body)
@@ -1326,6 +1948,7 @@ class Collection(ApiGroup):
         )
 
         def response_handler(resp: Response) -> bool:
+            self._invalidate_metadata(f"/_api/index?collection={self.name}")
             if resp.error_code == 1212 and ignore_missing:
                 return False
             if not resp.is_success:
@@ -1441,7 +2064,7 @@ class Collection(ApiGroup):
 
             return results
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, documents))
 
     async def update_many(
         self,
@@ -1548,7 +2171,7 @@ class Collection(ApiGroup):
 
             return results
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, documents))
 
     async def update_match(
         self,
@@ -1589,32 +2212,28 @@ class Collection(ApiGroup):
         :rtype: int
         :raise aioarango.exceptions.DocumentUpdateError: If update fails.
         """
-        data: Json = {
-            "collection": self.name,
-            "example": filters,
-            "newValue": body,
-            "keepNull": keep_none,
-            "mergeObjects": merge,
-        }
-        if limit is not None:
-            data["limit"] = limit
+        assert isinstance(filters, dict), "filters must be a dict"
+        assert is_none_or_int(limit), "limit must be a non-negative int"
+
+        options: Json = {"keepNull": keep_none, "mergeObjects": merge}
         if sync is not None:
-            data["waitForSync"] = sync
+            options["waitForSync"] = sync
 
-        request = Request(
-            method="put",
-            endpoint="/_api/simple/update-by-example",
-            data=data,
-            write=self.name,
+        bind_vars: Json = {"@collection": self.name, "body": body}
+        clauses = self._match_clauses(filters, bind_vars, limit=limit or None)
+        query = (
+            f"FOR doc IN @@collection\n{clauses}"
+            f"UPDATE doc WITH @body IN @@collection OPTIONS {dumps(options)}"
         )
+        request = self._query_request(query, bind_vars, write=True)
 
         def response_handler(resp: Response) -> int:
             if resp.is_success:
-                result: int = resp.body["updated"]
+                result: int = resp.body["extra"]["stats"]["writesExecuted"]
                 return result
             raise DocumentUpdateError(resp, request)
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler))
 
     async def replace_many(
         self,
@@ -1712,7 +2331,7 @@ class Collection(ApiGroup):
 
             return results
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, documents))
 
     async def replace_match(
         self,
@@ -1744,26 +2363,28 @@ class Collection(ApiGroup):
         :rtype: int
         :raise aioarango.exceptions.DocumentReplaceError: If replace fails.
         """
-        data: Json = {"collection": self.name, "example": filters, "newValue": body}
-        if limit is not None:
-            data["limit"] = limit
+        assert isinstance(filters, dict), "filters must be a dict"
+        assert is_none_or_int(limit), "limit must be a non-negative int"
+
+        options: Json = {}
         if sync is not None:
-            data["waitForSync"] = sync
+            options["waitForSync"] = sync
 
-        request = Request(
-            method="put",
-            endpoint="/_api/simple/replace-by-example",
-            data=data,
-            write=self.name,
+        bind_vars: Json = {"@collection": self.name, "body": body}
+        clauses = self._match_clauses(filters, bind_vars, limit=limit or None)
+        query = (
+            f"FOR doc IN @@collection\n{clauses}"
+            f"REPLACE doc WITH @body IN @@collection OPTIONS {dumps(options)}"
         )
+        request = self._query_request(query, bind_vars, write=True)
 
         def response_handler(resp: Response) -> int:
             if not resp.is_success:
                 raise DocumentReplaceError(resp, request)
-            result: int = resp.body["replaced"]
+            result: int = resp.body["extra"]["stats"]["writesExecuted"]
             return result
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler))
 
     async def delete_many(
         self,
@@ -1855,7 +2476,7 @@ class Collection(ApiGroup):
 
             return results
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, documents))
 
     async def delete_match(
         self, filters: Json, limit: Optional[int] = None, sync: Optional[bool] = None
@@ -1881,26 +2502,28 @@ class Collection(ApiGroup):
         :rtype: int
         :raise aioarango.exceptions.DocumentDeleteError: If delete fails.
         """
-        data: Json = {"collection": self.name, "example": filters}
+        assert isinstance(filters, dict), "filters must be a dict"
+        assert is_none_or_int(limit), "limit must be a non-negative int"
+
+        options: Json = {}
         if sync is not None:
-            data["waitForSync"] = sync
-        if limit is not None and limit != 0:
-            data["limit"] = limit
+            options["waitForSync"] = sync
 
-        request = Request(
-            method="put",
-            endpoint="/_api/simple/remove-by-example",
-            data=data,
-            write=self.name,
+        bind_vars: Json = {"@collection": self.name}
+        clauses = self._match_clauses(filters, bind_vars, limit=limit or None)
+        query = (
+            f"FOR doc IN @@collection\n{clauses}"
+            f"REMOVE doc IN @@collection OPTIONS {dumps(options)}"
         )
+        request = self._query_request(query, bind_vars, write=True)
 
         def response_handler(resp: Response) -> int:
             if resp.is_success:
-                result: int = resp.body["deleted"]
+                result: int = resp.body["extra"]["stats"]["writesExecuted"]
                 return result
             raise DocumentDeleteError(resp, request)
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler))
 
     async def import_bulk(
         self,
@@ -1998,7 +2621,7 @@ class Collection(ApiGroup):
                 return result
             raise DocumentInsertError(resp, request)
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler))
 
 
 class StandardCollection(Collection):
@@ -2034,6 +2657,19 @@ class StandardCollection(Collection):
         """
         handle, body, headers = self._prep_from_doc(document, rev, check_rev)
 
+        # Documents with expected revisions are always checked by the server.
+        cache = self.cache if not headers and self.context == "default" else None
+        entry = None
+        version = None
+        if cache is not None:
+            entry = cache.lookup(handle)
+            if entry is not None:
+                if entry.fresh:
+                    cached: Json = self._conn.deserialize(entry.raw_body)
+                    return cached
+                headers = {"If-None-Match": entry.rev}
+            version = cache.version
+
         request = Request(
             method="get",
             endpoint=f"/_api/document/{handle}",
@@ -2042,7 +2678,15 @@ class StandardCollection(Collection):
         )
 
         def response_handler(resp: Response) -> Optional[Json]:
+            if resp.status_code == 304 and entry is not None:
+                assert cache is not None
+                cache.refresh(handle, entry)
+                revalidated: Json = self._conn.deserialize(entry.raw_body)
+                return revalidated
             if resp.error_code == 1202:
+                if entry is not None:
+                    assert cache is not None
+                    cache.invalidate([handle])
                 return None
             if resp.status_code == 412:
                 raise DocumentRevisionError(resp, request)
@@ -2050,6 +2694,8 @@ class StandardCollection(Collection):
                 raise DocumentGetError(resp, request)
 
             result: Json = resp.body
+            if cache is not None:
+                cache.put(handle, result["_rev"], resp.raw_body, version)
             return result
 
         return await self._execute(request, response_handler)
@@ -2141,7 +2787,7 @@ class StandardCollection(Collection):
                 result["_old_rev"] = result.pop("_oldRev")
             return result
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, [document]))
 
     async def update(
         self,
@@ -2217,7 +2863,7 @@ class StandardCollection(Collection):
             result["_old_rev"] = result.pop("_oldRev")
             return result
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, [document]))
 
     async def replace(
         self,
@@ -2286,7 +2932,7 @@ class StandardCollection(Collection):
                 result["_old_rev"] = result.pop("_oldRev")
             return result
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, [document]))
 
     async def delete(
         self,
@@ -2357,7 +3003,7 @@ class StandardCollection(Collection):
                 raise DocumentDeleteError(resp, request)
             return True if silent else resp.body
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, [document]))
 
 
 class VertexCollection(Collection):
@@ -2477,7 +3123,7 @@ class VertexCollection(Collection):
                 return True
             return format_vertex(resp.body)
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, [document]))
 
     async def update(
         self,
@@ -2547,7 +3193,7 @@ class VertexCollection(Collection):
                 return True
             return format_vertex(resp.body)
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, [document]))
 
     async def replace(
         self,
@@ -2611,7 +3257,7 @@ class VertexCollection(Collection):
                 return True
             return format_vertex(resp.body)
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, [document]))
 
     async def delete(
         self,
@@ -2674,7 +3320,7 @@ class VertexCollection(Collection):
             result: Json = resp.body
             return {"old": result["old"]} if return_old else True
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, [document]))
 
 
 class EdgeCollection(Collection):
@@ -2793,7 +3439,7 @@ class EdgeCollection(Collection):
                 return True
             return format_edge(resp.body)
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, [document]))
 
     async def update(
         self,
@@ -2863,7 +3509,7 @@ class EdgeCollection(Collection):
                 return True
             return format_edge(resp.body)
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, [document]))
 
     async def replace(
         self,
@@ -2928,7 +3574,7 @@ class EdgeCollection(Collection):
                 return True
             return format_edge(resp.body)
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, [document]))
 
     async def delete(
         self,
@@ -2990,7 +3636,7 @@ class EdgeCollection(Collection):
             result: Json = resp.body
             return {"old": result["old"]} if return_old else True
 
-        return await self._execute(request, response_handler)
+        return await self._execute(request, self._uncaching(response_handler, [document]))
 
     async def link(
         self,
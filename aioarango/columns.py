@@ -0,0 +1,154 @@
+from array import array
+from typing import Any, List, Optional, Sequence, Union
+
+from aioarango.typings import Jsons
+
+
+class Column:
+    """Growable column buffer of query results.
+
+    Typed columns store their values in an :class:`array.array` of the given
+    typecode. Nulls (missing fields or None values) are stored as zeros and
+    flagged in a null mask, which is created on the first null. Untyped
+    columns store the values as they are in a list.
+
+    :param name: Column name.
+    :type name: str
+    :param typecode: Typecode of :mod:`array` (e.g. "d" for float64 or "q"
+        for int64). If not set, values are stored in a list.
+    :type typecode: str | None
+    """
+
+    __slots__ = ("name", "typecode", "values", "nulls")
+
+    def __init__(self, name: str, typecode: Optional[str] = None) -> None:
+        self.name = name
+        self.typecode = typecode
+        self.values: Union["array[Any]", List[Any]] = (
+            [] if typecode is None else array(typecode)
+        )
+        self.nulls: Optional[bytearray] = None
+
+    def __repr__(self) -> str:
+        return f"<Column {self.name!r} {self.typecode or 'object'} {len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def null_count(self) -> int:
+        """Return the number of nulls in a typed column.
+
+        :return: Number of nulls.
+        :rtype: int
+        """
+        return 0 if self.nulls is None else self.nulls.count(1)
+
+    def extend(self, rows: Jsons, key: Union[str, int]) -> None:
+        """Append the values of one result batch.
+
+        :param rows: Result batch of documents or of arrays.
+        :type rows: [dict | list]
+        :param key: Document field, or position in arrays.
+        :type key: str | int
+        """
+        if isinstance(key, int):
+            values = [row[key] for row in rows]
+        else:
+            values = [row.get(key) for row in rows]
+
+        if self.typecode is None:
+            self.values.extend(values)
+            return
+
+        offset = len(self.values)
+        if None in values:
+            if self.nulls is None:
+                self.nulls = bytearray(offset)
+            mask = bytearray(len(values))
+            for index, value in enumerate(values):
+                if value is None:
+                    mask[index] = 1
+                    values[index] = 0
+            self.nulls.extend(mask)
+        elif self.nulls is not None:
+            self.nulls.extend(bytes(len(values)))
+        self.values.fromlist(values)  # type: ignore[union-attr]
+
+    def to_list(self) -> List[Any]:
+        """Return the values with None in place of nulls.
+
+        :return: Column values.
+        :rtype: list
+        """
+        values = list(self.values)
+        if self.nulls is not None:
+            for index, null in enumerate(self.nulls):
+                if null:
+                    values[index] = None
+        return values
+
+    def to_numpy(self) -> Any:
+        """Return the column as a NumPy array, without copying typed values.
+
+        Typed columns share memory with the returned array, so they must not
+        be extended afterwards, and columns with nulls are returned as masked
+        arrays. Requires the numpy package.
+
+        :return: NumPy array.
+        :rtype: numpy.ndarray | numpy.ma.MaskedArray
+        :raise ImportError: If numpy is not installed.
+        """
+        import numpy
+
+        if self.typecode is None:
+            result = numpy.empty(len(self.values), dtype=object)
+            result[:] = self.values
+            return result
+
+        values = numpy.frombuffer(self.values, dtype=self.typecode)
+        if self.nulls is None:
+            return values
+        mask = numpy.frombuffer(self.nulls, dtype=numpy.bool_)
+        return numpy.ma.masked_array(values, mask=mask)
+
+    def to_arrow(self) -> Any:
+        """Return the column as a pyarrow array. Requires the pyarrow package.
+
+        :return: Arrow array.
+        :rtype: pyarrow.Array
+        :raise ImportError: If pyarrow is not installed.
+        """
+        import pyarrow
+
+        if self.typecode is None:
+            return pyarrow.array(self.values)
+
+        values = self.to_numpy()
+        if self.nulls is None:
+            return pyarrow.array(values)
+        return pyarrow.array(values.data, mask=values.mask)
+
+
+def make_columns(
+    fields: Sequence[str],
+    dtypes: Optional[Union[Sequence[Optional[str]], Any]] = None,
+) -> List[Column]:
+    """Return empty column buffers for the fields.
+
+    :param fields: Column names.
+    :type fields: [str]
+    :param dtypes: Typecodes per field, as a sequence aligned with **fields**
+        or a mapping of field to typecode. Fields without a typecode are
+        stored as lists.
+    :type dtypes: [str | None] | dict | None
+    :return: Column buffers.
+    :rtype: [aioarango.columns.Column]
+    """
+    if dtypes is None:
+        typecodes: Sequence[Optional[str]] = [None] * len(fields)
+    elif hasattr(dtypes, "get"):
+        typecodes = [dtypes.get(field) for field in fields]
+    else:
+        typecodes = list(dtypes)
+    return [Column(field, typecode) for field, typecode in zip(fields, typecodes)]
@@ -1,17 +1,21 @@
 import sys
 import time
 from abc import abstractmethod
-from typing import Any, Callable, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Union
 
 import httpx
 import jwt
 from requests_toolbelt import MultipartEncoder
 
+from aioarango.cache import DocumentCache, MetadataCache, PlanCache, QueryResultCache
 from aioarango.exceptions import JWTAuthError, ServerConnectionError
 from aioarango.http import HTTPClient
+from aioarango.querylog import QueryLog
 from aioarango.request import Request
 from aioarango.resolver import HostResolver
 from aioarango.response import Response
+from aioarango.tracing import NOOP_TRACER, Tracer
+from aioarango.tracker import CursorTracker
 from aioarango.typings import Fields, Json
 
 Connection = Union['BaseConnection', 'JwtConnection', 'JwtSuperuserConnection']
@@ -29,6 +33,7 @@ class BaseConnection(object):
         http_client: HTTPClient,
         serializer: Callable[..., str],
         deserializer: Callable[[str], Any],
+        tracer: Optional[Tracer] = None,
     ):
         self._url_prefixes = [f"{host}/_db/{db_name}" for host in hosts]
         self._host_resolver = host_resolver
@@ -37,7 +42,14 @@ class BaseConnection(object):
         self._http = http_client
         self._serializer = serializer
         self._deserializer = deserializer
+        self._tracer: Tracer = tracer or NOOP_TRACER
         self._username: Optional[str] = None
+        self.query_log: Optional[QueryLog] = None
+        self.document_caches: Dict[str, DocumentCache] = {}
+        self.result_cache: Optional[QueryResultCache] = None
+        self.metadata_cache: Optional[MetadataCache] = None
+        self.plan_cache: Optional[PlanCache] = None
+        self.cursors = CursorTracker(self)
 
     @property
     def db_name(self) -> str:
@@ -57,6 +69,15 @@ class BaseConnection(object):
         """
         return self._username
 
+    @property
+    def tracer(self) -> Tracer:
+        """Return the tracer.
+
+        :returns: Tracer.
+        :rtype: aioarango.tracing.Tracer
+        """
+        return self._tracer
+
     def serialize(self, obj: Any) -> str:
         """Serialize the given object.
 
@@ -186,6 +207,8 @@ class BasicConnection(BaseConnection):
     :type password: str
     :param http_client: User-defined HTTP client.
     :type http_client: aioarango.http.HTTPClient
+    :param tracer: Tracer. If not set, nothing is traced.
+    :type tracer: aioarango.tracing.Tracer | None
     """
 
     def __init__(
@@ -199,6 +222,7 @@ class BasicConnection(BaseConnection):
         http_client: HTTPClient,
         serializer: Callable[..., str],
         deserializer: Callable[[str], Any],
+        tracer: Optional[Tracer] = None,
     ) -> None:
         super().__init__(
             hosts,
@@ -208,6 +232,7 @@ class BasicConnection(BaseConnection):
             http_client,
             serializer,
             deserializer,
+            tracer,
         )
         self._username = username
         self._auth = (username, password)
@@ -221,15 +246,19 @@ class BasicConnection(BaseConnection):
         :rtype: aioarango.response.Response
         """
         host_index = self._host_resolver.get_host_index()
+        data = self.normalize_data(request.data)
+        self._tracer.inject(request.headers, data)
+
         resp = await self._http.send_request(
             session=self._sessions[host_index],
             method=request.method,
             url=self._url_prefixes[host_index] + request.endpoint,
             params=request.params,
-            data=self.normalize_data(request.data),
+            data=data,
             headers=request.headers,
             auth=self._auth,
         )
+        self._tracer.record_response(resp)
         return self.prep_response(resp, request.deserialize)
 
 
@@ -250,6 +279,8 @@ class JwtConnection(BaseConnection):
     :type password: str
     :param http_client: User-defined HTTP client.
     :type http_client: aioarango.http.HTTPClient
+    :param tracer: Tracer. If not set, nothing is traced.
+    :type tracer: aioarango.tracing.Tracer | None
     """
 
     def __init__(
@@ -263,6 +294,7 @@ class JwtConnection(BaseConnection):
         http_client: HTTPClient,
         serializer: Callable[..., str],
         deserializer: Callable[[str], Any],
+        tracer: Optional[Tracer] = None,
     ) -> None:
         super().__init__(
             hosts,
@@ -272,6 +304,7 @@ class JwtConnection(BaseConnection):
             http_client,
             serializer,
             deserializer,
+            tracer,
         )
         self._username = username
         self._password = password
@@ -294,14 +327,18 @@ class JwtConnection(BaseConnection):
         if self._auth_header is not None:
             request.headers["Authorization"] = self._auth_header
 
+        data = self.normalize_data(request.data)
+        self._tracer.inject(request.headers, data)
+
         resp = await self._http.send_request(
             session=self._sessions[host_index],
             method=request.method,
             url=self._url_prefixes[host_index] + request.endpoint,
             params=request.params,
-            data=self.normalize_data(request.data),
+            data=data,
             headers=request.headers,
         )
+        self._tracer.record_response(resp)
         resp = self.prep_response(resp, request.deserialize)
 
         # Refresh the token and retry on HTTP 401 and error code 11.
@@ -322,9 +359,10 @@ class JwtConnection(BaseConnection):
             method=request.method,
             url=self._url_prefixes[host_index] + request.endpoint,
             params=request.params,
-            data=self.normalize_data(request.data),
+            data=data,
             headers=request.headers,
         )
+        self._tracer.record_response(resp)
         return self.prep_response(resp, request.deserialize)
 
     async def refresh_token(self) -> None:
@@ -386,6 +424,8 @@ class JwtSuperuserConnection(BaseConnection):
     :type http_client: aioarango.http.HTTPClient
     :param superuser_token: User generated token for superuser access.
     :type superuser_token: str
+    :param tracer: Tracer. If not set, nothing is traced.
+    :type tracer: aioarango.tracing.Tracer | None
     """
 
     def __init__(
@@ -398,6 +438,7 @@ class JwtSuperuserConnection(BaseConnection):
         serializer: Callable[..., str],
         deserializer: Callable[[str], Any],
         superuser_token: str,
+        tracer: Optional[Tracer] = None,
     ) -> None:
         super().__init__(
             hosts,
@@ -407,6 +448,7 @@ class JwtSuperuserConnection(BaseConnection):
             http_client,
             serializer,
             deserializer,
+            tracer,
         )
         self._auth_header = f"bearer {superuser_token}"
 
@@ -421,12 +463,16 @@ class JwtSuperuserConnection(BaseConnection):
         host_index = self._host_resolver.get_host_index()
         request.headers["Authorization"] = self._auth_header
 
+        data = self.normalize_data(request.data)
+        self._tracer.inject(request.headers, data)
+
         resp = await self._http.send_request(
             session=self._sessions[host_index],
             method=request.method,
             url=self._url_prefixes[host_index] + request.endpoint,
             params=request.params,
-            data=self.normalize_data(request.data),
+            data=data,
             headers=request.headers,
         )
+        self._tracer.record_response(resp)
         return self.prep_response(resp, request.deserialize)
@@ -1,6 +1,32 @@
+import asyncio
+import csv
+import gzip
+import io
+import os
+import time
+import weakref
 from collections import deque
-from typing import Any, Deque, Optional, Sequence
+from concurrent.futures import Executor
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import httpx
 
+from aioarango.columns import Column, make_columns
 from aioarango.connection import BaseConnection
 from aioarango.exceptions import (
     CursorCloseError,
@@ -10,8 +36,87 @@ from aioarango.exceptions import (
     CursorStateError,
 )
 from aioarango.request import Request
+from aioarango.response import Response
+from aioarango.tracing import Span
 from aioarango.typings import Json
 
+# Failures after which a batch request is retried, if the cursor allows it.
+RETRY_ERRORS = (httpx.TransportError, OSError, asyncio.TimeoutError)
+RETRY_STATUS_CODES = frozenset([502, 503, 504])
+
+# Max number of keep-alive refreshes in a row while the consumer reads nothing.
+KEEP_ALIVE_MAX_REFRESHES = 20
+
+T = TypeVar("T")
+
+
+class AdaptiveBatchSize:
+    """Batch size policy adjusting cursor batches to observed results.
+
+    After each fetched batch, the size of the next batch is chosen so that it
+    is expected to reach the target bytes (and the target latency, if set),
+    based on the average bytes and fetch time per item of the last batch.
+    Each step changes the batch size by at most a factor of **max_step**. The
+    batch size is sent with every continuation request, which requires a
+    server version accepting ``batchSize`` there (older servers ignore it).
+    Instances keep state and must not be shared between cursors.
+
+    :param target_bytes: Target size of the response body per batch in bytes.
+    :type target_bytes: int
+    :param target_latency: Target fetch time per batch in seconds.
+    :type target_latency: int | float | None
+    :param min_size: Min batch size.
+    :type min_size: int
+    :param max_size: Max batch size.
+    :type max_size: int
+    :param max_step: Max factor by which the batch size changes per batch.
+    :type max_step: int | float
+    :ivar batch_size: Batch size of the next request, or None until the first
+        batch is observed.
+    :vartype batch_size: int | None
+    """
+
+    def __init__(
+        self,
+        target_bytes: int = 1 << 22,
+        target_latency: Optional[float] = None,
+        min_size: int = 10,
+        max_size: int = 100000,
+        max_step: float = 4.0,
+    ) -> None:
+        self.target_bytes = target_bytes
+        self.target_latency = target_latency
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_step = max_step
+        self.batch_size: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return f"<AdaptiveBatchSize {self.batch_size}>"
+
+    def observe(self, count: int, size: int, latency: float) -> Optional[int]:
+        """Update the batch size using the statistics of a fetched batch.
+
+        :param count: Number of items in the batch.
+        :type count: int
+        :param size: Size of the response body.
+        :type size: int
+        :param latency: Fetch time in seconds.
+        :type latency: float
+        :return: Batch size of the next request.
+        :rtype: int | None
+        """
+        if count == 0:
+            return self.batch_size
+
+        target = self.target_bytes * count / max(size, 1)
+        if self.target_latency is not None and latency > 0:
+            target = min(target, self.target_latency * count / latency)
+
+        target = min(max(target, count / self.max_step), count * self.max_step)
+        self.batch_size = int(min(max(target, self.min_size), self.max_size))
+        return self.batch_size
+
 
 class Cursor:
     """Cursor API wrapper.
@@ -25,6 +130,41 @@ class Cursor:
     :type init_data: dict
     :param cursor_type: Cursor type ("cursor" or "export").
     :type cursor_type: str
+    :param stats_callback: Callable invoked with the cursor once, with the
+        final query statistics: when the cursor is depleted, or when it is
+        closed before that. Batches of streaming cursors carry statistics of
+        the work done so far, so earlier statistics are incomplete.
+    :type stats_callback: callable | None
+    :param prefetch: Max number of batches fetched ahead in the background.
+        When set, the next batch is requested as soon as the previous one
+        arrives, until this many batches are buffered. Buffered batches are
+        discarded when the cursor is closed. Requires a running event loop.
+    :type prefetch: int | None
+    :param retries: Max number of times a batch request is retried after a
+        network error or a 502, 503 or 504 response. Batches are requested by
+        ID, so retried requests return the same batch without duplicating or
+        skipping results. Requires a query executed with **allow_retry**
+        (ArangoDB 3.11+); otherwise the lost batch cannot be requested again.
+    :type retries: int
+    :param retry_delay: Delay in seconds before the first retry, doubled for
+        every further retry.
+    :type retry_delay: int | float
+    :param batch_sizer: Policy adjusting the size of the subsequent batches.
+    :type batch_sizer: aioarango.cursor.AdaptiveBatchSize | None
+    :param keep_alive: Time-to-live of the cursor on the server in seconds.
+        If set, the cursor is kept alive for consumers slower than its TTL:
+        whenever no batch is requested for half of the TTL, the current batch
+        is requested again by ID (for queries executed with **allow_retry**),
+        which resets the TTL without fetching more results. Other cursors
+        fetch the next batch ahead instead, but buffer no more batches than
+        the prefetch limit (at least one), so they may still expire if the
+        consumer stalls for longer. After :data:`KEEP_ALIVE_MAX_REFRESHES`
+        refreshes in a row without the consumer reading a batch, the TTL is
+        left to lapse. Requires a running event loop.
+    :type keep_alive: int | float | None
+    :param row_factory: Callable converting each result (e.g. an array of
+        field values) into the item yielded by the cursor.
+    :type row_factory: callable | None
     """
 
     __slots__ = [
@@ -35,9 +175,23 @@ class Cursor:
         "_cached",
         "_stats",
         "_profile",
+        "_plan",
         "_warnings",
         "_has_more",
         "_batch",
+        "_stats_callback",
+        "_prefetch_task",
+        "_prefetched",
+        "_prefetch_slots",
+        "_prefetch_limit",
+        "_prefetch_debt",
+        "_keep_alive",
+        "_row_factory",
+        "_next_batch_id",
+        "_retries",
+        "_retry_delay",
+        "_batch_sizer",
+        "__weakref__",
     ]
 
     def __init__(
@@ -45,6 +199,13 @@ class Cursor:
         connection: BaseConnection,
         init_data: Json,
         cursor_type: str = "cursor",
+        stats_callback: Optional[Callable[["Cursor"], None]] = None,
+        prefetch: Optional[int] = None,
+        retries: int = 0,
+        retry_delay: float = 0.1,
+        batch_sizer: Optional[AdaptiveBatchSize] = None,
+        keep_alive: Optional[float] = None,
+        row_factory: Optional[Callable[[Any], Any]] = None,
     ) -> None:
         self._conn = connection
         self._type = cursor_type
@@ -54,9 +215,31 @@ class Cursor:
         self._cached = None
         self._stats = None
         self._profile = None
+        self._plan: Optional[Json] = None
         self._warnings = None
+        self._stats_callback = stats_callback
+        self._prefetch_task: Optional["asyncio.Future[None]"] = None
+        self._prefetched: "asyncio.Queue[Union[Json, BaseException]]"
+        self._prefetch_limit = prefetch or 0
+        self._prefetch_debt = 0
+        self._keep_alive = keep_alive
+        self._row_factory = row_factory
+        self._next_batch_id: Optional[str] = None
+        self._retries = retries
+        self._retry_delay = retry_delay
+        self._batch_sizer = batch_sizer
         self._update(init_data)
 
+        if self._id is not None and (self._has_more or retries):
+            connection.cursors.register(self)
+
+        if (prefetch or keep_alive) and self._id is not None and self._has_more:
+            self._prefetched = asyncio.Queue()
+            self._prefetch_slots = asyncio.Semaphore(self._prefetch_limit)
+            self._prefetch_task = asyncio.ensure_future(_prefetch(weakref.ref(self)))
+            # Abandoned cursors stop their task (which has no strong reference).
+            weakref.finalize(self, self._prefetch_task.cancel).atexit = False
+
     def __aiter__(self):
         return self
 
@@ -77,11 +260,13 @@ class Cursor:
     def __repr__(self) -> str:
         return f"<Cursor {self._id}>" if self._id else "<Cursor>"
 
-    def _update(self, data: Json) -> Json:
+    def _update(self, data: Json, buffer: bool = True) -> Json:
         """Update the cursor using data from ArangoDB server.
 
         :param data: Cursor data from ArangoDB server (e.g. results).
         :type data: dict
+        :param buffer: Append the results to the current batch.
+        :type buffer: bool
         :return: Update cursor data.
         :rtype: dict
         """
@@ -99,9 +284,17 @@ class Cursor:
 
         self._has_more = bool(data["hasMore"])
         result["has_more"] = data["hasMore"]
+        self._next_batch_id = data.get("nextBatchId")
+        if not self._has_more and not self._retries and self._id is not None:
+            # The server deletes depleted cursors unless they allow retries.
+            self._conn.cursors.unregister(self)
 
-        self._batch.extend(data["result"])
-        result["batch"] = data["result"]
+        batch = data["result"]
+        if self._row_factory is not None:
+            batch = list(map(self._row_factory, batch))
+        if buffer:
+            self._batch.extend(batch)
+        result["batch"] = batch
 
         if "extra" in data:
             extra = data["extra"]
@@ -110,6 +303,9 @@ class Cursor:
                 self._profile = extra["profile"]
                 result["profile"] = extra["profile"]
 
+            if "plan" in extra:
+                self._plan = extra["plan"]
+
             if "warnings" in extra:
                 self._warnings = extra["warnings"]
                 result["warnings"] = extra["warnings"]
@@ -131,8 +327,82 @@ class Cursor:
                 self._stats = stats
                 result["statistics"] = stats
 
+        if not self._has_more:
+            self._report_stats()
         return result
 
+    def _report_stats(self) -> None:
+        """Invoke the statistics callback once, if statistics were received."""
+        if self._stats_callback is not None and self._stats is not None:
+            callback, self._stats_callback = self._stats_callback, None
+            callback(self)
+
+    def _trace(self, span: Span) -> None:
+        """Set the span attributes describing the cursor state.
+
+        :param span: Active span.
+        :type span: aioarango.tracing.Span
+        """
+        span.set_attribute("arango.cursor_id", self._id)
+        span.set_attribute("arango.batch_count", len(self._batch))
+        if self._stats is not None:
+            span.set_attribute(
+                "arango.execution_time", self._stats.get("execution_time")
+            )
+            span.set_attribute("arango.scanned_full", self._stats.get("scanned_full"))
+            span.set_attribute(
+                "arango.scanned_index", self._stats.get("scanned_index")
+            )
+
+    async def _request_batch(
+        self, batch_id: Optional[str]
+    ) -> Tuple[Request, Response]:
+        """Request a batch from server, retrying failures if allowed.
+
+        Successful responses are reported to the batch size policy, if any.
+
+        :param batch_id: ID of the batch, or None to request the next batch
+            without retry support.
+        :type batch_id: str | None
+        :return: Request sent and response of the last attempt.
+        :rtype: (aioarango.request.Request, aioarango.response.Response)
+        """
+        sizer = self._batch_sizer
+        data = None
+        if sizer is not None and sizer.batch_size is not None:
+            data = {"batchSize": sizer.batch_size}
+
+        if batch_id is None:
+            endpoint = f"/_api/{self._type}/{self._id}"
+            request = Request(method="put", endpoint=endpoint, data=data)
+        else:
+            endpoint = f"/_api/{self._type}/{self._id}/{batch_id}"
+            request = Request(method="post", endpoint=endpoint, data=data)
+
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                resp = await self._conn.send_request(request)
+            except RETRY_ERRORS:
+                if batch_id is None or attempt >= self._retries:
+                    raise
+            else:
+                if (
+                    batch_id is None
+                    or attempt >= self._retries
+                    or resp.status_code not in RETRY_STATUS_CODES
+                ):
+                    if sizer is not None and resp.is_success:
+                        sizer.observe(
+                            len(resp.body["result"]),
+                            len(resp.raw_body),
+                            time.perf_counter() - start,
+                        )
+                    return request, resp
+            await asyncio.sleep(self._retry_delay * 2 ** attempt)
+            attempt += 1
+
     @property
     def id(self) -> Optional[str]:
         """Return the cursor ID.
@@ -200,6 +470,18 @@ class Cursor:
         """
         return self._profile
 
+    def plan(self) -> Optional[Json]:
+        """Return the execution plan of a query executed with **profile** set
+        to 2.
+
+        Use :func:`aioarango.plan.analyze_plan` with the plan and the cursor
+        statistics to find its costly parts.
+
+        :return: Execution plan, or None if not available.
+        :rtype: dict | None
+        """
+        return self._plan
+
     def warnings(self) -> Optional[Sequence[Json]]:
         """Return any warnings from the query execution.
 
@@ -251,20 +533,290 @@ class Cursor:
     async def fetch(self) -> Json:
         """Fetch the next batch from server and update the cursor.
 
+        If prefetching or keep-alive is enabled, the next buffered batch is
+        used instead, waiting for the background request if necessary.
+
         :return: New batch details.
         :rtype: dict
         :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
         :raise aioarango.exceptions.CursorStateError: If cursor ID is not set.
         """
+        return await self._fetch(buffer=True)
+
+    async def _fetch(self, buffer: bool) -> Json:
+        """Fetch the next batch from server and update the cursor.
+
+        :param buffer: Append the results to the current batch.
+        :type buffer: bool
+        :return: New batch details.
+        :rtype: dict
+        """
         if self._id is None:
             raise CursorStateError("cursor ID not set")
-        request = Request(method="put", endpoint=f"/_api/{self._type}/{self._id}")
-        resp = await self._conn.send_request(request)
 
-        if not resp.is_success:
-            raise CursorNextError(resp, request)
+        task = self._prefetch_task
+        if task is not None and not (task.done() and self._prefetched.empty()):
+            if self._prefetched.empty() and self._prefetch_limit == 0:
+                self._prefetch_slots.release()
+            data = await self._prefetched.get()
+            if self._prefetch_debt > 0:
+                self._prefetch_debt -= 1
+            elif self._prefetch_limit > 0:
+                self._prefetch_slots.release()
+            if isinstance(data, BaseException):
+                raise data
+            return self._update(data, buffer)
+
+        with self._conn.tracer.span("arangodb.cursor.fetch") as span:
+            request, resp = await self._request_batch(self._next_batch_id)
+
+            if not resp.is_success:
+                raise CursorNextError(resp, request)
+
+            result = self._update(resp.body, buffer)
+            if span.is_recording:
+                span.set_attribute("db.name", self._conn.db_name)
+                self._trace(span)
+                if not buffer:
+                    span.set_attribute("arango.batch_count", len(result["batch"]))
+            return result
+
+    async def batches(self) -> AsyncIterator[List[Any]]:
+        """Iterate over the remaining results one batch at a time.
+
+        The items left in the current batch are yielded first. Subsequent
+        batches are yielded as received from the server without being copied
+        into the current batch, which avoids the per-item overhead of
+        :func:`aioarango.cursor.Cursor.next`.
+
+        :return: Async iterator of result batches.
+        :rtype: typing.AsyncIterator[list]
+        :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
+        :raise aioarango.exceptions.CursorStateError: If cursor ID is not set.
+        """
+        if self._batch:
+            batch = list(self._batch)
+            self._batch.clear()
+            yield batch
+        while self._has_more:
+            result = await self._fetch(buffer=False)
+            yield result["batch"]
+
+    async def drain(self) -> List[Any]:
+        """Fetch and return all remaining results.
+
+        :return: Remaining results.
+        :rtype: list
+        :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
+        :raise aioarango.exceptions.CursorStateError: If cursor ID is not set.
+        """
+        items: List[Any] = []
+        async for batch in self.batches():
+            items.extend(batch)
+        return items
+
+    async def export_to(
+        self,
+        target: Union[str, "os.PathLike[str]", IO[bytes]],
+        format: str = "jsonl",
+        fields: Optional[Sequence[str]] = None,
+        compress: Optional[bool] = None,
+    ) -> int:
+        """Write all remaining results to a file or binary stream.
+
+        Each batch is encoded (with the serializer of the client for JSON) and
+        written as soon as it arrives, so memory use is bounded by about two
+        batches. Opening, compressing, writing and closing files run in the
+        default executor to keep the event loop responsive; combine with
+        **prefetch** to overlap them with fetching.
+
+        :param target: File path, or writable binary stream. Streams are
+            flushed but not closed.
+        :type target: str | os.PathLike | typing.BinaryIO
+        :param format: Output format: "jsonl" (one JSON value per line) or
+            "csv" (with a header row).
+        :type format: str
+        :param fields: CSV columns. Documents are written by field name and
+            arrays by position. Nested values are written as JSON and nulls as
+            empty strings. If not set, the fields of the first document are
+            used, or positions ("0", "1", ...) for arrays and "value" for
+            other results. Ignored for JSONL.
+        :type fields: [str] | None
+        :param compress: Compress the output with gzip. By default, only file
+            paths ending with ".gz" are compressed.
+        :type compress: bool | None
+        :return: Number of results written.
+        :rtype: int
+        :raise ValueError: If the format is not supported.
+        :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
+        :raise aioarango.exceptions.CursorStateError: If cursor ID is not set.
+        """
+        if format not in ("jsonl", "csv"):
+            raise ValueError(f"invalid export format: {format}")
+
+        loop = asyncio.get_event_loop()
+        if isinstance(target, (str, os.PathLike)):
+            if compress is None:
+                compress = os.fspath(target).endswith(".gz")
+            file: Optional[IO[bytes]] = await loop.run_in_executor(
+                None, open, target, "wb", 1 << 20
+            )
+            stream: IO[bytes] = file  # type: ignore[assignment]
+        else:
+            file, stream = None, target
+
+        serialize = self._conn.serialize
+        writer: Optional[Any] = None
+        buffer = io.StringIO()
+        count = 0
+        try:
+            if compress:
+                stream = await loop.run_in_executor(
+                    None, _gzip_writer, stream  # type: ignore[arg-type]
+                )
+
+            async for batch in self.batches():
+                if not batch:
+                    continue
+                if format == "jsonl":
+                    chunk = "\n".join([serialize(item) for item in batch]) + "\n"
+                else:
+                    if writer is None:
+                        writer = csv.writer(buffer)
+                        if fields is None:
+                            fields = _csv_header(batch[0])
+                        writer.writerow(fields)
+                    writer.writerows(_csv_rows(batch, fields, serialize))
+                    chunk = buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+                await loop.run_in_executor(None, stream.write, chunk.encode("utf-8"))
+                count += len(batch)
+        finally:
+            if compress:
+                await loop.run_in_executor(None, stream.close)
+            if file is not None:
+                await loop.run_in_executor(None, file.close)
+            else:
+                await loop.run_in_executor(None, target.flush)  # type: ignore
+        return count
+
+    def map_concurrent(
+        self,
+        fn: Callable[[Any], Awaitable[T]],
+        concurrency: int = 10,
+        ordered: bool = False,
+    ) -> AsyncIterator[T]:
+        """Apply a coroutine function to the remaining results concurrently.
+
+        Items are taken from the cursor (fetching batches as needed) only
+        while fewer than **concurrency** calls are running, so memory stays
+        bounded when the consumer is slow. If a call fails, the remaining
+        calls are cancelled and the error is raised. Leaving the iteration
+        early (or cancelling it) cancels the running calls as well.
 
-        return self._update(resp.body)
+        :param fn: Coroutine function called with each item.
+        :type fn: callable
+        :param concurrency: Max number of concurrent calls.
+        :type concurrency: int
+        :param ordered: Yield results in the order of the items. If set to
+            False, results are yielded as soon as they are ready.
+        :type ordered: bool
+        :return: Async iterator of results.
+        :rtype: typing.AsyncIterator
+        :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
+        """
+        return _bounded_map(self, fn, concurrency, ordered)
+
+    def map_batches(
+        self,
+        fn: Callable[[List[Any]], T],
+        executor: Optional[Executor] = None,
+        concurrency: int = 2,
+        ordered: bool = True,
+    ) -> AsyncIterator[T]:
+        """Apply a function to the remaining batches in an executor.
+
+        Use a :class:`concurrent.futures.ProcessPoolExecutor` for CPU-bound
+        transforms; **fn** and the results must then be picklable. Batches
+        are fetched only while fewer than **concurrency** calls are running.
+        Calls already running in an executor are not interrupted when the
+        iteration fails or is left early.
+
+        :param fn: Function called with each batch (list of items).
+        :type fn: callable
+        :param executor: Executor, or None for the default executor.
+        :type executor: concurrent.futures.Executor | None
+        :param concurrency: Max number of batches processed at once.
+        :type concurrency: int
+        :param ordered: Yield results in the order of the batches.
+        :type ordered: bool
+        :return: Async iterator of results, one per batch.
+        :rtype: typing.AsyncIterator
+        :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
+        """
+        loop = asyncio.get_event_loop()
+
+        def submit(batch: List[Any]) -> "asyncio.Future[T]":
+            return loop.run_in_executor(executor, fn, batch)
+
+        return _bounded_map(self.batches(), submit, concurrency, ordered)
+
+    async def to_columns(
+        self,
+        fields: Sequence[str],
+        dtypes: Optional[Union[Sequence[Optional[str]], Dict[str, str]]] = None,
+    ) -> Dict[str, Column]:
+        """Fetch all remaining results into column buffers.
+
+        Results must be documents (e.g. ``RETURN {a: d.a, b: d.b}``), whose
+        values are taken by field name, or arrays (e.g. ``RETURN [d.a, d.b]``),
+        whose values are taken by position in the order of **fields**. Each
+        batch is appended to the columns as it arrives, so the full result set
+        is never held as documents.
+
+        :param fields: Column names.
+        :type fields: [str]
+        :param dtypes: :mod:`array` typecodes (e.g. "d" or "q") per column,
+            either aligned with **fields** or as a mapping of field to
+            typecode. Columns without a typecode hold the values in a list.
+        :type dtypes: [str | None] | dict | None
+        :return: Column buffers by field name.
+        :rtype: dict
+        :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
+        :raise aioarango.exceptions.CursorStateError: If cursor ID is not set.
+        """
+        columns = make_columns(fields, dtypes)
+        async for batch in self.batches():
+            if not batch:
+                continue
+            positional = isinstance(batch[0], (list, tuple))
+            for index, column in enumerate(columns):
+                column.extend(batch, index if positional else column.name)
+        return {column.name: column for column in columns}
+
+    async def to_arrow(
+        self,
+        fields: Sequence[str],
+        dtypes: Optional[Union[Sequence[Optional[str]], Dict[str, str]]] = None,
+    ) -> Any:
+        """Fetch all remaining results into a pyarrow table.
+
+        See :func:`aioarango.cursor.Cursor.to_columns` for the parameters.
+        Requires the pyarrow package.
+
+        :return: Arrow table.
+        :rtype: pyarrow.Table
+        :raise ImportError: If pyarrow is not installed.
+        :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
+        :raise aioarango.exceptions.CursorStateError: If cursor ID is not set.
+        """
+        import pyarrow
+
+        columns = await self.to_columns(fields, dtypes)
+        return pyarrow.Table.from_arrays(
+            [column.to_arrow() for column in columns.values()], names=list(columns)
+        )
 
     async def close(self, ignore_missing: bool = False) -> Optional[bool]:
         """Close the cursor and free any server resources tied to it.
@@ -281,6 +833,15 @@ class Cursor:
         """
         if self._id is None:
             return None
+        self._report_stats()
+        self._conn.cursors.unregister(self)
+        if self._prefetch_task is not None:
+            task, self._prefetch_task = self._prefetch_task, None
+            if task.cancel():
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         request = Request(method="delete", endpoint=f"/_api/{self._type}/{self._id}")
         resp = await self._conn.send_request(request)
         if resp.is_success:
@@ -288,3 +849,239 @@ class Cursor:
         if resp.status_code == 404 and ignore_missing:
             return False
         raise CursorCloseError(resp, request)
+
+
+async def _prefetch(ref: "weakref.ReferenceType[Cursor]") -> None:
+    """Fetch batches of a cursor in the background until depleted.
+
+    At most as many batches as the prefetch limit are requested or buffered
+    at any time. To keep the cursor alive, one batch is fetched ahead even
+    with a prefetch limit of 0. A failed request is handed over to the
+    consumer and stops prefetching. The cursor is only referenced while a
+    request is sent, so that abandoned cursors are garbage collected.
+
+    :param ref: Weak reference to the cursor.
+    :type ref: weakref.ReferenceType
+    """
+    cursor = ref()
+    if cursor is None:
+        return
+    queue = cursor._prefetched
+    slots = cursor._prefetch_slots
+    limit = cursor._prefetch_limit
+    batch_id = cursor._next_batch_id
+    interval = None if cursor._keep_alive is None else cursor._keep_alive / 2
+    cursor = None
+
+    # Batch IDs are sequence numbers, only returned for retryable cursors.
+    current_id = None
+    if batch_id is not None and batch_id.isdigit():
+        current_id = str(int(batch_id) - 1)
+    refreshes = 0
+    has_more = True
+    while has_more:
+        cursor = None
+        if interval is None or refreshes >= KEEP_ALIVE_MAX_REFRESHES:
+            await slots.acquire()
+            refreshes = 0
+        else:
+            try:
+                await asyncio.wait_for(slots.acquire(), interval)
+                refreshes = 0
+            except asyncio.TimeoutError:
+                refreshes += 1
+                cursor = ref()
+                if cursor is None:
+                    return
+                if current_id is not None:
+                    # Requesting the current batch again resets the TTL.
+                    try:
+                        request, resp = await cursor._request_batch(current_id)
+                        if not resp.is_success:
+                            raise CursorNextError(resp, request)
+                    except Exception as err:
+                        queue.put_nowait(err)
+                        return
+                    continue
+                if queue.qsize() >= max(limit, 1):
+                    continue
+                cursor._prefetch_debt += 1
+
+        cursor = ref()
+        if cursor is None:
+            return
+        try:
+            with cursor._conn.tracer.span("arangodb.cursor.prefetch") as span:
+                request, resp = await cursor._request_batch(batch_id)
+                if not resp.is_success:
+                    raise CursorNextError(resp, request)
+                if span.is_recording:
+                    span.set_attribute("db.name", cursor._conn.db_name)
+                    span.set_attribute("arango.cursor_id", cursor._id)
+                    span.set_attribute("arango.batch_count", len(resp.body["result"]))
+        except Exception as err:
+            queue.put_nowait(err)
+            return
+        has_more = bool(resp.body["hasMore"])
+        current_id, batch_id = batch_id, resp.body.get("nextBatchId")
+        queue.put_nowait(resp.body)
+
+
+def _gzip_writer(stream: IO[bytes]) -> IO[bytes]:
+    """Return a stream compressing the data written to another stream.
+
+    :param stream: Binary stream receiving the compressed data.
+    :type stream: typing.BinaryIO
+    :return: Gzip stream.
+    :rtype: typing.BinaryIO
+    """
+    return gzip.GzipFile(fileobj=stream, mode="wb", compresslevel=6)
+
+
+def _csv_header(item: Any) -> List[str]:
+    """Return the default CSV columns for a result.
+
+    :param item: First result.
+    :type item: Any
+    :return: Document fields, array positions, or "value" for other results.
+    :rtype: [str]
+    """
+    if isinstance(item, dict):
+        return list(item)
+    if isinstance(item, (list, tuple)):
+        return [str(index) for index in range(len(item))]
+    return ["value"]
+
+
+def _csv_rows(
+    batch: List[Any], fields: Sequence[str], serialize: Callable[[Any], str]
+) -> Iterator[List[Any]]:
+    """Return the CSV rows of a result batch.
+
+    :param batch: Result batch of documents or of arrays.
+    :type batch: list
+    :param fields: CSV columns.
+    :type fields: [str]
+    :param serialize: JSON serializer for nested values.
+    :type serialize: callable
+    :return: CSV rows.
+    :rtype: typing.Iterator[list]
+    """
+    for item in batch:
+        if isinstance(item, dict):
+            values = [item.get(field) for field in fields]
+        elif isinstance(item, (list, tuple)):
+            values = list(item)
+        else:
+            values = [item]
+        for index, value in enumerate(values):
+            if isinstance(value, (dict, list)):
+                values[index] = serialize(value)
+        yield values
+
+
+async def _bounded_map(
+    items: AsyncIterator[Any],
+    fn: Callable[[Any], Awaitable[T]],
+    concurrency: int,
+    ordered: bool,
+) -> AsyncIterator[T]:
+    """Apply an async function to items with bounded concurrency.
+
+    :param items: Async iterator of items.
+    :type items: typing.AsyncIterator
+    :param fn: Function returning an awaitable.
+    :type fn: callable
+    :param concurrency: Max number of pending awaitables.
+    :type concurrency: int
+    :param ordered: Yield results in the order of the items.
+    :type ordered: bool
+    :return: Async iterator of results.
+    :rtype: typing.AsyncIterator
+    """
+    assert concurrency > 0, "concurrency must be a positive int"
+    tasks: Deque["asyncio.Future[T]"] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(tasks) < concurrency:
+                try:
+                    item = await items.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    tasks.append(asyncio.ensure_future(fn(item)))
+            if not tasks:
+                return
+            if ordered:
+                yield await tasks[0]
+                tasks.popleft()
+            else:
+                done, _ = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                tasks = deque(task for task in tasks if task not in done)
+                for task in done:
+                    yield task.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        aclose = getattr(items, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def merge_cursors(
+    cursors: Sequence[Cursor], buffer: int = 2
+) -> AsyncIterator[Any]:
+    """Iterate over the results of several cursors fetched concurrently.
+
+    Results are yielded in the order their batches arrive. Fetching pauses
+    while **buffer** batches per cursor (in total) are waiting. If any cursor fails,
+    the others are stopped and the error is raised. All cursors are closed
+    when the iteration ends.
+
+    :param cursors: Cursors to merge.
+    :type cursors: [aioarango.cursor.Cursor]
+    :param buffer: Number of buffered batches per cursor.
+    :type buffer: int
+    :return: Async iterator of results.
+    :rtype: typing.AsyncIterator
+    :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
+    """
+    queue: "asyncio.Queue[Union[List[Any], BaseException, None]]" = asyncio.Queue(
+        maxsize=buffer * max(len(cursors), 1)
+    )
+
+    async def produce(cursor: Cursor) -> None:
+        try:
+            async for batch in cursor.batches():
+                if batch:
+                    await queue.put(batch)
+        except Exception as err:
+            await queue.put(err)
+        else:
+            await queue.put(None)
+
+    tasks = [asyncio.ensure_future(produce(cursor)) for cursor in cursors]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            item = await queue.get()
+            if item is None:
+                remaining -= 1
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                for result in item:
+                    yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.gather(
+            *(cursor.close(ignore_missing=True) for cursor in cursors),
+            return_exceptions=True,
+        )
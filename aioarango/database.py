@@ -1,10 +1,12 @@
+import asyncio
 from datetime import datetime
 from numbers import Number
-from typing import Any, List, Optional, Sequence, Union
+from typing import Any, Awaitable, List, Optional, Sequence, Union
 
 from aioarango.api import ApiGroup
 from aioarango.aql import AQL
 from aioarango.backup import Backup
+from aioarango.cache import MetadataCache
 from aioarango.cluster import Cluster
 from aioarango.collection import StandardCollection
 from aioarango.connection import Connection
@@ -73,6 +75,7 @@ from aioarango.executor import (
     AsyncApiExecutor,
     BatchApiExecutor,
     DefaultApiExecutor,
+    DocumentBatcher,
     TransactionApiExecutor,
 )
 from aioarango.formatter import (
@@ -90,6 +93,7 @@ from aioarango.replication import Replication
 from aioarango.request import Request
 from aioarango.response import Response
 from aioarango.result import Result
+from aioarango.tracker import CursorTracker
 from aioarango.typings import Json, Jsons, Params
 from aioarango.utils import get_col_name
 from aioarango.wal import WAL
@@ -137,6 +141,18 @@ class Database(ApiGroup):
         """
         return AQL(self._conn, self._executor)
 
+    @property
+    def cursors(self) -> CursorTracker:
+        """Return the tracker of cursors open on the server.
+
+        The tracker is shared by all API wrappers of the same database
+        connection and reports how many cursors are open and for how long.
+
+        :return: Cursor tracker.
+        :rtype: aioarango.tracker.CursorTracker
+        """
+        return self._conn.cursors
+
     @property
     def wal(self) -> WAL:
         """Return WAL (Write-Ahead Log) API wrapper.
@@ -884,7 +900,7 @@ class Database(ApiGroup):
                 raise CollectionListError(resp, request)
             return any(col["name"] == name for col in resp.body["result"])
 
-        return await self._execute(request, response_handler)
+        return await self._execute_metadata(request, response_handler)
 
     async def collections(self) -> Result[Jsons]:
         """Return the collections in the database.
@@ -909,7 +925,7 @@ class Database(ApiGroup):
                 for col in resp.body["result"]
             ]
 
-        return await self._execute(request, response_handler)
+        return await self._execute_metadata(request, response_handler)
 
     async def create_collection(
         self,
@@ -1053,6 +1069,7 @@ class Database(ApiGroup):
         )
 
         def response_handler(resp: Response) -> StandardCollection:
+            self._invalidate_metadata("/_api/collection")
             if resp.is_success:
                 return self.collection(name)
             raise CollectionCreateError(resp, request)
@@ -1084,10 +1101,18 @@ class Database(ApiGroup):
         )
 
         def response_handler(resp: Response) -> bool:
+            self._invalidate_metadata(
+                "/_api/collection",
+                f"/_api/collection/{name}/properties",
+                f"/_api/index?collection={name}",
+            )
             if resp.error_code == 1203 and ignore_missing:
                 return False
             if not resp.is_success:
                 raise CollectionDeleteError(resp, request)
+            self._conn.document_caches.pop(name, None)
+            if self._conn.result_cache is not None:
+                self._conn.result_cache.invalidate([name])
             return True
 
         return await self._execute(request, response_handler)
@@ -1121,7 +1146,7 @@ class Database(ApiGroup):
                 raise GraphListError(resp, request)
             return any(name == graph["_key"] for graph in resp.body["graphs"])
 
-        return await self._execute(request, response_handler)
+        return await self._execute_metadata(request, response_handler)
 
     async def graphs(self) -> Result[Jsons]:
         """List all graphs in the database.
@@ -1155,7 +1180,7 @@ class Database(ApiGroup):
                 for body in resp.body["graphs"]
             ]
 
-        return await self._execute(request, response_handler)
+        return await self._execute_metadata(request, response_handler)
 
     async def create_graph(
         self,
@@ -1229,6 +1254,12 @@ class Database(ApiGroup):
         request = Request(method="post", endpoint="/_api/gharial", data=data)
 
         def response_handler(resp: Response) -> Graph:
+            self._invalidate_metadata(
+                "/_api/collection",
+                "/_api/gharial",
+                f"/_api/gharial/{name}",
+                f"/_api/gharial/{name}/vertex",
+            )
             if resp.is_success:
                 return Graph(self._conn, self._executor, name)
             raise GraphCreateError(resp, request)
@@ -1264,6 +1295,12 @@ class Database(ApiGroup):
         )
 
         def response_handler(resp: Response) -> bool:
+            self._invalidate_metadata(
+                "/_api/collection",
+                "/_api/gharial",
+                f"/_api/gharial/{name}",
+                f"/_api/gharial/{name}/vertex",
+            )
             if resp.error_code == 1924 and ignore_missing:
                 return False
             if not resp.is_success:
@@ -2047,7 +2084,7 @@ class Database(ApiGroup):
                 return [format_view(view) for view in resp.body["result"]]
             raise ViewListError(resp, request)
 
-        return await self._execute(request, response_handler)
+        return await self._execute_metadata(request, response_handler)
 
     async def view(self, name: str) -> Result[Json]:
         """Return view details.
@@ -2089,6 +2126,7 @@ class Database(ApiGroup):
         request = Request(method="post", endpoint="/_api/view", data=data)
 
         def response_handler(resp: Response) -> Json:
+            self._invalidate_metadata("/_api/view")
             if resp.is_success:
                 return format_view(resp.body)
             raise ViewCreateError(resp, request)
@@ -2160,6 +2198,7 @@ class Database(ApiGroup):
         request = Request(method="delete", endpoint=f"/_api/view/{name}")
 
         def response_handler(resp: Response) -> bool:
+            self._invalidate_metadata("/_api/view")
             if resp.error_code == 1203 and ignore_missing:
                 return False
             if resp.is_success:
@@ -2186,6 +2225,7 @@ class Database(ApiGroup):
         )
 
         def response_handler(resp: Response) -> bool:
+            self._invalidate_metadata("/_api/view")
             if resp.is_success:
                 return True
             raise ViewRenameError(resp, request)
@@ -2218,6 +2258,7 @@ class Database(ApiGroup):
         request = Request(method="post", endpoint="/_api/view#ArangoSearch", data=data)
 
         def response_handler(resp: Response) -> Json:
+            self._invalidate_metadata("/_api/view")
             if resp.is_success:
                 return format_view(resp.body)
             raise ViewCreateError(resp, request)
@@ -2385,14 +2426,119 @@ class Database(ApiGroup):
 
 
 class StandardDatabase(Database):
-    """Standard database API wrapper."""
+    """Standard database API wrapper.
 
-    def __init__(self, connection: Connection) -> None:
-        super().__init__(connection=connection, executor=DefaultApiExecutor(connection))
+    :param connection: HTTP connection.
+    :param coalesce_reads: If set to True, identical concurrent read requests
+        share one HTTP call.
+    :type coalesce_reads: bool
+    :param auto_batch: If set to True, concurrent single-document operations
+        are merged into bulk requests (see
+        :class:`aioarango.executor.DocumentBatcher`).
+    :type auto_batch: bool
+    :param auto_batch_window: Max number of seconds an operation waits to be
+        batched with others.
+    :type auto_batch_window: float
+    :param auto_batch_size: Max number of operations per bulk request.
+    :type auto_batch_size: int
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        coalesce_reads: bool = False,
+        auto_batch: bool = False,
+        auto_batch_window: float = 0.001,
+        auto_batch_size: int = 100,
+    ) -> None:
+        batcher = None
+        if auto_batch:
+            batcher = DocumentBatcher(connection, auto_batch_window, auto_batch_size)
+        self._executor: DefaultApiExecutor
+        super().__init__(
+            connection=connection,
+            executor=DefaultApiExecutor(connection, coalesce_reads, batcher),
+        )
 
     def __repr__(self) -> str:
         return f"<StandardDatabase {self.name}>"
 
+    @property
+    def metadata_cache(self) -> Optional[MetadataCache]:
+        """Return the metadata cache.
+
+        :return: Metadata cache, or None if it is not enabled.
+        :rtype: aioarango.cache.MetadataCache | None
+        """
+        return self._conn.metadata_cache
+
+    def enable_metadata_cache(self, ttl: Optional[float] = 60.0) -> MetadataCache:
+        """Start caching metadata read through this client.
+
+        Collection lists, collection properties, indexes, graphs, graph
+        properties and view lists are served from the cache until their TTL
+        expires. Cached metadata is invalidated when this client changes it
+        (e.g. creates or deletes collections, graphs, views or indexes). The
+        cache is shared by all API wrappers of the same database connection
+        and is used only outside of async execution, batch execution and
+        transactions. Calling this method again replaces the existing cache.
+
+        :param ttl: Number of seconds metadata is served from the cache. If
+            set to None, metadata is refreshed only when changed through this
+            client or invalidated explicitly.
+        :type ttl: float | None
+        :return: Metadata cache.
+        :rtype: aioarango.cache.MetadataCache
+        """
+        cache = MetadataCache(ttl)
+        self._conn.metadata_cache = cache
+        return cache
+
+    def disable_metadata_cache(self) -> None:
+        """Stop caching metadata and discard the metadata cache."""
+        self._conn.metadata_cache = None
+
+    async def warm_metadata_cache(
+        self, system: bool = False, concurrency: int = 10
+    ) -> MetadataCache:
+        """Load all cached metadata of the database in a single pass.
+
+        Any cached metadata is discarded first, so this method can also be
+        used to refresh the cache explicitly. If the metadata cache is not
+        enabled, it is enabled with default settings.
+
+        :param system: Also load properties and indexes of system collections.
+        :type system: bool
+        :param concurrency: Max number of concurrent requests.
+        :type concurrency: int
+        :return: Metadata cache.
+        :rtype: aioarango.cache.MetadataCache
+        :raise aioarango.exceptions.ArangoServerError: If retrieval fails.
+        """
+        cache = self._conn.metadata_cache or self.enable_metadata_cache()
+        cache.invalidate()
+
+        collections, graphs, _ = await asyncio.gather(
+            self.collections(), self.graphs(), self.views()
+        )
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def load(coroutine: Awaitable[Any]) -> None:
+            async with semaphore:
+                await coroutine
+
+        loads = []
+        for col in collections:
+            if system or not col["system"]:
+                collection = self.collection(col["name"])
+                loads.append(load(collection.properties()))
+                loads.append(load(collection.indexes()))
+        for graph in graphs:
+            loads.append(load(self.graph(graph["name"]).properties()))
+        await asyncio.gather(*loads)
+        return cache
+
     def begin_async_execution(self, return_result: bool = True) -> "AsyncDatabase":
         """Begin async execution.
 
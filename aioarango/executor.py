@@ -1,5 +1,19 @@
+import asyncio
 from collections import OrderedDict
-from typing import Any, Callable, Optional, Sequence, Tuple, TypeVar, Union
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from urllib.parse import urlencode
 from uuid import uuid4
 
@@ -29,21 +43,367 @@ ApiExecutor = Union[
 T = TypeVar("T")
 
 
+class RequestCoalescer:
+    """Shares one in-flight HTTP call between identical concurrent reads.
+
+    Requests are identical if they have the same method, endpoint, parameters,
+    headers and database. Only safe methods ("get" and "head") are coalesced.
+    Every caller receives its own response object with a separately
+    deserialized body, so response handlers can modify it freely.
+
+    :param connection: HTTP connection.
+    :type connection: aioarango.connection.BasicConnection |
+        aioarango.connection.JwtConnection | aioarango.connection.JwtSuperuserConnection
+
+    :ivar requests: Number of requests sent to the server.
+    :vartype requests: int
+    :ivar coalesced: Number of requests served by another in-flight request.
+    :vartype coalesced: int
+    """
+
+    safe_methods = frozenset(["get", "head"])
+
+    def __init__(self, connection: Connection) -> None:
+        self._conn = connection
+        self._inflight: Dict[Hashable, "asyncio.Future[Response]"] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    def _key(self, request: Request) -> Hashable:
+        return (
+            self._conn.db_name,
+            request.method,
+            request.endpoint,
+            tuple(sorted(request.params.items())),
+            tuple(sorted(request.headers.items())),
+            request.deserialize,
+        )
+
+    def _done(self, key: Hashable, task: "asyncio.Future[Response]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled.
+            task.exception()
+
+    def _copy(self, resp: Response, deserialize: bool) -> Response:
+        clone = Response(
+            method=resp.method,
+            url=resp.url,
+            headers=resp.headers,
+            status_code=resp.status_code,
+            status_text=resp.status_text,
+            raw_body=resp.raw_body,
+        )
+        return self._conn.prep_response(clone, deserialize)
+
+    async def send_request(self, request: Request) -> Response:
+        """Send the request, or join an identical request already in flight.
+
+        :param request: HTTP request.
+        :type request: aioarango.request.Request
+        :return: HTTP response.
+        :rtype: aioarango.response.Response
+        """
+        if request.method not in self.safe_methods:
+            return await self._conn.send_request(request)
+
+        key = self._key(request)
+        task = self._inflight.get(key)
+        if task is None:
+            self.requests += 1
+            task = asyncio.ensure_future(self._conn.send_request(request))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._done, key))
+            # Shielded so that a cancelled caller does not fail the others.
+            return await asyncio.shield(task)
+
+        self.coalesced += 1
+        resp = await asyncio.shield(task)
+        return self._copy(resp, request.deserialize)
+
+
+class _PendingBatch:
+    """Single-document operations waiting to be dispatched together."""
+
+    __slots__ = ("op", "collection", "params", "items", "handle")
+
+    def __init__(self, op: str, collection: str, params: Dict[str, str]) -> None:
+        self.op = op
+        self.collection = collection
+        self.params = params
+        self.items: List[Tuple[Request, Any, "asyncio.Future[Response]"]] = []
+        self.handle: Optional[asyncio.TimerHandle] = None
+
+
+class DocumentBatcher:
+    """Merges concurrent single-document operations into bulk requests.
+
+    Document reads, inserts, updates, replacements and deletes issued by
+    independent coroutines within **window** seconds are collected per
+    collection and operation (with identical parameters) and sent as one
+    bulk request, the same way :func:`aioarango.collection.Collection.get_many`,
+    :func:`aioarango.collection.Collection.insert_many`,
+    :func:`aioarango.collection.Collection.update_many`,
+    :func:`aioarango.collection.Collection.replace_many` and
+    :func:`aioarango.collection.Collection.delete_many` do. Each caller
+    receives its own response, so results and errors (e.g. missing documents
+    or revision conflicts) are reported exactly as for single requests.
+
+    Requests with **silent** set, document reads with revision checks and
+    operations on graph collections are never batched.
+
+    :param connection: HTTP connection.
+    :type connection: aioarango.connection.BasicConnection |
+        aioarango.connection.JwtConnection | aioarango.connection.JwtSuperuserConnection
+    :param window: Max number of seconds an operation waits for others.
+    :type window: float
+    :param max_size: Max number of operations per bulk request. A batch is
+        dispatched immediately once it is full.
+    :type max_size: int
+
+    :ivar requests: Number of requests sent to the server.
+    :vartype requests: int
+    :ivar batched: Number of operations sent as part of a bulk request.
+    :vartype batched: int
+    """
+
+    # Status codes of single-document responses for bulk item error numbers.
+    error_status = {1200: 412, 1202: 404, 1203: 404, 1210: 409}
+
+    def __init__(
+        self, connection: Connection, window: float = 0.001, max_size: int = 100
+    ) -> None:
+        self._conn = connection
+        self._window = window
+        self._max_size = max_size
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+        self._tasks: Set["asyncio.Future[None]"] = set()
+        self.requests = 0
+        self.batched = 0
+
+    def _classify(self, request: Request) -> Optional[Tuple[str, str, Any]]:
+        """Return the operation, collection and bulk item of the request.
+
+        :return: Operation details, or None if the request cannot be batched.
+        :rtype: (str, str, str | dict) | None
+        """
+        if not request.endpoint.startswith("/_api/document/"):
+            return None
+        if request.params.get("silent") == "1":
+            return None
+
+        handle = request.endpoint[len("/_api/document/") :]
+        collection, _, key = handle.partition("/")
+        headers = set(request.headers) - {"charset", "content-type"}
+        method = request.method
+
+        if method == "post":
+            if key or not isinstance(request.data, dict):
+                return None
+            return "insert", collection, request.data
+        if not key or "/" in key:
+            return None
+        if method == "get":
+            if headers or request.params:
+                return None
+            return "get", collection, key
+        if method in ("patch", "put"):
+            if headers or not isinstance(request.data, dict):
+                return None
+            data = request.data
+            if data.get("_key") != key:
+                data = dict(data, _key=key)
+            return ("update" if method == "patch" else "replace"), collection, data
+        if method == "delete":
+            if headers - {"if-match"} or request.data is not None:
+                return None
+            item = {"_key": key}
+            if "if-match" in request.headers:
+                item["_rev"] = request.headers["if-match"]
+            return "delete", collection, item
+        return None
+
+    def batchable(self, request: Request) -> bool:
+        """Return True if the request can be merged into a bulk request.
+
+        :param request: HTTP request.
+        :type request: aioarango.request.Request
+        :return: True if the request can be batched.
+        :rtype: bool
+        """
+        return self._classify(request) is not None
+
+    async def send_request(self, request: Request) -> Response:
+        """Send the request, batched with concurrent operations if possible.
+
+        :param request: HTTP request.
+        :type request: aioarango.request.Request
+        :return: HTTP response.
+        :rtype: aioarango.response.Response
+        """
+        operation = self._classify(request)
+        if operation is None:
+            self.requests += 1
+            return await self._conn.send_request(request)
+
+        op, collection, item = operation
+        key = (self._conn.db_name, op, collection, tuple(sorted(request.params.items())))
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _PendingBatch(op, collection, request.params)
+            batch.handle = asyncio.get_event_loop().call_later(
+                self._window, self._flush, key
+            )
+            self._pending[key] = batch
+
+        future: "asyncio.Future[Response]" = asyncio.get_event_loop().create_future()
+        batch.items.append((request, item, future))
+        if len(batch.items) >= self._max_size:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: Hashable) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.handle is not None:
+            batch.handle.cancel()
+        task = asyncio.ensure_future(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: _PendingBatch) -> None:
+        # Operations of callers cancelled in the meantime are dropped.
+        items = [entry for entry in batch.items if not entry[2].done()]
+        if not items:
+            return
+
+        if len(items) == 1:
+            request = items[0][0]
+        elif batch.op == "get":
+            request = Request(
+                method="post",
+                endpoint="/_api/cursor",
+                data={
+                    "query": "RETURN DOCUMENT(@collection, @keys)",
+                    "bindVars": {
+                        "collection": batch.collection,
+                        "keys": [item for _, item, _ in items],
+                    },
+                },
+            )
+        else:
+            request = Request(
+                method=items[0][0].method,
+                endpoint=f"/_api/document/{batch.collection}",
+                params=batch.params,
+                data=[item for _, item, _ in items],
+            )
+
+        self.requests += 1
+        try:
+            resp = await self._conn.send_request(request)
+        except asyncio.CancelledError:
+            for _, _, future in items:
+                future.cancel()
+            raise
+        except Exception as err:
+            for _, _, future in items:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        if len(items) == 1 or not resp.is_success:
+            for _, _, future in items:
+                if not future.done():
+                    future.set_result(resp)
+            return
+
+        self.batched += len(items)
+        if batch.op == "get":
+            docs = {doc["_key"]: doc for doc in resp.body["result"][0]}
+            bodies = [docs.get(key) for _, key, _ in items]
+        else:
+            bodies = resp.body
+
+        for (sub_request, _, future), body in zip(items, bodies):
+            if not future.done():
+                future.set_result(self._split(resp, sub_request, body))
+
+    def _split(self, parent: Response, request: Request, body: Optional[Json]) -> Response:
+        """Build the single-document response for one bulk result item."""
+        if body is None:
+            body = {
+                "error": True,
+                "errorNum": 1202,
+                "errorMessage": "document not found",
+            }
+        if body.get("error") is True:
+            status_code = self.error_status.get(body.get("errorNum"), 400)
+            body.setdefault("code", status_code)
+        elif request.method == "get":
+            status_code = 200
+        else:
+            status_code = parent.status_code
+
+        resp = Response(
+            method=request.method,
+            url=parent.url,
+            headers=parent.headers,
+            status_code=status_code,
+            status_text=parent.status_text,
+            raw_body=self._conn.serialize(body),
+        )
+        return self._conn.prep_response(resp)
+
+
 class DefaultApiExecutor:
     """Default API executor.
 
     :param connection: HTTP connection.
     :type connection: aioarango.connection.BasicConnection |
         aioarango.connection.JwtConnection | aioarango.connection.JwtSuperuserConnection
+    :param coalesce_reads: If set to True, identical concurrent read requests
+        share one HTTP call (see :class:`aioarango.executor.RequestCoalescer`).
+    :type coalesce_reads: bool
+    :param batcher: Batcher merging concurrent single-document operations into
+        bulk requests. If not set, operations are sent individually.
+    :type batcher: aioarango.executor.DocumentBatcher | None
     """
 
-    def __init__(self, connection: Connection) -> None:
+    def __init__(
+        self,
+        connection: Connection,
+        coalesce_reads: bool = False,
+        batcher: Optional[DocumentBatcher] = None,
+    ) -> None:
         self._conn = connection
+        self._coalescer = RequestCoalescer(connection) if coalesce_reads else None
+        self._batcher = batcher
 
     @property
     def context(self) -> str:
         return "default"
 
+    @property
+    def coalescer(self) -> Optional[RequestCoalescer]:
+        """Return the request coalescer.
+
+        :return: Request coalescer, or None if coalescing is disabled.
+        :rtype: aioarango.executor.RequestCoalescer | None
+        """
+        return self._coalescer
+
+    @property
+    def batcher(self) -> Optional[DocumentBatcher]:
+        """Return the document batcher.
+
+        :return: Document batcher, or None if automatic batching is disabled.
+        :rtype: aioarango.executor.DocumentBatcher | None
+        """
+        return self._batcher
+
     async def execute(self, request: Request, response_handler: Callable[[Response], T]) -> T:
         """Execute an API request and return the result.
 
@@ -53,7 +413,12 @@ class DefaultApiExecutor:
         :type response_handler: callable
         :return: API execution result.
         """
-        resp = await self._conn.send_request(request)
+        if self._batcher is not None and self._batcher.batchable(request):
+            resp = await self._batcher.send_request(request)
+        elif self._coalescer is not None:
+            resp = await self._coalescer.send_request(request)
+        else:
+            resp = await self._conn.send_request(request)
         return response_handler(resp)
 
 
@@ -218,8 +583,11 @@ class BatchApiExecutor:
             headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
             data="\r\n".join(buffer),
         )
-        with suppress_warning("requests.packages.urllib3.connectionpool"):
-            resp = await self._conn.send_request(request)
+        with self._conn.tracer.span("arangodb.batch.commit") as span:
+            span.set_attribute("db.name", self._conn.db_name)
+            span.set_attribute("arango.batch_jobs", len(self._queue))
+            with suppress_warning("requests.packages.urllib3.connectionpool"):
+                resp = await self._conn.send_request(request)
 
         if not resp.is_success:
             raise BatchExecuteError(resp, request)
@@ -271,6 +639,7 @@ class TransactionApiExecutor:
     def __init__(self, connection: Connection):
         self._conn = connection
         self._id = None
+        self._written: List[str] = []
 
     async def begin(
         self,
@@ -323,13 +692,21 @@ class TransactionApiExecutor:
             data["maxTransactionSize"] = max_size
 
         request = Request(method="post", endpoint="/_api/transaction/begin", data=data)
-        resp = await self._conn.send_request(request)
+        with self._conn.tracer.span("arangodb.transaction.begin") as span:
+            span.set_attribute("db.name", self._conn.db_name)
+            resp = await self._conn.send_request(request)
 
         if not resp.is_success:
             raise TransactionInitError(resp, request)
 
         result: Json = resp.body["result"]
         self._id: str = result["id"]
+        self._written = [
+            name
+            for names in (write, exclusive)
+            if names is not None
+            for name in ([names] if isinstance(names, str) else names)
+        ]
 
     @property
     def context(self) -> str:
@@ -385,9 +762,19 @@ class TransactionApiExecutor:
             method="put",
             endpoint=f"/_api/transaction/{self._id}",
         )
-        resp = await self._conn.send_request(request)
+        with self._conn.tracer.span("arangodb.transaction.commit") as span:
+            span.set_attribute("db.name", self._conn.db_name)
+            span.set_attribute("arango.transaction_id", self._id)
+            resp = await self._conn.send_request(request)
 
         if resp.is_success:
+            # Reads outside of the transaction may have cached replaced data.
+            for name in self._written:
+                cache = self._conn.document_caches.get(name)
+                if cache is not None:
+                    cache.invalidate()
+            if self._conn.result_cache is not None and self._written:
+                self._conn.result_cache.invalidate(self._written)
             return True
         raise TransactionCommitError(resp, request)
 
@@ -402,7 +789,10 @@ class TransactionApiExecutor:
             method="delete",
             endpoint=f"/_api/transaction/{self._id}",
         )
-        resp = await self._conn.send_request(request)
+        with self._conn.tracer.span("arangodb.transaction.abort") as span:
+            span.set_attribute("db.name", self._conn.db_name)
+            span.set_attribute("arango.transaction_id", self._id)
+            resp = await self._conn.send_request(request)
 
         if resp.is_success:
             return True
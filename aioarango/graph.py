@@ -55,6 +55,15 @@ class Graph(ApiGroup):
         """
         return self.edge_collection(get_col_name(edge))
 
+    def _invalidate_graph_metadata(self) -> None:
+        """Discard cached metadata changed by a change of the graph layout."""
+        self._invalidate_metadata(
+            "/_api/collection",
+            "/_api/gharial",
+            f"/_api/gharial/{self._name}",
+            f"/_api/gharial/{self._name}/vertex",
+        )
+
     @property
     def name(self) -> str:
         """Return the graph name.
@@ -78,7 +87,7 @@ class Graph(ApiGroup):
                 return format_graph_properties(resp.body["graph"])
             raise GraphPropertiesError(resp, request)
 
-        return await self._execute(request, response_handler)
+        return await self._execute_metadata(request, response_handler)
 
     ################################
     # Vertex Collection Management #
@@ -102,7 +111,7 @@ class Graph(ApiGroup):
                 return name in resp.body["collections"]
             raise VertexCollectionListError(resp, request)
 
-        return await self._execute(request, response_handler)
+        return await self._execute_metadata(request, response_handler)
 
     async def vertex_collections(self) -> Result[List[str]]:
         """Return vertex collections in the graph that are not orphaned.
@@ -121,7 +130,7 @@ class Graph(ApiGroup):
                 raise VertexCollectionListError(resp, request)
             return sorted(set(resp.body["collections"]))
 
-        return await self._execute(request, response_handler)
+        return await self._execute_metadata(request, response_handler)
 
     def vertex_collection(self, name: str) -> VertexCollection:
         """Return the vertex collection API wrapper.
@@ -149,6 +158,7 @@ class Graph(ApiGroup):
         )
 
         def response_handler(resp: Response) -> VertexCollection:
+            self._invalidate_graph_metadata()
             if resp.is_success:
                 return self.vertex_collection(name)
             raise VertexCollectionCreateError(resp, request)
@@ -174,6 +184,7 @@ class Graph(ApiGroup):
         )
 
         def response_handler(resp: Response) -> bool:
+            self._invalidate_graph_metadata()
             if resp.is_success:
                 return True
             raise VertexCollectionDeleteError(resp, request)
@@ -204,7 +215,7 @@ class Graph(ApiGroup):
                 for edge_definition in body["edgeDefinitions"]
             )
 
-        return await self._execute(request, response_handler)
+        return await self._execute_metadata(request, response_handler)
 
     async def has_edge_collection(self, name: str) -> Result[bool]:
         """Check if the graph has the given edge collection.
@@ -249,7 +260,7 @@ class Graph(ApiGroup):
                 for edge_definition in body["edgeDefinitions"]
             ]
 
-        return await self._execute(request, response_handler)
+        return await self._execute_metadata(request, response_handler)
 
     async def create_edge_definition(
         self,
@@ -291,6 +302,7 @@ class Graph(ApiGroup):
         )
 
         def response_handler(resp: Response) -> EdgeCollection:
+            self._invalidate_graph_metadata()
             if resp.is_success:
                 return self.edge_collection(edge_collection)
             raise EdgeDefinitionCreateError(resp, request)
@@ -326,6 +338,7 @@ class Graph(ApiGroup):
         )
 
         def response_handler(resp: Response) -> EdgeCollection:
+            self._invalidate_graph_metadata()
             if resp.is_success:
                 return self.edge_collection(edge_collection)
             raise EdgeDefinitionReplaceError(resp, request)
@@ -352,6 +365,7 @@ class Graph(ApiGroup):
         )
 
         def response_handler(resp: Response) -> bool:
+            self._invalidate_graph_metadata()
             if resp.is_success:
                 return True
             raise EdgeDefinitionDeleteError(resp, request)
@@ -0,0 +1,600 @@
+import asyncio
+import logging
+import math
+import re
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Labels = Tuple[Tuple[str, str], ...]
+SeriesKey = Tuple[str, Labels]
+
+_LABEL_RE = re.compile(r'\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*"((?:[^"\\]|\\.)*)"\s*,?')
+_ESCAPE_RE = re.compile(r"\\(.)")
+_ESCAPES = {"n": "\n", "\\": "\\", '"': '"'}
+
+
+def _unescape(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return _ESCAPE_RE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), value)
+
+
+def _parse_value(value: str) -> float:
+    if value == "+Inf":
+        return math.inf
+    if value == "-Inf":
+        return -math.inf
+    return float(value)
+
+
+def _matches(labels: Labels, selector: Dict[str, str]) -> bool:
+    if not selector:
+        return True
+    label_map = dict(labels)
+    return all(label_map.get(k) == v for k, v in selector.items())
+
+
+class MetricSample:
+    """Single sample (time series value) of a metric.
+
+    :param name: Sample name (e.g. "arangodb_client_connection_statistics_sum").
+    :type name: str
+    :param labels: Sample labels sorted by name.
+    :type labels: tuple
+    :param value: Sample value.
+    :type value: float
+    """
+
+    __slots__ = ("name", "labels", "value")
+
+    def __init__(self, name: str, labels: Labels, value: float) -> None:
+        self.name = name
+        self.labels = labels
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"<MetricSample {self.name} {dict(self.labels)} {self.value}>"
+
+
+class MetricFamily:
+    """Metric family with all of its samples.
+
+    :param name: Metric name.
+    :type name: str
+    :param type: Metric type ("counter", "gauge", "histogram", "summary" or
+        "untyped").
+    :type type: str
+    :param help: Metric description.
+    :type help: str
+    """
+
+    __slots__ = ("name", "type", "help", "samples")
+
+    def __init__(self, name: str, type: str = "untyped", help: str = "") -> None:
+        self.name = name
+        self.type = type
+        self.help = help
+        self.samples: List[MetricSample] = []
+
+    def __repr__(self) -> str:
+        return f"<MetricFamily {self.name} {self.type}>"
+
+
+class Histogram:
+    """Histogram with cumulative buckets.
+
+    :param name: Metric name.
+    :type name: str
+    :param labels: Labels of the histogram series, without "le".
+    :type labels: tuple
+    :param buckets: Upper bounds and cumulative counts, sorted by upper bound.
+    :type buckets: [(float, float)]
+    :param sum: Sum of observed values.
+    :type sum: float
+    :param count: Number of observed values.
+    :type count: float
+    """
+
+    __slots__ = ("name", "labels", "buckets", "sum", "count")
+
+    def __init__(
+        self,
+        name: str,
+        labels: Labels,
+        buckets: List[Tuple[float, float]],
+        sum: float = 0.0,
+        count: float = 0.0,
+    ) -> None:
+        self.name = name
+        self.labels = labels
+        self.buckets = buckets
+        self.sum = sum
+        self.count = count
+
+    def __repr__(self) -> str:
+        return f"<Histogram {self.name} {dict(self.labels)} count={self.count}>"
+
+    def __add__(self, other: "Histogram") -> "Histogram":
+        counts = dict(self.buckets)
+        for bound, value in other.buckets:
+            counts[bound] = counts.get(bound, 0.0) + value
+        return Histogram(
+            self.name,
+            self.labels,
+            sorted(counts.items()),
+            self.sum + other.sum,
+            self.count + other.count,
+        )
+
+    def __sub__(self, other: "Histogram") -> "Histogram":
+        previous = dict(other.buckets)
+        count = self.count - other.count
+        if count < 0:  # counter reset
+            return self
+        return Histogram(
+            self.name,
+            self.labels,
+            [(b, max(v - previous.get(b, 0.0), 0.0)) for b, v in self.buckets],
+            self.sum - other.sum,
+            count,
+        )
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Return the mean of observed values.
+
+        :return: Mean, or None if nothing was observed.
+        :rtype: float | None
+        """
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by linear interpolation within buckets.
+
+        This follows the behaviour of Prometheus ``histogram_quantile``.
+
+        :param q: Quantile between 0 and 1.
+        :type q: float
+        :return: Estimated quantile, or None if nothing was observed.
+        :rtype: float | None
+        """
+        if not self.buckets:
+            return None
+        total = self.buckets[-1][1]
+        if total <= 0:
+            return None
+        rank = q * total
+        lower_bound, lower_count = 0.0, 0.0
+        for index, (bound, value) in enumerate(self.buckets):
+            if value >= rank:
+                if math.isinf(bound):
+                    return self.buckets[index - 1][0] if index > 0 else None
+                if index == 0 and bound <= 0:
+                    return bound
+                if value == lower_count:
+                    return bound
+                return lower_bound + (bound - lower_bound) * (
+                    (rank - lower_count) / (value - lower_count)
+                )
+            lower_bound, lower_count = bound, value
+        return self.buckets[-1][0]
+
+
+def parse_metrics(text: str) -> Dict[str, MetricFamily]:
+    """Parse metrics in Prometheus text exposition format.
+
+    :param text: Metrics text, e.g. returned by
+        :func:`aioarango.database.Database.metrics`.
+    :type text: str
+    :return: Metric families by name.
+    :rtype: {str: aioarango.metrics.MetricFamily}
+    """
+    families: Dict[str, MetricFamily] = {}
+    suffixes = ("_bucket", "_sum", "_count", "_total")
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+
+        if line[0] == "#":
+            parts = line.split(None, 3)
+            if len(parts) >= 3 and parts[1] in ("TYPE", "HELP"):
+                family = families.get(parts[2])
+                if family is None:
+                    family = families[parts[2]] = MetricFamily(parts[2])
+                if parts[1] == "TYPE":
+                    family.type = parts[3].strip() if len(parts) > 3 else "untyped"
+                else:
+                    family.help = parts[3] if len(parts) > 3 else ""
+            continue
+
+        brace = line.find("{")
+        if brace == -1:
+            name, _, rest = line.partition(" ")
+            labels: Labels = ()
+        else:
+            name = line[:brace]
+            pairs = []
+            pos = brace + 1
+            while True:
+                match = _LABEL_RE.match(line, pos)
+                if match is None:
+                    break
+                pairs.append((match.group(1), _unescape(match.group(2))))
+                pos = match.end()
+            end = line.find("}", pos)
+            if end == -1:
+                continue
+            rest = line[end + 1 :]
+            labels = tuple(sorted(pairs))
+
+        fields = rest.split()
+        if not fields:
+            continue
+        try:
+            value = _parse_value(fields[0])
+        except ValueError:
+            continue
+
+        family = families.get(name)
+        if family is None:
+            for suffix in suffixes:
+                if name.endswith(suffix) and name[: -len(suffix)] in families:
+                    family = families[name[: -len(suffix)]]
+                    break
+            else:
+                family = families[name] = MetricFamily(name)
+        family.samples.append(MetricSample(name, labels, value))
+
+    return families
+
+
+class MetricsSnapshot:
+    """Parsed metrics at a point in time.
+
+    If the previous snapshot is given, per-second rates of counters and
+    histogram deltas over the interval between the two snapshots are
+    available as well.
+
+    :param families: Parsed metric families.
+    :type families: {str: aioarango.metrics.MetricFamily}
+    :param timestamp: Time the metrics were retrieved, in seconds since the
+        epoch. Defaults to the current time.
+    :type timestamp: float | None
+    :param previous: Previous snapshot of the same server.
+    :type previous: aioarango.metrics.MetricsSnapshot | None
+    """
+
+    def __init__(
+        self,
+        families: Dict[str, MetricFamily],
+        timestamp: Optional[float] = None,
+        previous: Optional["MetricsSnapshot"] = None,
+    ) -> None:
+        self.families = families
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self._values: Dict[SeriesKey, float] = {}
+        self._histograms: Dict[SeriesKey, Histogram] = {}
+        self._types: Dict[str, str] = {}
+
+        for family in families.values():
+            if family.type == "histogram":
+                self._index_histogram(family)
+            else:
+                self._types[family.name] = family.type
+                for sample in family.samples:
+                    self._values[(sample.name, sample.labels)] = sample.value
+                    self._types[sample.name] = family.type
+
+        # Only the previous values are kept (not the snapshot itself), so that
+        # a chain of snapshots does not grow without bound.
+        if previous is None:
+            self._prev_timestamp: Optional[float] = None
+            self._prev_values: Dict[SeriesKey, float] = {}
+            self._prev_histograms: Dict[SeriesKey, Histogram] = {}
+        else:
+            self._prev_timestamp = previous.timestamp
+            self._prev_values = previous._values
+            self._prev_histograms = previous._histograms
+
+    def __repr__(self) -> str:
+        return f"<MetricsSnapshot {len(self.families)} metrics>"
+
+    @classmethod
+    def from_text(
+        cls,
+        text: str,
+        timestamp: Optional[float] = None,
+        previous: Optional["MetricsSnapshot"] = None,
+    ) -> "MetricsSnapshot":
+        """Parse Prometheus text and return a snapshot.
+
+        :param text: Metrics in Prometheus text format.
+        :type text: str
+        :param timestamp: Time the metrics were retrieved.
+        :type timestamp: float | None
+        :param previous: Previous snapshot of the same server.
+        :type previous: aioarango.metrics.MetricsSnapshot | None
+        :return: Metrics snapshot.
+        :rtype: aioarango.metrics.MetricsSnapshot
+        """
+        return cls(parse_metrics(text), timestamp, previous)
+
+    def _index_histogram(self, family: MetricFamily) -> None:
+        bucket_name = family.name + "_bucket"
+        histograms: Dict[Labels, Histogram] = {}
+
+        for sample in family.samples:
+            if sample.name == bucket_name:
+                le = None
+                labels = []
+                for key, value in sample.labels:
+                    if key == "le":
+                        le = value
+                    else:
+                        labels.append((key, value))
+                if le is None:
+                    continue
+                series = tuple(labels)
+                hist = histograms.get(series)
+                if hist is None:
+                    hist = histograms[series] = Histogram(family.name, series, [])
+                hist.buckets.append((_parse_value(le), sample.value))
+            else:
+                hist = histograms.get(sample.labels)
+                if hist is None:
+                    hist = Histogram(family.name, sample.labels, [])
+                    histograms[sample.labels] = hist
+                if sample.name.endswith("_sum"):
+                    hist.sum = sample.value
+                elif sample.name.endswith("_count"):
+                    hist.count = sample.value
+
+        for series, hist in histograms.items():
+            hist.buckets.sort()
+            self._histograms[(family.name, series)] = hist
+        self._types[family.name] = "histogram"
+
+    @property
+    def interval(self) -> Optional[float]:
+        """Return the seconds elapsed since the previous snapshot.
+
+        :return: Interval, or None if there is no previous snapshot.
+        :rtype: float | None
+        """
+        if self._prev_timestamp is None:
+            return None
+        return self.timestamp - self._prev_timestamp
+
+    def _select(
+        self, index: Dict[SeriesKey, Any], name: str, selector: Dict[str, str]
+    ) -> Iterator[Tuple[SeriesKey, Any]]:
+        for key, value in index.items():
+            if key[0] == name and _matches(key[1], selector):
+                yield key, value
+
+    def names(self) -> List[str]:
+        """Return the names of all metrics in the snapshot.
+
+        :return: Metric names.
+        :rtype: [str]
+        """
+        return sorted(self.families)
+
+    def get(self, name: str, **labels: str) -> Optional[float]:
+        """Return the value of a counter or gauge.
+
+        Values of all series whose labels include the given ones are summed.
+
+        :param name: Sample name.
+        :type name: str
+        :param labels: Label values to match.
+        :type labels: str
+        :return: Value, or None if no series matched.
+        :rtype: float | None
+        """
+        values = [v for _, v in self._select(self._values, name, labels)]
+        return sum(values) if values else None
+
+    def rate(self, name: str, **labels: str) -> Optional[float]:
+        """Return the per-second rate of a counter since the previous snapshot.
+
+        Counter resets (value going down) are treated as a restart from zero.
+        Values of all series whose labels include the given ones are summed.
+
+        :param name: Sample name.
+        :type name: str
+        :param labels: Label values to match.
+        :type labels: str
+        :return: Rate, or None if there is no previous snapshot or no series
+            matched.
+        :rtype: float | None
+        """
+        interval = self.interval
+        if not interval or interval <= 0:
+            return None
+        delta = None
+        for key, value in self._select(self._values, name, labels):
+            previous = self._prev_values.get(key)
+            if previous is None:
+                continue
+            increase = value - previous if value >= previous else value
+            delta = (delta or 0.0) + increase
+        return None if delta is None else delta / interval
+
+    def rates(self) -> Dict[str, float]:
+        """Return per-second rates of all counters since the previous snapshot.
+
+        :return: Rates by sample name, summed over all series.
+        :rtype: {str: float}
+        """
+        result: Dict[str, float] = {}
+        interval = self.interval
+        if not interval or interval <= 0:
+            return result
+        for key, value in self._values.items():
+            if self._types.get(key[0]) != "counter":
+                continue
+            previous = self._prev_values.get(key)
+            if previous is None:
+                continue
+            increase = value - previous if value >= previous else value
+            result[key[0]] = result.get(key[0], 0.0) + increase / interval
+        return result
+
+    def histogram(
+        self, name: str, delta: bool = False, **labels: str
+    ) -> Optional[Histogram]:
+        """Return a histogram.
+
+        Buckets of all series whose labels include the given ones are merged.
+
+        :param name: Metric name (without the "_bucket" suffix).
+        :type name: str
+        :param delta: Return only the observations made since the previous
+            snapshot. Ignored if there is no previous snapshot.
+        :type delta: bool
+        :param labels: Label values to match.
+        :type labels: str
+        :return: Histogram, or None if no series matched.
+        :rtype: aioarango.metrics.Histogram | None
+        """
+        result: Optional[Histogram] = None
+        for key, hist in self._select(self._histograms, name, labels):
+            if delta and self._prev_timestamp is not None:
+                previous = self._prev_histograms.get(key)
+                if previous is not None:
+                    hist = hist - previous
+            result = hist if result is None else result + hist
+        return result
+
+    def quantile(
+        self, name: str, q: float, delta: bool = True, **labels: str
+    ) -> Optional[float]:
+        """Estimate a quantile of a histogram.
+
+        :param name: Metric name (without the "_bucket" suffix).
+        :type name: str
+        :param q: Quantile between 0 and 1.
+        :type q: float
+        :param delta: Use only the observations made since the previous
+            snapshot (if there is one). If set to False, all observations
+            since server start are used.
+        :type delta: bool
+        :param labels: Label values to match.
+        :type labels: str
+        :return: Estimated quantile, or None if nothing was observed.
+        :rtype: float | None
+        """
+        hist = self.histogram(name, delta, **labels)
+        return None if hist is None else hist.quantile(q)
+
+
+class MetricsSampler:
+    """Polls server metrics periodically and keeps the latest snapshot.
+
+    :param db: Database API wrapper used to retrieve the metrics. It must
+        execute requests directly (see
+        :class:`aioarango.database.StandardDatabase`).
+    :type db: aioarango.database.Database
+    :param interval: Seconds between polls.
+    :type interval: int | float
+    :param callback: Callable invoked with each new snapshot.
+    :type callback: callable | None
+
+    :ivar last_error: Error of the latest background poll (including errors
+        raised by the callback), or None if it succeeded. Failed polls are
+        logged and polling continues.
+    :vartype last_error: BaseException | None
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        interval: float = 10.0,
+        callback: Optional[Callable[[MetricsSnapshot], Any]] = None,
+    ) -> None:
+        self._db = db
+        self._interval = interval
+        self._callback = callback
+        self._latest: Optional[MetricsSnapshot] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self.last_error: Optional[BaseException] = None
+
+    def __repr__(self) -> str:
+        return f"<MetricsSampler {self._db.name} every {self._interval}s>"
+
+    async def __aenter__(self) -> "MetricsSampler":
+        self.start()
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.stop()
+
+    @property
+    def latest(self) -> Optional[MetricsSnapshot]:
+        """Return the most recent snapshot.
+
+        :return: Latest snapshot, or None if nothing was sampled yet.
+        :rtype: aioarango.metrics.MetricsSnapshot | None
+        """
+        return self._latest
+
+    @property
+    def running(self) -> bool:
+        """Return True if the background polling task is running.
+
+        :return: True if running.
+        :rtype: bool
+        """
+        return self._task is not None and not self._task.done()
+
+    async def sample(self) -> MetricsSnapshot:
+        """Retrieve the metrics once and compute rates against the last poll.
+
+        :return: New snapshot.
+        :rtype: aioarango.metrics.MetricsSnapshot
+        :raise aioarango.exceptions.ServerMetricsError: If retrieval fails.
+        """
+        text = await self._db.metrics()
+        snapshot = MetricsSnapshot.from_text(text, previous=self._latest)
+        self._latest = snapshot
+        if self._callback is not None:
+            result = self._callback(snapshot)
+            if asyncio.iscoroutine(result):
+                await result
+        return snapshot
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sample()
+                self.last_error = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                # Failed polls (including errors of the callback) must not
+                # stop the sampler.
+                self.last_error = err
+                logger.warning("failed to sample metrics: %s", err, exc_info=True)
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        """Start polling in a background task."""
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background polling task."""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
@@ -0,0 +1,96 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as DecodeError
+from json import dumps, loads
+from typing import Any, Iterator, List, Optional, Tuple
+
+from aioarango.typings import Json
+
+
+def get_field(document: Json, field: str) -> Any:
+    """Return the value of a document field.
+
+    :param document: Document.
+    :type document: dict
+    :param field: Field name. Names with dots refer to sub-attributes.
+    :type field: str
+    :return: Field value, or None if it is missing.
+    :rtype: Any
+    """
+    value: Any = document
+    for name in field.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(name)
+    return value
+
+
+def encode_token(field: str, document: Json, backward: bool) -> str:
+    """Return a continuation token pointing past a document.
+
+    :param field: Sort field.
+    :type field: str
+    :param document: Last document read in the paging direction.
+    :type document: dict
+    :param backward: Whether the token continues towards the beginning.
+    :type backward: bool
+    :return: Opaque continuation token.
+    :rtype: str
+    """
+    state = [field, get_field(document, field), document["_key"], backward]
+    data = dumps(state, separators=(",", ":")).encode("utf-8")
+    return urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_token(token: str, field: str) -> Tuple[Any, str, bool]:
+    """Return the position and direction stored in a continuation token.
+
+    :param token: Continuation token.
+    :type token: str
+    :param field: Sort field the token must have been created with.
+    :type field: str
+    :return: Sort field value, document key and backward flag.
+    :rtype: (Any, str, bool)
+    :raise ValueError: If the token is malformed or for another sort field.
+    """
+    try:
+        data = urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        token_field, value, key, backward = loads(data)
+    except (DecodeError, TypeError, ValueError):
+        raise ValueError("invalid continuation token")
+    if token_field != field:
+        raise ValueError(f"continuation token is not sorted by {field}")
+    return value, key, bool(backward)
+
+
+class Page:
+    """Page of documents read with keyset pagination.
+
+    :param documents: Documents, in sort order.
+    :type documents: [dict]
+    :param next_token: Token of the following page, or None on the last page.
+    :type next_token: str | None
+    :param previous_token: Token of the preceding page, or None on the first
+        page.
+    :type previous_token: str | None
+    """
+
+    __slots__ = ("documents", "next_token", "previous_token")
+
+    def __init__(
+        self,
+        documents: List[Json],
+        next_token: Optional[str] = None,
+        previous_token: Optional[str] = None,
+    ) -> None:
+        self.documents = documents
+        self.next_token = next_token
+        self.previous_token = previous_token
+
+    def __repr__(self) -> str:
+        return f"<Page {len(self.documents)} documents>"
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __iter__(self) -> Iterator[Json]:
+        return iter(self.documents)
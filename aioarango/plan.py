@@ -0,0 +1,372 @@
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from aioarango.typings import Json
+
+
+class PlanNode:
+    """Node of an AQL execution plan, with its runtime statistics.
+
+    :param data: Node as returned in the execution plan.
+    :type data: dict
+    :param stats: Runtime statistics of the node from a profiled execution.
+    :type stats: dict | None
+
+    :ivar id: Node ID.
+    :vartype id: int
+    :ivar type: Node type (e.g. "EnumerateCollectionNode").
+    :vartype type: str
+    :ivar estimated_cost: Cost estimated by the optimizer, including the
+        dependencies.
+    :vartype estimated_cost: float
+    :ivar estimated_items: Number of items estimated by the optimizer.
+    :vartype estimated_items: int | None
+    :ivar calls: Number of calls of the node, or None if not profiled.
+    :vartype calls: int | None
+    :ivar items: Number of items produced, or None if not profiled.
+    :vartype items: int | None
+    :ivar runtime: Seconds spent in the node and its dependencies, or None if
+        not profiled.
+    :vartype runtime: float | None
+    :ivar dependencies: Nodes producing the input of this node.
+    :vartype dependencies: [aioarango.plan.PlanNode]
+    :ivar subquery: Last node of the subquery of a "SubqueryNode".
+    :vartype subquery: aioarango.plan.PlanNode | None
+    :ivar data: Node as returned in the execution plan.
+    :vartype data: dict
+    """
+
+    __slots__ = (
+        "id",
+        "type",
+        "estimated_cost",
+        "estimated_items",
+        "calls",
+        "items",
+        "runtime",
+        "dependencies",
+        "subquery",
+        "data",
+    )
+
+    def __init__(self, data: Json, stats: Optional[Json] = None) -> None:
+        self.id: int = data["id"]
+        self.type: str = data["type"]
+        self.estimated_cost: float = data.get("estimatedCost", 0.0)
+        self.estimated_items: Optional[int] = data.get("estimatedNrItems")
+        self.calls: Optional[int] = None
+        self.items: Optional[int] = None
+        self.runtime: Optional[float] = None
+        if stats is not None:
+            self.calls = stats.get("calls")
+            self.items = stats.get("items")
+            self.runtime = stats.get("runtime")
+        self.dependencies: List[PlanNode] = []
+        self.subquery: Optional[PlanNode] = None
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"<PlanNode {self.id} {self.type}>"
+
+    @property
+    def collection(self) -> Optional[str]:
+        """Return the collection read or written by the node.
+
+        :return: Collection name, or None if the node uses no collection.
+        :rtype: str | None
+        """
+        collection: Optional[str] = self.data.get("collection")
+        return collection
+
+    @property
+    def indexes(self) -> List[str]:
+        """Return the names of the indexes used by the node.
+
+        :return: Index names (or IDs for indexes without a name).
+        :rtype: [str]
+        """
+        return [
+            str(index.get("name") or index.get("id"))
+            for index in self.data.get("indexes", [])
+        ]
+
+    @property
+    def self_time(self) -> Optional[float]:
+        """Return the seconds spent in the node itself.
+
+        :return: Runtime excluding the dependencies and the subquery, or None
+            if not profiled.
+        :rtype: float | None
+        """
+        if self.runtime is None:
+            return None
+        inputs = list(self.dependencies)
+        if self.subquery is not None:
+            inputs.append(self.subquery)
+        return max(self.runtime - sum(node.runtime or 0.0 for node in inputs), 0.0)
+
+    def describe(self) -> str:
+        """Return a short description of the node.
+
+        :return: Node type with its collection and indexes, if any.
+        :rtype: str
+        """
+        text = self.type
+        if self.collection is not None:
+            text += f" {self.collection}"
+        if self.indexes:
+            text += f" [{', '.join(self.indexes)}]"
+        return text
+
+
+class PlanAnalysis:
+    """Analysis of an AQL execution plan and its runtime statistics.
+
+    See :func:`aioarango.plan.analyze_plan`.
+
+    :param plan: Execution plan.
+    :type plan: dict
+    :param stats: Statistics of a profiled execution.
+    :type stats: dict | None
+
+    :ivar root: Last node of the plan (usually a "ReturnNode").
+    :vartype root: aioarango.plan.PlanNode
+    :ivar nodes: All nodes, including the nodes of subqueries.
+    :vartype nodes: [aioarango.plan.PlanNode]
+    :ivar estimated_cost: Cost of the plan estimated by the optimizer.
+    :vartype estimated_cost: float
+    :ivar execution_time: Seconds spent executing the query, or None if not
+        profiled.
+    :vartype execution_time: float | None
+    :ivar rules: Optimizer rules applied to the plan.
+    :vartype rules: [str]
+    """
+
+    def __init__(self, plan: Json, stats: Optional[Json] = None) -> None:
+        node_stats: Dict[int, Json] = {}
+        for item in (stats or {}).get("nodes", []):
+            node_stats[item["id"]] = item
+
+        self.nodes: List[PlanNode] = []
+        self.root = self._build(plan["nodes"], node_stats)
+        self.estimated_cost: float = plan.get("estimatedCost", self.root.estimated_cost)
+        self.execution_time: Optional[float] = None
+        if stats is not None:
+            self.execution_time = stats.get("execution_time")
+            if self.execution_time is None:
+                self.execution_time = stats.get("executionTime")
+        self.rules: List[str] = list(plan.get("rules", []))
+
+    def __repr__(self) -> str:
+        return f"<PlanAnalysis {len(self.nodes)} nodes>"
+
+    def __iter__(self) -> Iterator[PlanNode]:
+        return iter(self.nodes)
+
+    def _build(self, items: Sequence[Json], node_stats: Dict[int, Json]) -> PlanNode:
+        """Create the nodes of a plan or subquery and link them.
+
+        :param items: Nodes as returned in the execution plan.
+        :type items: [dict]
+        :param node_stats: Runtime statistics by node ID.
+        :type node_stats: dict
+        :return: Last node.
+        :rtype: aioarango.plan.PlanNode
+        """
+        nodes: Dict[int, PlanNode] = {}
+        for item in items:
+            node = PlanNode(item, node_stats.get(item["id"]))
+            nodes[node.id] = node
+            self.nodes.append(node)
+            subquery = item.get("subquery")
+            if subquery is not None and subquery.get("nodes"):
+                node.subquery = self._build(subquery["nodes"], node_stats)
+
+        used = set()
+        for node in nodes.values():
+            for dependency_id in node.data.get("dependencies", []):
+                if dependency_id in nodes:
+                    node.dependencies.append(nodes[dependency_id])
+                    used.add(dependency_id)
+        roots = [node for node in nodes.values() if node.id not in used]
+        return roots[-1] if roots else list(nodes.values())[-1]
+
+    @property
+    def profiled(self) -> bool:
+        """Return True if the nodes have runtime statistics.
+
+        :return: Whether the plan was profiled.
+        :rtype: bool
+        """
+        return any(node.runtime is not None for node in self.nodes)
+
+    def hottest(self, count: int = 5) -> List[PlanNode]:
+        """Return the nodes with the highest runtime of their own.
+
+        If the plan was not profiled, nodes are ranked by the share of the
+        estimated cost added by each node instead.
+
+        :param count: Max number of nodes returned.
+        :type count: int
+        :return: Nodes, hottest first.
+        :rtype: [aioarango.plan.PlanNode]
+        """
+        if self.profiled:
+            return sorted(self.nodes, key=lambda n: -(n.self_time or 0.0))[:count]
+
+        def own_cost(node: PlanNode) -> float:
+            inputs = sum(dependency.estimated_cost for dependency in node.dependencies)
+            return node.estimated_cost - inputs
+
+        return sorted(self.nodes, key=lambda n: -own_cost(n))[:count]
+
+    def full_scans(self) -> List[PlanNode]:
+        """Return the nodes reading whole collections without an index.
+
+        :return: "EnumerateCollectionNode" nodes.
+        :rtype: [aioarango.plan.PlanNode]
+        """
+        return [node for node in self.nodes if node.type == "EnumerateCollectionNode"]
+
+    def expensive_sorts(self, min_items: int = 10000) -> List[PlanNode]:
+        """Return the sorts of many items without an index.
+
+        Sorts combined with a LIMIT (which only keep the top items) are not
+        reported.
+
+        :param min_items: Min number of items sorted (counted as the items of
+            the input node, actual if profiled, estimated otherwise).
+        :type min_items: int
+        :return: "SortNode" nodes.
+        :rtype: [aioarango.plan.PlanNode]
+        """
+        sorts = []
+        for node in self.nodes:
+            if node.type != "SortNode" or node.data.get("limit"):
+                continue
+            if node.data.get("strategy") == "constrained-heap":
+                continue
+            items = max((_item_count(dep) for dep in node.dependencies), default=0)
+            if items >= min_items:
+                sorts.append(node)
+        return sorts
+
+    def estimate_mismatches(self, factor: float = 10.0) -> List[PlanNode]:
+        """Return the nodes whose actual item count is far from the estimate.
+
+        Such nodes point to outdated index selectivity estimates or to filter
+        conditions the optimizer cannot estimate, which can lead to bad plans.
+
+        :param factor: Min ratio between the larger and the smaller count.
+        :type factor: float
+        :return: Profiled nodes, largest mismatch first.
+        :rtype: [aioarango.plan.PlanNode]
+        """
+        mismatches = [
+            node
+            for node in self.nodes
+            if node.items is not None
+            and node.estimated_items is not None
+            and _mismatch(node) >= factor
+        ]
+        return sorted(mismatches, key=lambda node: -_mismatch(node))
+
+    def report(self, top: int = 5) -> str:
+        """Return a text report of the plan and its findings.
+
+        :param top: Number of hottest nodes listed.
+        :type top: int
+        :return: Report.
+        :rtype: str
+        """
+        summary = f"Plan: {len(self.nodes)} nodes"
+        summary += f", estimated cost {self.estimated_cost:g}"
+        if self.execution_time is not None:
+            summary += f", execution time {self.execution_time:.4f} s"
+        lines = [summary, ""]
+
+        lines.append(
+            f"{'id':>4}  {'type':<40}{'est':>10}{'items':>10}{'calls':>8}{'self s':>10}"
+        )
+        for node in self.nodes:
+            lines.append(
+                f"{node.id:>4}  {_clip(node.describe(), 39):<40}"
+                f"{_format(node.estimated_items):>10}{_format(node.items):>10}"
+                f"{_format(node.calls):>8}{_format(node.self_time, '.4f'):>10}"
+            )
+
+        total = sum(node.self_time or 0.0 for node in self.nodes)
+        hottest = [
+            f"#{node.id} {node.describe()}: {node.self_time:.4f} s"
+            f" ({node.self_time / total:.0%})"
+            for node in self.hottest(top)
+            if node.self_time and total
+        ]
+        scans = [
+            f"#{node.id} {node.describe()}: {_format(_item_count(node))} items"
+            for node in self.full_scans()
+        ]
+        sorts = [
+            f"#{node.id} {node.describe()}: "
+            f"{_format(max(_item_count(dep) for dep in node.dependencies))} items"
+            for node in self.expensive_sorts()
+        ]
+        mismatches = [
+            f"#{node.id} {node.describe()}: estimated {node.estimated_items},"
+            f" actual {node.items} ({_mismatch(node):.1f}x)"
+            for node in self.estimate_mismatches()
+        ]
+        for title, findings in [
+            ("Hottest nodes", hottest),
+            ("Full collection scans", scans),
+            ("Expensive sorts", sorts),
+            ("Estimate mismatches", mismatches),
+        ]:
+            if findings:
+                lines.append("")
+                lines.append(f"{title}:")
+                lines.extend(f"  {finding}" for finding in findings)
+        return "\n".join(lines)
+
+
+def analyze_plan(plan: Json, stats: Optional[Json] = None) -> PlanAnalysis:
+    """Analyze an AQL execution plan and its runtime statistics.
+
+    **Example:**
+
+    .. code-block:: python
+
+        cursor = await db.aql.execute(query, profile=2)
+        analysis = analyze_plan(cursor.plan(), cursor.statistics())
+        print(analysis.report())
+
+    :param plan: Execution plan returned by :func:`aioarango.aql.AQL.explain`
+        or :func:`aioarango.cursor.Cursor.plan`.
+    :type plan: dict
+    :param stats: Statistics of an execution with **profile** set to 2,
+        returned by :func:`aioarango.cursor.Cursor.statistics`. If not set,
+        only the estimates of the optimizer are analyzed.
+    :type stats: dict | None
+    :return: Plan analysis.
+    :rtype: aioarango.plan.PlanAnalysis
+    """
+    return PlanAnalysis(plan, stats)
+
+
+def _item_count(node: PlanNode) -> int:
+    if node.items is not None:
+        return node.items
+    return node.estimated_items or 0
+
+
+def _mismatch(node: PlanNode) -> float:
+    actual = node.items or 0
+    estimated = node.estimated_items or 0
+    return max(actual, estimated) / max(min(actual, estimated), 1)
+
+
+def _format(value: Optional[float], spec: str = "") -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def _clip(text: str, width: int) -> str:
+    return text if len(text) <= width else text[: width - 3] + "..."
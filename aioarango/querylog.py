@@ -0,0 +1,288 @@
+import heapq
+import re
+from collections import OrderedDict, deque
+from itertools import count
+from typing import Any, Deque, List, MutableMapping, Optional, Sequence, Tuple
+
+from aioarango.typings import Json, Jsons
+
+_COMMENT_RE = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+_LITERAL_RE = re.compile(
+    r"'(?:[^'\\]|\\.)*'"
+    r'|"(?:[^"\\]|\\.)*"'
+    r"|(?<![\w.@$`])-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?(?![\w.])"
+)
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Return the normalized form of an AQL query.
+
+    Comments are removed, whitespace is collapsed and string and number
+    literals are replaced with "?", so that queries differing only in inlined
+    values are grouped together. Bind parameters are left as they are.
+
+    :param query: AQL query.
+    :type query: str
+    :return: Normalized query.
+    :rtype: str
+    """
+    query = _COMMENT_RE.sub(" ", query)
+    query = _LITERAL_RE.sub("?", query)
+    return _SPACE_RE.sub(" ", query).strip()
+
+
+def _percentile(ordered: Sequence[float], pct: float) -> Optional[float]:
+    """Return the nearest-rank percentile of sorted values.
+
+    :param ordered: Values sorted in ascending order.
+    :type ordered: [float]
+    :param pct: Percentile between 0 and 100.
+    :type pct: float
+    :return: Percentile value, or None if there are no values.
+    :rtype: float | None
+    """
+    if not ordered:
+        return None
+    rank = int(round(pct / 100 * len(ordered) + 0.5)) - 1
+    return ordered[min(max(rank, 0), len(ordered) - 1)]
+
+
+class QueryLogEntry:
+    """Aggregated statistics of one normalized AQL query.
+
+    :param query: Normalized query.
+    :type query: str
+    :param top_k: Number of slowest samples kept.
+    :type top_k: int
+    :param max_samples: Number of most recent execution times kept for
+        computing percentiles.
+    :type max_samples: int
+    """
+
+    __slots__ = (
+        "query",
+        "count",
+        "errors",
+        "total_time",
+        "max_time",
+        "full_scans",
+        "scanned_full",
+        "scanned_index",
+        "peak_memory",
+        "warning_count",
+        "warnings",
+        "_times",
+        "_slowest",
+        "_top_k",
+        "_seq",
+    )
+
+    def __init__(self, query: str, top_k: int, max_samples: int) -> None:
+        self.query = query
+        self.count = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.full_scans = 0
+        self.scanned_full = 0
+        self.scanned_index = 0
+        self.peak_memory = 0
+        self.warning_count = 0
+        self.warnings: "OrderedDict[str, int]" = OrderedDict()
+        self._times: Deque[float] = deque(maxlen=max_samples)
+        self._slowest: List[Tuple[float, int, Json]] = []
+        self._top_k = top_k
+        self._seq = count()
+
+    def __repr__(self) -> str:
+        return f"<QueryLogEntry {self.query[:40]!r} count={self.count}>"
+
+    def add(
+        self,
+        query: str,
+        bind_vars: Optional[MutableMapping[str, Any]],
+        stats: Json,
+        warnings: Optional[Sequence[Json]],
+    ) -> None:
+        """Add the statistics of a finished query execution.
+
+        :param query: Original query text.
+        :type query: str
+        :param bind_vars: Bind variables used for the execution.
+        :type bind_vars: dict | None
+        :param stats: Cursor statistics.
+        :type stats: dict
+        :param warnings: Query warnings.
+        :type warnings: [dict] | None
+        """
+        execution_time = float(stats.get("execution_time") or 0.0)
+        scanned_full = int(stats.get("scanned_full") or 0)
+
+        self.count += 1
+        self.total_time += execution_time
+        self.max_time = max(self.max_time, execution_time)
+        self._times.append(execution_time)
+        if scanned_full > 0:
+            self.full_scans += 1
+        self.scanned_full += scanned_full
+        self.scanned_index += int(stats.get("scanned_index") or 0)
+        self.peak_memory = max(self.peak_memory, int(stats.get("peakMemoryUsage") or 0))
+
+        if warnings:
+            self.warning_count += len(warnings)
+            for warning in warnings:
+                message = str(warning.get("message", warning))
+                self.warnings[message] = self.warnings.pop(message, 0) + 1
+                if len(self.warnings) > self._top_k:
+                    self.warnings.popitem(last=False)
+
+        if self._top_k > 0:
+            sample = {
+                "query": query,
+                "bind_vars": dict(bind_vars) if bind_vars else {},
+                "execution_time": execution_time,
+                "scanned_full": scanned_full,
+                "scanned_index": stats.get("scanned_index"),
+                "peak_memory": stats.get("peakMemoryUsage"),
+            }
+            item = (execution_time, next(self._seq), sample)
+            if len(self._slowest) < self._top_k:
+                heapq.heappush(self._slowest, item)
+            elif execution_time > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, item)
+
+    def slowest(self) -> Jsons:
+        """Return the slowest recorded executions, slowest first.
+
+        :return: Samples with original query text and bind variables.
+        :rtype: [dict]
+        """
+        return [sample for _, _, sample in sorted(self._slowest, reverse=True)]
+
+    def to_dict(self) -> Json:
+        """Return the entry as a report row.
+
+        :return: Aggregated query statistics.
+        :rtype: dict
+        """
+        ordered = sorted(self._times)
+        return {
+            "query": self.query,
+            "count": self.count,
+            "errors": self.errors,
+            "total_time": self.total_time,
+            "avg_time": self.total_time / self.count if self.count else None,
+            "p50_time": _percentile(ordered, 50),
+            "p99_time": _percentile(ordered, 99),
+            "max_time": self.max_time,
+            "full_scans": self.full_scans,
+            "scanned_full": self.scanned_full,
+            "scanned_index": self.scanned_index,
+            "peak_memory": self.peak_memory,
+            "warning_count": self.warning_count,
+            "warnings": dict(self.warnings),
+            "slowest": self.slowest(),
+        }
+
+
+class QueryLog:
+    """Client-side log of AQL query statistics.
+
+    Statistics are taken from the ``extra.stats`` section of query results and
+    grouped by normalized query text (see
+    :func:`aioarango.querylog.normalize_query`).
+
+    :param top_k: Number of slowest samples (with bind variables) kept per
+        query, also the number of distinct warning messages kept per query.
+    :type top_k: int
+    :param max_queries: Max number of distinct queries tracked. The least
+        recently executed query is evicted first.
+    :type max_queries: int
+    :param max_samples: Number of most recent execution times kept per query
+        for computing percentiles.
+    :type max_samples: int
+    """
+
+    def __init__(
+        self, top_k: int = 10, max_queries: int = 1000, max_samples: int = 1000
+    ) -> None:
+        self._top_k = top_k
+        self._max_queries = max_queries
+        self._max_samples = max_samples
+        self._entries: "OrderedDict[str, QueryLogEntry]" = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"<QueryLog {len(self._entries)} queries>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry(self, query: str) -> QueryLogEntry:
+        key = normalize_query(query)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = QueryLogEntry(key, self._top_k, self._max_samples)
+            self._entries[key] = entry
+            if len(self._entries) > self._max_queries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+        return entry
+
+    def record(
+        self,
+        query: str,
+        bind_vars: Optional[MutableMapping[str, Any]],
+        stats: Json,
+        warnings: Optional[Sequence[Json]] = None,
+    ) -> None:
+        """Record the statistics of a finished query execution.
+
+        :param query: Query text.
+        :type query: str
+        :param bind_vars: Bind variables used for the execution.
+        :type bind_vars: dict | None
+        :param stats: Cursor statistics.
+        :type stats: dict
+        :param warnings: Query warnings.
+        :type warnings: [dict] | None
+        """
+        self._entry(query).add(query, bind_vars, stats, warnings)
+
+    def record_error(self, query: str) -> None:
+        """Record a failed query execution.
+
+        :param query: Query text.
+        :type query: str
+        """
+        self._entry(query).errors += 1
+
+    def entry(self, query: str) -> Optional[QueryLogEntry]:
+        """Return the log entry of the query.
+
+        :param query: Query text (normalized automatically).
+        :type query: str
+        :return: Log entry, or None if the query was not recorded.
+        :rtype: aioarango.querylog.QueryLogEntry | None
+        """
+        return self._entries.get(normalize_query(query))
+
+    def report(self, sort_by: str = "total_time", limit: Optional[int] = None) -> Jsons:
+        """Return aggregated statistics of all recorded queries.
+
+        :param sort_by: Report field to sort by in descending order (e.g.
+            "total_time", "p99_time", "count", "full_scans" or "peak_memory").
+        :type sort_by: str
+        :param limit: Max number of queries returned.
+        :type limit: int | None
+        :return: Report rows.
+        :rtype: [dict]
+        """
+        rows = [entry.to_dict() for entry in self._entries.values()]
+        rows.sort(key=lambda row: row[sort_by] or 0, reverse=True)
+        return rows if limit is None else rows[:limit]
+
+    def clear(self) -> None:
+        """Discard all recorded statistics."""
+        self._entries.clear()
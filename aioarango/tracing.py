@@ -0,0 +1,414 @@
+import hashlib
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextvars import ContextVar, Token
+from typing import Any, Deque, List, Optional, Tuple, Union
+
+from aioarango.response import Response
+from aioarango.typings import Headers, Json
+
+logger = logging.getLogger(__name__)
+
+_current_span: "ContextVar[Optional[Span]]" = ContextVar(
+    "aioarango_current_span", default=None
+)
+
+
+def query_hash(query: str) -> str:
+    """Return a short stable hash of the AQL query text.
+
+    :param query: AQL query.
+    :type query: str
+    :return: First 16 hex digits of the SHA-1 digest of the query.
+    :rtype: str
+    """
+    return hashlib.sha1(query.encode("utf-8")).hexdigest()[:16]
+
+
+def parse_traceparent(header: str) -> Optional[Tuple[str, str, int]]:
+    """Parse a W3C ``traceparent`` header value.
+
+    :param header: Header value (e.g. "00-<trace-id>-<parent-id>-01").
+    :type header: str
+    :return: Trace ID, parent span ID and trace flags, or None if the value
+        is malformed.
+    :rtype: (str, str, int) | None
+    """
+    parts = header.strip().lower().split("-")
+    if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        int(parts[1], 16)
+        int(parts[2], 16)
+        flags = int(parts[3][:2], 16)
+    except ValueError:
+        return None
+    if parts[1] == "0" * 32 or parts[2] == "0" * 16:
+        return None
+    return parts[1], parts[2], flags
+
+
+class Span:
+    """Timed unit of work with attributes.
+
+    :param name: Span name (e.g. "arangodb.request").
+    :type name: str
+    :param trace_id: 32 hex digit trace ID.
+    :type trace_id: str
+    :param span_id: 16 hex digit span ID.
+    :type span_id: str
+    :param parent_id: Span ID of the parent span, if any.
+    :type parent_id: str | None
+    :param flags: W3C trace flags.
+    :type flags: int
+    :param attributes: Initial span attributes.
+    :type attributes: dict | None
+
+    :ivar name: Span name.
+    :vartype name: str
+    :ivar trace_id: Trace ID.
+    :vartype trace_id: str
+    :ivar span_id: Span ID.
+    :vartype span_id: str
+    :ivar parent_id: Parent span ID.
+    :vartype parent_id: str | None
+    :ivar attributes: Span attributes.
+    :vartype attributes: dict
+    :ivar start_time: Start time in seconds since the epoch.
+    :vartype start_time: float
+    :ivar end_time: End time in seconds since the epoch, or None if the span
+        is still open.
+    :vartype end_time: float | None
+    :ivar error: Error description if the traced operation raised.
+    :vartype error: str | None
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "flags",
+        "attributes",
+        "start_time",
+        "end_time",
+        "error",
+        "_start",
+        "_duration",
+    )
+
+    is_recording = True
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        span_id: str,
+        parent_id: Optional[str] = None,
+        flags: int = 1,
+        attributes: Optional[Json] = None,
+    ) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.flags = flags
+        self.attributes: Json = attributes or {}
+        self.start_time = time.time()
+        self.end_time: Optional[float] = None
+        self.error: Optional[str] = None
+        self._start = time.perf_counter()
+        self._duration: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f"<Span {self.name} {self.span_id}>"
+
+    @property
+    def traceparent(self) -> str:
+        """Return the W3C ``traceparent`` header value for this span.
+
+        :return: Header value.
+        :rtype: str
+        """
+        return f"00-{self.trace_id}-{self.span_id}-{self.flags:02x}"
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Return the span duration in seconds.
+
+        :return: Duration, or None if the span is still open.
+        :rtype: float | None
+        """
+        return self._duration
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set a span attribute. None values are ignored.
+
+        :param key: Attribute name.
+        :type key: str
+        :param value: Attribute value.
+        :type value: str | int | float | bool
+        """
+        if value is not None:
+            self.attributes[key] = value
+
+    def finish(self) -> None:
+        """Close the span and record its end time."""
+        if self._duration is None:
+            self._duration = time.perf_counter() - self._start
+            self.end_time = self.start_time + self._duration
+
+
+class _NoopSpan:
+    """Span placeholder used when tracing is disabled."""
+
+    __slots__ = ()
+
+    is_recording = False
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        return None
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class SpanExporter(ABC):  # pragma: no cover
+    """Abstract base class for span exporters."""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """Export a finished span.
+
+        This method must be overridden by the user. It is called on the event
+        loop thread, so it should hand the span off quickly (e.g. to a queue)
+        rather than perform blocking I/O.
+
+        :param span: Finished span.
+        :type span: aioarango.tracing.Span
+        """
+        raise NotImplementedError
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Span exporter which keeps finished spans in memory.
+
+    :param max_spans: Max number of spans kept. Oldest spans are discarded
+        first. If not set, all spans are kept.
+    :type max_spans: int | None
+    """
+
+    def __init__(self, max_spans: Optional[int] = None) -> None:
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+
+    @property
+    def spans(self) -> List[Span]:
+        """Return the exported spans, oldest first.
+
+        :return: Exported spans.
+        :rtype: [aioarango.tracing.Span]
+        """
+        return list(self._spans)
+
+    def export(self, span: Span) -> None:
+        self._spans.append(span)
+
+    def clear(self) -> None:
+        """Discard all exported spans."""
+        self._spans.clear()
+
+
+class _SpanScope:
+    """Context manager which activates a span and exports it on exit."""
+
+    __slots__ = ("_exporter", "_span", "_token")
+
+    def __init__(self, exporter: SpanExporter, span: Span) -> None:
+        self._exporter = exporter
+        self._span = span
+        self._token: Optional[Token] = None
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type: Any, exc: Any, _: Any) -> None:
+        span = self._span
+        if exc is not None:
+            span.error = f"{exc_type.__name__}: {exc}"
+            span.set_attribute("error", True)
+            error_code = getattr(exc, "error_code", None)
+            span.set_attribute("arango.error_code", error_code)
+        span.finish()
+        if self._token is not None:
+            _current_span.reset(self._token)
+        try:
+            self._exporter.export(span)
+        except Exception:  # pragma: no cover
+            logger.exception("failed to export span %s", span.name)
+
+
+class Tracer:
+    """Creates spans around ArangoDB calls and hands them to an exporter.
+
+    Spans opened through the same tracer nest automatically within the current
+    asyncio task. While a span is active, outgoing requests carry its W3C
+    ``traceparent`` header so that the server-side work can be correlated.
+
+    :param exporter: Span exporter.
+    :type exporter: aioarango.tracing.SpanExporter
+    :param inject_headers: Add the ``traceparent`` header to outgoing
+        requests.
+    :type inject_headers: bool
+    """
+
+    enabled = True
+
+    def __init__(self, exporter: SpanExporter, inject_headers: bool = True) -> None:
+        self._exporter = exporter
+        self._inject_headers = inject_headers
+
+    def __repr__(self) -> str:
+        return f"<Tracer {self._exporter.__class__.__name__}>"
+
+    @property
+    def exporter(self) -> SpanExporter:
+        """Return the span exporter.
+
+        :return: Span exporter.
+        :rtype: aioarango.tracing.SpanExporter
+        """
+        return self._exporter
+
+    def current_span(self) -> Optional[Span]:
+        """Return the span active in the current task.
+
+        :return: Active span, or None.
+        :rtype: aioarango.tracing.Span | None
+        """
+        return _current_span.get()
+
+    def span(
+        self,
+        name: str,
+        attributes: Optional[Json] = None,
+        parent: Union[Span, str, None] = None,
+    ) -> Any:
+        """Return a context manager which opens a new span.
+
+        :param name: Span name.
+        :type name: str
+        :param attributes: Initial span attributes.
+        :type attributes: dict | None
+        :param parent: Parent span or a W3C ``traceparent`` header value (e.g.
+            taken from an incoming request). If not set, the span active in the
+            current task is used, and a new trace is started if there is none.
+        :type parent: aioarango.tracing.Span | str | None
+        :return: Context manager yielding the new span.
+        :rtype: contextlib.AbstractContextManager
+        """
+        if parent is None:
+            parent = _current_span.get()
+
+        trace_id: Optional[str] = None
+        parent_id: Optional[str] = None
+        flags = 1
+        if isinstance(parent, Span):
+            trace_id, parent_id, flags = parent.trace_id, parent.span_id, parent.flags
+        elif isinstance(parent, str):
+            context = parse_traceparent(parent)
+            if context is not None:
+                trace_id, parent_id, flags = context
+
+        span = Span(
+            name=name,
+            trace_id=trace_id or f"{random.getrandbits(128):032x}",
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent_id,
+            flags=flags,
+            attributes=attributes,
+        )
+        return _SpanScope(self._exporter, span)
+
+    def inject(self, headers: Headers, data: Any = None) -> None:
+        """Annotate an outgoing request.
+
+        Adds the ``traceparent`` header and records the payload size on the
+        active span.
+
+        :param headers: Request headers.
+        :type headers: dict
+        :param data: Normalized request payload.
+        :type data: str | bytes | None
+        """
+        span = _current_span.get()
+        if span is None:
+            return
+        if self._inject_headers:
+            headers["traceparent"] = span.traceparent
+        if isinstance(data, str):
+            span.set_attribute("http.request_bytes", len(data.encode("utf-8")))
+        elif isinstance(data, bytes):
+            span.set_attribute("http.request_bytes", len(data))
+
+    def record_response(self, resp: Response) -> None:
+        """Record details of a received response on the active span.
+
+        :param resp: HTTP response.
+        :type resp: aioarango.response.Response
+        """
+        span = _current_span.get()
+        if span is None:
+            return
+        span.set_attribute("http.status_code", resp.status_code)
+        raw_body = resp.raw_body
+        if isinstance(raw_body, str):
+            span.set_attribute("http.response_bytes", len(raw_body.encode("utf-8")))
+        elif isinstance(raw_body, bytes):
+            span.set_attribute("http.response_bytes", len(raw_body))
+
+
+class NoopTracer(Tracer):
+    """Tracer which records nothing. This is the default."""
+
+    enabled = False
+
+    # noinspection PyMissingConstructor
+    def __init__(self) -> None:
+        self._inject_headers = False
+
+    def __repr__(self) -> str:
+        return "<NoopTracer>"
+
+    @property
+    def exporter(self) -> Optional[SpanExporter]:  # type: ignore[override]
+        return None
+
+    def current_span(self) -> Optional[Span]:
+        return None
+
+    def span(
+        self,
+        name: str,
+        attributes: Optional[Json] = None,
+        parent: Union[Span, str, None] = None,
+    ) -> Any:
+        return NOOP_SPAN
+
+    def inject(self, headers: Headers, data: Any = None) -> None:
+        return None
+
+    def record_response(self, resp: Response) -> None:
+        return None
+
+
+NOOP_TRACER = NoopTracer()
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, Optional, Set, Tuple
+
+from aioarango.request import Request
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aioarango.connection import BaseConnection
+
+logger = logging.getLogger(__name__)
+
+_Key = Tuple[str, str]
+
+
+class CursorTracker:
+    """Registry of the server-side cursors opened through a connection.
+
+    Cursors are registered while they hold results on the server. If a
+    registered cursor is garbage collected without being depleted or closed
+    (e.g. after an exception or an early ``break``), closing it on the server
+    is scheduled on the running event loop.
+
+    :param connection: HTTP connection.
+    :type connection: aioarango.connection.BaseConnection
+    :ivar leaked: Number of cursors closed after being garbage collected.
+    :vartype leaked: int
+    """
+
+    def __init__(self, connection: "BaseConnection") -> None:
+        self._conn = connection
+        self._open: Dict[_Key, Tuple[float, weakref.finalize]] = {}
+        self._closing: Set["asyncio.Future[Any]"] = set()
+        self.leaked = 0
+
+    def __repr__(self) -> str:
+        return f"<CursorTracker {len(self._open)} open>"
+
+    def __len__(self) -> int:
+        return len(self._open)
+
+    def register(self, cursor: Any) -> None:
+        """Start tracking an open cursor.
+
+        :param cursor: Cursor with a server-side ID.
+        :type cursor: aioarango.cursor.Cursor
+        """
+        key = (cursor.type, cursor.id)
+        if key not in self._open:
+            finalizer = weakref.finalize(cursor, self._finalize, key)
+            finalizer.atexit = False
+            self._open[key] = (time.monotonic(), finalizer)
+
+    def unregister(self, cursor: Any) -> None:
+        """Stop tracking a cursor that is depleted or closed.
+
+        :param cursor: Cursor with a server-side ID.
+        :type cursor: aioarango.cursor.Cursor
+        """
+        item = self._open.pop((cursor.type, cursor.id), None)
+        if item is not None:
+            item[1].detach()
+
+    def close_later(self, cursor: Any) -> None:
+        """Close a cursor on the server in the background.
+
+        Used for cursors whose consumer is gone (e.g. was cancelled while the
+        query was executed). Failures are ignored.
+
+        :param cursor: Cursor with a server-side ID.
+        :type cursor: aioarango.cursor.Cursor
+        """
+        self._schedule(self._close(cursor))
+
+    def ages(self) -> Dict[str, float]:
+        """Return the ages of the open cursors.
+
+        :return: Seconds since opening by cursor ID.
+        :rtype: dict
+        """
+        now = time.monotonic()
+        return {key[1]: now - opened for key, (opened, _) in self._open.items()}
+
+    @property
+    def oldest_age(self) -> Optional[float]:
+        """Return the age of the oldest open cursor.
+
+        :return: Seconds since opening, or None if no cursors are open.
+        :rtype: float | None
+        """
+        if not self._open:
+            return None
+        return time.monotonic() - min(opened for opened, _ in self._open.values())
+
+    def _finalize(self, key: _Key) -> None:
+        if self._open.pop(key, None) is None:
+            return
+        self.leaked += 1
+        self._schedule(self._delete(key))
+
+    def _schedule(self, coro: Coroutine[Any, Any, Any]) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            coro.close()
+            return
+        future = loop.create_task(coro)
+        self._closing.add(future)
+        future.add_done_callback(self._closing.discard)
+
+    async def _close(self, cursor: Any) -> None:
+        try:
+            await cursor.close(ignore_missing=True)
+        except Exception as err:
+            logger.debug("failed to close cursor %s: %s", cursor.id, err)
+
+    async def _delete(self, key: _Key) -> bool:
+        cursor_type, cursor_id = key
+        request = Request(method="delete", endpoint=f"/_api/{cursor_type}/{cursor_id}")
+        try:
+            resp = await self._conn.send_request(request)
+        except Exception as err:
+            logger.debug("failed to close cursor %s: %s", cursor_id, err)
+            return False
+        return resp.is_success
+
+    async def close_all(self) -> int:
+        """Close all tracked cursors on the server.
+
+        Failures (e.g. cursors already expired) are ignored.
+
+        :return: Number of cursors closed successfully.
+        :rtype: int
+        """
+        keys = list(self._open)
+        for key in keys:
+            self._open.pop(key)[1].detach()
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+        results = await asyncio.gather(*(self._delete(key) for key in keys))
+        return sum(results)
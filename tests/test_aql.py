@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from aioarango.collection import Collection
@@ -19,6 +21,7 @@ from aioarango.exceptions import (
     AQLQueryTrackingSetError,
     AQLQueryValidateError,
 )
+from aioarango.plan import analyze_plan
 from tests.helpers import assert_raises, extract
 
 pytestmark = pytest.mark.asyncio
@@ -352,3 +355,183 @@ async def test_aql_cache_management(db: StandardDatabase, bad_db: StandardDataba
     with assert_raises(AQLCacheClearError) as err:
         await bad_db.aql.cache.clear()
     assert err.value.error_code in {11, 1228}
+
+
+async def test_aql_result_cache(db: StandardDatabase, col: Collection, docs):
+    await col.import_bulk(docs)
+    result_cache = db.aql.enable_result_cache(max_entries=10)
+    assert db.aql.result_cache is result_cache
+
+    query = "FOR d IN @@col SORT d._key RETURN d.val"
+    bind_vars = {"@col": col.name}
+    cursor = await db.aql.execute(
+        query, bind_vars=bind_vars, count=True, batch_size=1, client_cache=True
+    )
+    assert [val async for val in cursor] == [doc["val"] for doc in docs]
+    assert result_cache.misses == 1
+    assert len(result_cache) == 1
+
+    cursor = await db.aql.execute(
+        query, bind_vars=bind_vars, count=True, batch_size=1, client_cache=True
+    )
+    assert cursor.cached() is True
+    assert cursor.count() == len(docs)
+    assert [val async for val in cursor] == [doc["val"] for doc in docs]
+    assert result_cache.hits == 1
+
+    # Different result options are cached separately.
+    await db.aql.execute(query, bind_vars=bind_vars, client_cache=True)
+    assert result_cache.misses == 2
+
+    # Writes through the client invalidate results reading the collection.
+    await col.insert({"_key": "new", "val": 100})
+    assert len(result_cache) == 0
+    cursor = await db.aql.execute(
+        query, bind_vars=bind_vars, count=True, client_cache=True
+    )
+    assert cursor.count() == len(docs) + 1
+
+    # Queries writing to collections are not cached.
+    await db.aql.execute(
+        "INSERT {val: 200} INTO @@col", bind_vars=bind_vars, client_cache=True
+    )
+    assert len(result_cache) == 0
+
+    # Non-deterministic queries are not cached.
+    cursor = await db.aql.execute("RETURN RAND()", client_cache=True)
+    first = await cursor.next()
+    cursor = await db.aql.execute("RETURN RAND()", client_cache=True)
+    assert cursor.cached() is not True
+    assert await cursor.next() != first
+    assert len(result_cache) == 0
+
+    db.aql.disable_result_cache()
+    assert db.aql.result_cache is None
+
+
+async def test_aql_row_results(db: StandardDatabase, col: Collection, docs):
+    await col.import_bulk(docs)
+    query = f"FOR d IN {col.name} SORT d._key RETURN [d._key, d.val, d.x]"
+
+    cursor = await db.aql.execute(
+        query, batch_size=2, stream=True, row_fields=["key", "val", "x"]
+    )
+    rows = [row async for row in cursor]
+    assert [(row.key, row.val, row.x) for row in rows] == [
+        (doc["_key"], doc["val"], None) for doc in docs
+    ]
+
+    cursor = await db.aql.execute(
+        query, row_fields=["key", "val", "x"], row_type="tuple"
+    )
+    assert await cursor.drain() == [(doc["_key"], doc["val"], None) for doc in docs]
+
+    cursor = await db.aql.execute(query, row_fields=["not-valid", "val", "x"])
+    assert (await cursor.next())._0 == docs[0]["_key"]
+
+
+async def test_aql_execute_many(db: StandardDatabase, col: Collection, docs):
+    await col.import_bulk(docs)
+    query = f"FOR d IN {col.name} FILTER d.text == @text SORT d._key RETURN d._key"
+
+    results = await db.aql.execute_many(
+        query,
+        [{"text": "foo"}, {"text": "bar"}, {"text": "baz"}],
+        concurrency=2,
+        options={"batch_size": 1},
+    )
+    assert results == [["1", "2", "3"], ["4", "5", "6"], []]
+
+    results = await db.aql.execute_all(
+        [
+            {"query": "RETURN 1"},
+            {"query": "INVALID QUERY"},
+            {"query": "RETURN SLEEP(5)"},
+        ],
+        timeout=1,
+    )
+    assert results[0] == [1]
+    assert isinstance(results[1], AQLQueryExecuteError)
+    assert isinstance(results[2], asyncio.TimeoutError)
+
+    # Cursors of queries cancelled while executing are closed on the server
+    tracker = db.cursors
+    leaked = tracker.leaked
+    results = await db.aql.execute_all(
+        [{"query": "LET s = SLEEP(1) FOR i IN 1..3 RETURN i", "batch_size": 1}],
+        timeout=0.5,
+    )
+    assert isinstance(results[0], asyncio.TimeoutError)
+    await asyncio.sleep(1.5)
+    assert len(tracker) == 0
+    assert tracker.leaked == leaked
+
+    queries = [{"query": f"RETURN {i}"} for i in range(5)]
+    completed = [item async for item in db.aql.execute_completed(queries)]
+    assert sorted(completed) == [(i, [i]) for i in range(5)]
+
+
+async def test_aql_query_group(db: StandardDatabase, col: Collection, docs):
+    await col.import_bulk(docs)
+
+    group = db.aql.group()
+    assert group.add("RETURN LENGTH(@@col)", {"@col": col.name}) == 0
+    assert group.add(
+        "FOR d IN @@col FILTER d.val > @val SORT d.val RETURN d.val",
+        {"@col": col.name, "val": 4},
+    ) == 1
+    assert group.add("RETURN '@val'") == 2
+    assert group.add("LET q0 = 1 LET q1 = q0 + 1 RETURN [q0, q1]") == 3
+    assert len(group) == 4
+
+    query, bind_vars = group.compose()
+    assert "@@q1_col" in query and "'@val'" in query
+    assert "LET aioarango_q0 = (" in query
+    assert bind_vars == {"@q0_col": col.name, "@q1_col": col.name, "q1_val": 4}
+
+    assert await group.execute() == [[len(docs)], [5, 6], ["@val"], [[1, 2]]]
+
+    group.add("INVALID QUERY")
+    with assert_raises(AQLQueryExecuteError):
+        await group.execute()
+
+
+async def test_aql_plan_cache(db: StandardDatabase, col: Collection):
+    plan_cache = db.aql.enable_plan_cache(max_entries=10)
+    assert db.aql.plan_cache is plan_cache
+    query = f"FOR d IN {col.name} FILTER d.val == @val RETURN d"
+
+    try:
+        plan = await db.aql.explain(query, bind_vars={"val": 1})
+        assert await db.aql.explain(query, bind_vars={"val": 2}) == plan
+        await db.aql.validate(query)
+        await db.aql.validate(query)
+        assert plan_cache.hits == 2
+        assert plan_cache.misses == 2
+
+        await col.add_persistent_index(fields=["val"])
+        assert plan_cache.invalidations == 2
+        await db.aql.explain(query, bind_vars={"val": 1})
+        assert plan_cache.misses == 3
+
+        with assert_raises(AQLQueryValidateError):
+            await db.aql.validate("INVALID QUERY")
+    finally:
+        db.aql.disable_plan_cache()
+    assert db.aql.plan_cache is None
+
+
+async def test_aql_plan_analysis(db: StandardDatabase, col: Collection, docs):
+    await col.import_bulk(docs)
+    query = f"FOR d IN {col.name} SORT d.val DESC RETURN d"
+
+    cursor = await db.aql.execute(query, profile=2)
+    assert cursor.plan() is not None
+    analysis = analyze_plan(cursor.plan(), cursor.statistics())
+    assert analysis.profiled is True
+    assert [node.collection for node in analysis.full_scans()] == [col.name]
+    assert "Full collection scans:" in analysis.report()
+
+    analysis = analyze_plan(await db.aql.explain(query))
+    assert analysis.profiled is False
+    assert analysis.root.type == "ReturnNode"
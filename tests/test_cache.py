@@ -0,0 +1,248 @@
+import time
+
+from aioarango.cache import DocumentCache, MetadataCache, PlanCache, QueryResultCache
+from aioarango.response import Response
+
+
+def test_document_cache_lookup():
+    cache = DocumentCache(ttl=None)
+    assert cache.lookup("col/1") is None
+    assert cache.misses == 1
+
+    cache.put("col/1", "_rev1", '{"_key": "1"}')
+    entry = cache.lookup("col/1")
+    assert entry.rev == "_rev1"
+    assert entry.raw_body == '{"_key": "1"}'
+    assert entry.fresh is True
+    assert cache.hits == 1
+    assert "col/1" in cache
+    assert len(cache) == 1
+    assert cache.bytes == len('{"_key": "1"}')
+
+
+def test_document_cache_ttl():
+    cache = DocumentCache(ttl=0.01)
+    cache.put("col/1", "_rev1", "{}")
+    time.sleep(0.02)
+
+    entry = cache.lookup("col/1")
+    assert entry.fresh is False
+    assert cache.revalidations == 1
+
+    cache.refresh("col/1", entry)
+    assert entry.fresh is True
+    assert cache.not_modified == 1
+
+
+def test_document_cache_limits():
+    cache = DocumentCache(max_size=2, max_bytes=10)
+    cache.put("col/1", "_rev1", "1234")
+    cache.put("col/2", "_rev1", "1234")
+    cache.lookup("col/1")
+    cache.put("col/3", "_rev1", "1234")
+    assert "col/1" in cache
+    assert "col/2" not in cache
+    assert cache.evictions == 1
+
+    cache.put("col/4", "_rev1", "12345678")
+    assert list(cache._entries) == ["col/4"]
+    assert cache.bytes == 8
+
+    # Documents larger than the memory cap are not cached.
+    cache.put("col/5", "_rev1", "12345678901")
+    assert "col/5" not in cache
+    assert cache.evictions == 3
+
+    # Sizes are counted in UTF-8 encoded bytes.
+    cache.put("col/6", "_rev1", "€€€")
+    assert cache.lookup("col/6").size == 9
+    assert cache.bytes == 9
+    cache.put("col/7", "_rev1", "€€€€")
+    assert "col/7" not in cache
+    cache.invalidate(["col/6"])
+    assert cache.bytes == 0
+
+
+def test_document_cache_invalidate():
+    cache = DocumentCache()
+    cache.put("col/1", "_rev1", "{}")
+    cache.put("col/2", "_rev1", "{}")
+
+    version = cache.version
+    cache.invalidate(["col/1", "col/3"])
+    assert cache.version == version + 1
+    assert "col/1" not in cache
+    assert "col/2" in cache
+
+    # Documents requested before an invalidation are not stored.
+    cache.put("col/1", "_rev1", "{}", version)
+    assert "col/1" not in cache
+    cache.put("col/1", "_rev1", "{}", cache.version)
+    assert "col/1" in cache
+
+    cache.invalidate()
+    assert len(cache) == 0
+    assert cache.bytes == 0
+
+    cache.clear()
+    assert cache.misses == cache.hits == 0
+
+
+def test_query_result_cache_dependencies():
+    cache = QueryResultCache()
+    key = cache.key("FOR d IN @@col RETURN d", {"@col": "foo"}, {"count": True})
+    assert key == cache.key("FOR d IN @@col RETURN d", {"@col": "foo"}, {"count": True})
+    assert key != cache.key("FOR d IN @@col RETURN d", {"@col": "bar"}, {"count": True})
+    assert cache.dependencies(key) == (False, None)
+
+    plan = {"collections": [{"name": "foo", "type": "read"}], "nodes": []}
+    assert cache.set_dependencies(key, plan) == frozenset(["foo"])
+    assert cache.dependencies(key) == (True, frozenset(["foo"]))
+
+    write_plan = {"collections": [{"name": "foo", "type": "write"}], "nodes": []}
+    assert cache.set_dependencies("write", write_plan) is None
+    view_plan = {"collections": [], "nodes": [{"type": "EnumerateViewNode"}]}
+    assert cache.set_dependencies("view", view_plan) is None
+    assert cache.set_dependencies("rand", plan, cacheable=False) is None
+    assert cache.dependencies("view") == (True, None)
+
+
+def test_query_result_cache_invalidate():
+    cache = QueryResultCache(max_entries=2)
+    assert cache.get("q1") is None
+    cache.put("q1", "[1]", ["foo"], cache.clock)
+    cache.put("q2", "[2]", ["foo", "bar"], cache.clock)
+    assert cache.get("q1") == "[1]"
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.bytes == 6
+
+    cache.put("q3", "[3]", ["baz"], cache.clock)
+    assert len(cache) == 2
+    assert cache.get("q2") is None
+    assert cache.evictions == 1
+
+    clock = cache.clock
+    cache.invalidate(["foo"])
+    assert cache.get("q1") is None
+    assert cache.get("q3") == "[3]"
+    assert cache.invalidations == 1
+
+    # Results of executions started before an invalidation are not stored.
+    cache.put("q1", "[1]", ["foo"], clock)
+    assert cache.get("q1") is None
+    cache.put("q4", "[4]", ["bar"], clock)
+    assert cache.get("q4") == "[4]"
+
+    cache.invalidate()
+    assert len(cache) == 0
+    assert cache.bytes == 0
+
+
+def test_query_result_cache_limits():
+    cache = QueryResultCache(max_bytes=4, ttl=0.01)
+    cache.put("q1", "[11]", [], cache.clock)
+    cache.put("q2", "[222]", [], cache.clock)
+    assert cache.get("q1") == "[11]"
+    assert cache.get("q2") is None
+
+    time.sleep(0.02)
+    assert cache.get("q1") is None
+    assert len(cache) == 0
+    assert cache.bytes == 0
+
+    # Sizes are counted in UTF-8 encoded bytes.
+    cache.put("q3", '"é"', [], cache.clock)
+    assert cache.bytes == 4
+    cache.put("q4", '"€"', [], cache.clock)
+    assert cache.get("q4") is None
+    cache.put("q5", '"a"', [], cache.clock)
+    assert cache.get("q3") is None
+    assert cache.bytes == 3
+
+
+def test_metadata_cache():
+    cache = MetadataCache(ttl=0.01)
+    key = cache.key("/_api/index", {"collection": "foo"})
+    assert key == "/_api/index?collection=foo"
+    assert cache.key("/_api/collection") == "/_api/collection"
+    assert cache.get(key) is None
+    assert cache.misses == 1
+
+    resp = Response("get", "url", {}, 200, "OK", '{"indexes": []}')
+    version = cache.version
+    cache.put(key, resp, version)
+    copy = cache.get(key)
+    assert copy is not resp
+    assert copy.raw_body == resp.raw_body
+    assert copy.status_code == 200
+    assert copy.body is None
+    assert cache.hits == 1
+
+    time.sleep(0.02)
+    assert cache.get(key) is None
+    assert key not in cache
+
+    cache.put(key, resp)
+    cache.invalidate(["/_api/collection"])
+    assert key in cache
+    cache.invalidate([key])
+    assert key not in cache
+
+    # Responses requested before an invalidation are not stored.
+    cache.put(key, resp, version)
+    assert key not in cache
+
+
+def test_plan_cache_key():
+    query = "FOR d IN @@col FILTER d.@field == @value RETURN d"
+
+    def key(col="a", field="x", value=1, kind="explain"):
+        return PlanCache.key(kind, query, {"@col": col, "field": field, "value": value})
+
+    assert key() == key(value=2)
+    assert key() != key(value="2")
+    assert key() != key(col="b")
+    assert key() != key(field="y")
+    assert key() != key(kind="validate")
+
+
+def test_plan_cache_lookup():
+    cache = PlanCache(max_entries=2)
+    assert cache.get("a") is None
+    assert cache.misses == 1
+
+    cache.put("a", {"collections": [{"name": "col1", "type": "read"}]}, cache.clock)
+    result = cache.get("a")
+    result["collections"].clear()
+    assert cache.get("a") == {"collections": [{"name": "col1", "type": "read"}]}
+    assert cache.hits == 2
+
+    cache.put("b", {"collections": ["col2"]}, cache.clock)
+    cache.put("c", [{"collections": [{"name": "col3"}]}], cache.clock)
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get("b") is not None
+
+
+def test_plan_cache_invalidate():
+    cache = PlanCache()
+    cache.put("a", {"collections": [{"name": "col1"}]}, cache.clock)
+    cache.put("b", {"collections": ["col2"]}, cache.clock)
+
+    cache.invalidate(["col1"])
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.invalidations == 1
+
+    # Results of requests sent before an invalidation are not stored
+    clock = cache.clock
+    cache.invalidate(["col3"])
+    cache.put("a", {"collections": []}, clock)
+    assert cache.get("a") is None
+
+    cache.invalidate()
+    assert len(cache) == 0
+    cache.clear()
+    assert cache.hits == cache.misses == cache.invalidations == 0
+    assert "PlanCache" in repr(cache)
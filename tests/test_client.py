@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 import pytest
@@ -5,7 +6,11 @@ from pkg_resources import get_distribution
 
 from aioarango.client import ArangoClient
 from aioarango.database import StandardDatabase
-from aioarango.exceptions import ServerConnectionError
+from aioarango.exceptions import (
+    DocumentInsertError,
+    DocumentRevisionError,
+    ServerConnectionError,
+)
 from aioarango.http import DefaultHTTPClient
 from aioarango.resolver import (
     RandomHostResolver,
@@ -111,3 +116,103 @@ async def test_client_custom_http_client(db: StandardDatabase, username, passwor
     # Set verify to True to send a test API call on initialization.
     await client.db(db.name, username, password, verify=True)
     assert http_client.counter == 1
+
+
+async def test_client_coalesce_reads(db: StandardDatabase, col, username, password):
+    class MyHTTPClient(DefaultHTTPClient):
+        def __init__(self) -> None:
+            super().__init__()
+            self.counter = 0
+
+        async def send_request(
+            self, session, method, url, headers=None, params=None, data=None, auth=None
+        ):
+            self.counter += 1
+            return await super().send_request(
+                session, method, url, headers, params, data, auth
+            )
+
+    await col.insert({"_key": "1", "val": [1]})
+
+    http_client = MyHTTPClient()
+    client = ArangoClient(hosts="http://127.0.0.1:8529", http_client=http_client)
+    cdb = await client.db(db.name, username, password, coalesce_reads=True)
+    ccol = cdb.collection(col.name)
+
+    docs = await asyncio.gather(*[ccol.get("1") for _ in range(50)])
+    assert http_client.counter == 1
+    assert cdb._executor.coalescer.requests == 1
+    assert cdb._executor.coalescer.coalesced == 49
+
+    # Every caller gets its own copy of the result.
+    docs[0]["val"].append(2)
+    assert all(doc["val"] == [1] for doc in docs[1:])
+
+    # Writes and different reads are never coalesced.
+    await asyncio.gather(
+        ccol.get("1"), ccol.get("2"), ccol.insert({}), ccol.insert({})
+    )
+    assert http_client.counter == 5
+
+    await client.close()
+
+
+async def test_client_auto_batch(db: StandardDatabase, col, username, password):
+    class MyHTTPClient(DefaultHTTPClient):
+        def __init__(self) -> None:
+            super().__init__()
+            self.counter = 0
+
+        async def send_request(
+            self, session, method, url, headers=None, params=None, data=None, auth=None
+        ):
+            self.counter += 1
+            return await super().send_request(
+                session, method, url, headers, params, data, auth
+            )
+
+    http_client = MyHTTPClient()
+    client = ArangoClient(hosts="http://127.0.0.1:8529", http_client=http_client)
+    bdb = await client.db(
+        db.name, username, password, auto_batch=True, auto_batch_window=0.01
+    )
+    bcol = bdb.collection(col.name)
+
+    results = await asyncio.gather(
+        *[bcol.insert({"_key": str(i), "val": i}) for i in range(10)],
+        bcol.insert({"_key": "1"}),
+        return_exceptions=True,
+    )
+    assert http_client.counter == 1
+    assert [result["_key"] for result in results[:10]] == [str(i) for i in range(10)]
+    assert isinstance(results[10], DocumentInsertError)
+    assert results[10].error_code == 1210
+
+    docs = await asyncio.gather(bcol.get("1"), bcol.get("1"), bcol.get("missing"))
+    assert http_client.counter == 2
+    assert docs[0] == docs[1] and docs[0] is not docs[1]
+    assert docs[0]["val"] == 1
+    assert docs[2] is None
+
+    results = await asyncio.gather(
+        bcol.update({"_key": "2", "val": 20}),
+        bcol.update({"_key": "3", "_rev": "bad", "val": 30}),
+        return_exceptions=True,
+    )
+    assert http_client.counter == 3
+    assert results[0]["_key"] == "2"
+    assert isinstance(results[1], DocumentRevisionError)
+
+    results = await asyncio.gather(
+        bcol.delete("4"), bcol.delete("missing", ignore_missing=True)
+    )
+    assert http_client.counter == 4
+    assert results[0]["_key"] == "4"
+    assert results[1] is False
+
+    assert bdb._executor.batcher.requests == 4
+    assert bdb._executor.batcher.batched == 18
+    assert (await col.get("2"))["val"] == 20
+    assert await col.has("4") is False
+
+    await client.close()
@@ -0,0 +1,30 @@
+from aioarango.columns import Column, make_columns
+
+
+def test_column_typed_with_nulls():
+    column = Column("a", "q")
+    column.extend([{"a": 1}, {"a": 2}], "a")
+    assert column.nulls is None
+    column.extend([{"a": None}, {}, {"a": 5}], "a")
+    column.extend([[6]], 0)
+    assert len(column) == 6
+    assert column.null_count == 2
+    assert list(column.values) == [1, 2, 0, 0, 5, 6]
+    assert column.to_list() == [1, 2, None, None, 5, 6]
+    assert "Column" in repr(column)
+
+
+def test_column_untyped():
+    column = Column("b")
+    column.extend([{"b": "x"}, {"b": None}], "b")
+    assert column.values == ["x", None]
+    assert column.null_count == 0
+    assert column.to_list() == ["x", None]
+
+
+def test_make_columns():
+    columns = make_columns(["a", "b"], {"b": "d"})
+    assert [(c.name, c.typecode) for c in columns] == [("a", None), ("b", "d")]
+    columns = make_columns(["a", "b"], ["q", None])
+    assert [(c.name, c.typecode) for c in columns] == [("a", "q"), ("b", None)]
+    assert [c.typecode for c in make_columns(["a"])] == [None]
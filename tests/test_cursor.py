@@ -1,6 +1,14 @@
+import asyncio
+import csv
+import gc
+import gzip
+import io
+import json
+
 import pytest
 
 from aioarango.collection import StandardCollection
+from aioarango.cursor import AdaptiveBatchSize, Cursor
 from aioarango.database import StandardDatabase
 from aioarango.exceptions import (
     CursorCloseError,
@@ -294,3 +302,250 @@ async def test_cursor_no_count(db: StandardDatabase, col: StandardCollection):
             _ = bool(cursor)
         assert err.value.message == "cursor count not enabled"
         assert await cursor.fetch()
+
+
+async def test_cursor_prefetch(db: StandardDatabase, col: StandardCollection, docs):
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d",
+        count=True,
+        batch_size=1,
+        prefetch=2,
+    )
+    assert clean_doc([doc async for doc in cursor]) == docs
+    assert cursor.has_more() is False
+    assert await cursor.close(ignore_missing=True) is False
+
+    # Test close while batches are being prefetched
+    cursor = await col.all(prefetch=3)
+    assert await cursor.close() in (True, None)
+
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d", batch_size=1, prefetch=3
+    )
+    assert clean_doc(await cursor.next()) == docs[0]
+    assert await cursor.close() is True
+    with pytest.raises(CursorNextError):
+        await cursor.fetch()
+
+
+async def test_cursor_batches_and_drain(
+    db: StandardDatabase, col: StandardCollection, docs
+):
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d", batch_size=2
+    )
+    assert clean_doc(await cursor.next()) == docs[0]
+    batches = [batch async for batch in cursor.batches()]
+    assert [len(batch) for batch in batches] == [1, 2, 2]
+    assert clean_doc([doc for batch in batches for doc in batch]) == docs[1:]
+    assert cursor.empty() is True
+    assert cursor.has_more() is False
+
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d", batch_size=4, prefetch=1
+    )
+    assert clean_doc(await cursor.drain()) == docs
+    assert await cursor.drain() == []
+
+
+async def test_cursor_to_columns(db: StandardDatabase, col: StandardCollection, docs):
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN {{key: d._key, val: d.val}}",
+        batch_size=2,
+    )
+    columns = await cursor.to_columns(["key", "val"], {"val": "q"})
+    assert columns["key"].to_list() == [doc["_key"] for doc in docs]
+    assert columns["val"].to_list() == [doc["val"] for doc in docs]
+
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN [d.val, d.missing]", batch_size=2
+    )
+    columns = await cursor.to_columns(["val", "missing"], ["q", "d"])
+    assert columns["val"].to_list() == [doc["val"] for doc in docs]
+    assert columns["missing"].null_count == len(docs)
+
+
+async def test_cursor_allow_retry(db: StandardDatabase, col: StandardCollection, docs):
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d",
+        batch_size=2,
+        allow_retry=True,
+        max_retries=2,
+    )
+    assert clean_doc([doc async for doc in cursor]) == docs
+    assert cursor.has_more() is False
+
+
+async def test_cursor_export_to(
+    db: StandardDatabase, col: StandardCollection, docs, tmp_path
+):
+    path = tmp_path / "export.jsonl.gz"
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d", batch_size=2
+    )
+    assert await cursor.export_to(str(path)) == len(docs)
+    with gzip.open(str(path), "rt") as f:
+        assert clean_doc([json.loads(line) for line in f]) == docs
+
+    stream = io.BytesIO()
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN [d._key, d.val, d.loc]",
+        batch_size=4,
+    )
+    assert await cursor.export_to(stream, "csv", ["key", "val", "loc"]) == len(docs)
+    rows = list(csv.reader(io.StringIO(stream.getvalue().decode())))
+    assert rows[0] == ["key", "val", "loc"]
+    assert rows[1:] == [
+        [doc["_key"], str(doc["val"]), json.dumps(doc["loc"])] for doc in docs
+    ]
+
+    # Arrays without fields are written under positional columns
+    stream = io.BytesIO()
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN [d._key, d.val]"
+    )
+    assert await cursor.export_to(stream, "csv") == len(docs)
+    rows = list(csv.reader(io.StringIO(stream.getvalue().decode())))
+    assert rows[0] == ["0", "1"]
+    assert rows[1:] == [[doc["_key"], str(doc["val"])] for doc in docs]
+
+    with pytest.raises(ValueError):
+        await cursor.export_to(stream, "xml")
+
+
+async def test_cursor_tracking(db: StandardDatabase, col: StandardCollection, docs):
+    tracker = db.cursors
+    await tracker.close_all()
+    assert repr(tracker) == "<CursorTracker 0 open>"
+    assert tracker.oldest_age is None
+    query = f"FOR d IN {col.name} RETURN d"
+
+    cursor = await db.aql.execute(query, batch_size=2)
+    assert len(tracker) == 1
+    assert list(tracker.ages()) == [cursor.id]
+    assert tracker.oldest_age >= 0
+    await cursor.drain()
+    assert len(tracker) == 0
+
+    cursor = await db.aql.execute(query, batch_size=2)
+    assert await cursor.close() is True
+    assert len(tracker) == 0
+
+    # Test cursor abandoned mid-iteration
+    leaked = tracker.leaked
+    cursor = await db.aql.execute(query, batch_size=2)
+    cursor_id = cursor.id
+    del cursor
+    gc.collect()
+    assert len(tracker) == 0
+    assert tracker.leaked == leaked + 1
+    await asyncio.sleep(0.1)
+    cursor = Cursor(db.conn, {"id": cursor_id, "result": [], "hasMore": True})
+    with pytest.raises(CursorNextError):
+        await cursor.fetch()
+    assert await cursor.close(ignore_missing=True) is False
+
+    await db.aql.execute(query, batch_size=2)
+    assert await tracker.close_all() == 1
+    assert len(tracker) == 0
+
+
+async def test_cursor_adaptive_batch_size(
+    db: StandardDatabase, col: StandardCollection, docs
+):
+    sizer = AdaptiveBatchSize(target_bytes=1 << 20, min_size=1, max_size=4)
+    assert repr(sizer) == "<AdaptiveBatchSize None>"
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d",
+        batch_size=1,
+        adaptive_batch_size=sizer,
+    )
+    assert clean_doc(await cursor.drain()) == docs
+    assert sizer.batch_size == 4
+
+    sizer = AdaptiveBatchSize(target_bytes=100, min_size=1, max_step=2)
+    assert sizer.observe(10, 1000, 0.1) == 5
+    assert sizer.observe(0, 0, 0.1) == 5
+    sizer = AdaptiveBatchSize(target_latency=0.1, max_step=8)
+    assert sizer.observe(100, 1000, 0.2) == 50
+
+
+async def test_cursor_keep_alive(db: StandardDatabase, col: StandardCollection, docs):
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d",
+        batch_size=2,
+        ttl=1,
+        keep_alive=True,
+    )
+    result = []
+    async for doc in cursor:
+        result.append(doc)
+        await asyncio.sleep(0.3)
+    assert clean_doc(result) == docs
+    await cursor.close(ignore_missing=True)
+
+    # Retryable cursors survive batches consumed slower than their TTL
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d",
+        batch_size=2,
+        ttl=1,
+        keep_alive=True,
+        allow_retry=True,
+    )
+    result = []
+    async for doc in cursor:
+        result.append(doc)
+        await asyncio.sleep(0.8)
+    assert clean_doc(result) == docs
+    await cursor.close(ignore_missing=True)
+
+    # Abandoned keep-alive cursors are still garbage collected
+    tracker = db.cursors
+    leaked = tracker.leaked
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} RETURN d",
+        batch_size=1,
+        ttl=1,
+        keep_alive=True,
+        allow_retry=True,
+    )
+    task = cursor._prefetch_task
+    await asyncio.sleep(0.6)
+    del cursor
+    gc.collect()
+    assert tracker.leaked == leaked + 1
+    await asyncio.sleep(0)
+    assert task.done()
+
+
+async def test_cursor_map_concurrent(
+    db: StandardDatabase, col: StandardCollection, docs
+):
+    query = f"FOR d IN {col.name} SORT d._key RETURN d.val"
+
+    async def double(value):
+        await asyncio.sleep(0.01 * (6 - value))
+        return value * 2
+
+    cursor = await db.aql.execute(query, batch_size=2)
+    results = [r async for r in cursor.map_concurrent(double, 3, ordered=True)]
+    assert results == [doc["val"] * 2 for doc in docs]
+
+    cursor = await db.aql.execute(query, batch_size=2)
+    results = [r async for r in cursor.map_concurrent(double, 3)]
+    assert sorted(results) == [doc["val"] * 2 for doc in docs]
+
+    async def fail(value):
+        if value == 3:
+            raise ValueError(value)
+        return value
+
+    cursor = await db.aql.execute(query, batch_size=2)
+    with pytest.raises(ValueError):
+        async for _ in cursor.map_concurrent(fail, 2):
+            pass
+    await cursor.close(ignore_missing=True)
+
+    cursor = await db.aql.execute(query, batch_size=2)
+    results = [r async for r in cursor.map_batches(sum)]
+    assert results == [3, 7, 11]
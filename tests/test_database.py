@@ -36,7 +36,12 @@ from aioarango.foxx import Foxx
 from aioarango.pregel import Pregel
 from aioarango.replication import Replication
 from aioarango.wal import WAL
-from tests.helpers import assert_raises, generate_db_name
+from tests.helpers import (
+    assert_raises,
+    generate_col_name,
+    generate_db_name,
+    generate_graph_name,
+)
 
 pytestmark = pytest.mark.asyncio
 
@@ -285,3 +290,46 @@ async def test_database_management(db: StandardDatabase, sys_db: StandardDatabas
         await sys_db.delete_database(db_name)
     assert err.value.error_code in {FORBIDDEN, DATABASE_NOT_FOUND}
     assert await sys_db.delete_database(db_name, ignore_missing=True) is False
+
+
+async def test_database_metadata_cache(db: StandardDatabase, col):
+    cache = await db.warm_metadata_cache()
+    assert db.metadata_cache is cache
+    assert len(cache) > 0
+    misses = cache.misses
+
+    # Warmed metadata is served without requests.
+    assert await db.has_collection(col.name) is True
+    assert col.name in [c["name"] for c in await db.collections()]
+    properties = await col.properties()
+    assert properties["name"] == col.name
+    assert len(await col.indexes()) >= 1
+    assert cache.misses == misses
+    assert cache.hits >= 4
+
+    # Cached results are returned as separate copies.
+    properties["name"] = "foo"
+    assert (await col.properties())["name"] == col.name
+
+    # DDL through the client invalidates the affected metadata.
+    col_name = generate_col_name()
+    assert await db.has_collection(col_name) is False
+    await db.create_collection(col_name)
+    assert await db.has_collection(col_name) is True
+    index_count = len(await col.indexes())
+    await col.add_persistent_index(["foo"])
+    assert len(await col.indexes()) == index_count + 1
+    await db.delete_collection(col_name)
+    assert await db.has_collection(col_name) is False
+
+    graph_name = generate_graph_name()
+    assert await db.has_graph(graph_name) is False
+    graph = await db.create_graph(graph_name)
+    assert await db.has_graph(graph_name) is True
+    await graph.create_vertex_collection(generate_col_name())
+    assert len(await graph.vertex_collections()) == 1
+    await db.delete_graph(graph_name, drop_collections=True)
+    assert await db.has_graph(graph_name) is False
+
+    db.disable_metadata_cache()
+    assert db.metadata_cache is None
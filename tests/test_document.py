@@ -1117,6 +1117,18 @@ async def test_document_find(col: StandardCollection, bad_col: StandardCollectio
     assert list([doc async for doc in await col.find({"val": 3})]) == []
     assert list([doc async for doc in await col.find({"val": 4})]) == []
 
+    # Test find with sub-attributes and batch size
+    await col.insert_many([{"_key": str(i), "a": {"b": i % 2}} for i in range(5)])
+    cursor = await col.find({"a.b": 1}, batch_size=1)
+    assert sorted([doc["_key"] async for doc in cursor]) == ["1", "3"]
+    assert [doc async for doc in await col.find({"a": {"b": 0}}, limit=1)] != []
+
+    # Test find with projection and streaming
+    cursor = await col.find({"a.b": 0}, fields=["_key", "a.b"], stream=True)
+    result = sorted([doc async for doc in cursor], key=lambda doc: doc["_key"])
+    assert result == [{"_key": str(i), "a.b": 0} for i in (0, 2, 4)]
+    assert cursor.count() is None
+
     # Test find with bad database
     with assert_raises(DocumentGetError) as err:
         await bad_col.find({"val": 1})
@@ -1747,7 +1759,9 @@ async def test_document_export(col: StandardCollection, bad_col: StandardCollect
     assert await cursor.close(ignore_missing=True) is None
 
 
-async def test_document_random(col: StandardCollection, bad_col: StandardCollection, docs):
+async def test_document_random(
+    db: StandardDatabase, col: StandardCollection, bad_col: StandardCollection, docs
+):
     # Set up test documents
     await col.import_bulk(docs)
 
@@ -1756,6 +1770,12 @@ async def test_document_random(col: StandardCollection, bad_col: StandardCollect
         random_doc = await col.random()
         assert clean_doc(random_doc) in docs
 
+    # Test random in batch execution context
+    batch_db = db.begin_batch_execution()
+    job = await batch_db.collection(col.name).random()
+    await batch_db.commit()
+    assert clean_doc(job.result()) in docs
+
     # Test random in empty collection
     await empty_collection(col)
     for attempt in range(10):
@@ -1958,3 +1978,103 @@ async def test_document_management_via_db(db: StandardDatabase, col: StandardCol
     assert result["_id"] == doc1_id
     assert not (await col.has(doc1_id, check_rev=False))
     assert await col.count() == 2
+
+
+async def test_document_cache(db: StandardDatabase, col: StandardCollection):
+    cache = col.enable_cache(ttl=60)
+    assert col.cache is cache
+    assert db.collection(col.name).cache is cache
+
+    await col.insert({"_key": "1", "val": [1]})
+    doc = await col.get("1")
+    assert cache.misses == 1
+    doc["val"].append(2)
+
+    # Cached documents are returned as separate copies.
+    doc = await col.get(col.name + "/1")
+    assert doc["val"] == [1]
+    assert cache.hits == 1
+
+    # Writes through the client invalidate the cached document.
+    await db.collection(col.name).update({"_key": "1", "val": [3]})
+    assert col.name + "/1" not in cache
+    assert (await col.get("1"))["val"] == [3]
+    await col.update_many([{"_key": "1", "val": [4]}])
+    assert (await col.get("1"))["val"] == [4]
+    await col.delete("1")
+    assert await col.get("1") is None
+
+    # Expired documents are revalidated by revision.
+    cache = col.enable_cache(ttl=0)
+    await col.insert({"_key": "2"})
+    await col.get("2")
+    assert await col.get("2") == await col.get("2")
+    assert cache.revalidations == 2
+    assert cache.not_modified == 2
+
+    # Documents with an expected revision are always checked by the server.
+    with pytest.raises(DocumentRevisionError):
+        await col.get({"_key": "2", "_rev": "bad"})
+
+    await col.truncate()
+    assert len(cache) == 0
+    col.disable_cache()
+    assert col.cache is None
+
+
+async def test_document_scan_parallel(
+    db: StandardDatabase, col: StandardCollection, docs
+):
+    await col.insert_many(docs)
+
+    cursors = await col.scan_partitions(partitions=3, batch_size=1)
+    assert 1 <= len(cursors) <= 3
+    keys = []
+    for cursor in cursors:
+        keys.extend(doc["_key"] async for doc in cursor)
+    assert sorted(keys) == sorted(doc["_key"] for doc in docs)
+
+    documents = [doc async for doc in await col.scan_parallel(partitions=4)]
+    assert sorted(clean_doc(documents), key=lambda doc: doc["_key"]) == docs
+
+    # Test with more partitions than documents
+    documents = [doc async for doc in await col.scan_parallel(partitions=20)]
+    assert len(documents) == len(docs)
+
+    # Test in batch execution context
+    batch_col = db.begin_batch_execution().collection(col.name)
+    with assert_raises(AssertionError) as err:
+        await batch_col.scan_partitions()
+    assert str(err.value) == "only available in default execution context"
+
+
+async def test_document_paginate(col: StandardCollection, docs):
+    await col.insert_many(docs)
+    keys = sorted(doc["_key"] for doc in docs)
+
+    pages = [await col.paginate(page_size=2)]
+    assert pages[0].previous_token is None
+    while pages[-1].next_token is not None:
+        pages.append(await col.paginate(2, pages[-1].next_token))
+    assert [doc["_key"] for page in pages for doc in page] == keys
+
+    # Test paging backward from the last page
+    page = pages[-1]
+    backward = [page]
+    while page.previous_token is not None:
+        page = await col.paginate(2, page.previous_token)
+        backward.append(page)
+    assert [doc["_key"] for page in backward[::-1] for doc in page] == keys
+
+    last = await col.paginate(2, backward=True)
+    assert [doc["_key"] for doc in last] == keys[-2:]
+    assert last.next_token is None
+
+    # Test paging by another field with filters
+    page = await col.paginate(1, sort_field="val", filters={"text": "bar"})
+    assert [doc["val"] for doc in page] == [4]
+    page = await col.paginate(1, page.next_token, "val", {"text": "bar"})
+    assert [doc["val"] for doc in page] == [5]
+
+    with pytest.raises(ValueError):
+        await col.paginate(2, pages[0].next_token, sort_field="val")
@@ -0,0 +1,149 @@
+import asyncio
+import math
+
+import httpx
+import pytest
+
+from aioarango.database import StandardDatabase
+from aioarango.metrics import (
+    Histogram,
+    MetricsSampler,
+    MetricsSnapshot,
+    parse_metrics,
+)
+
+pytestmark = pytest.mark.asyncio
+
+METRICS = """
+# HELP arangodb_scheduler_queue_length Server's internal queue length
+# TYPE arangodb_scheduler_queue_length gauge
+arangodb_scheduler_queue_length{role="COORDINATOR",shortname="Crdn0001"} 3
+arangodb_scheduler_queue_length{role="COORDINATOR",shortname="Crdn0002"} 4
+# HELP arangodb_rocksdb_write_stalls_total Number of RocksDB write stalls
+# TYPE arangodb_rocksdb_write_stalls_total counter
+arangodb_rocksdb_write_stalls_total {stalls}
+# TYPE arangodb_aql_query_time histogram
+arangodb_aql_query_time_bucket{role="SINGLE",le="0.01"} 10
+arangodb_aql_query_time_bucket{role="SINGLE",le="1.0"} {bucket}
+arangodb_aql_query_time_bucket{role="SINGLE",le="+Inf"} {bucket}
+arangodb_aql_query_time_count{role="SINGLE"} {bucket}
+arangodb_aql_query_time_sum{role="SINGLE"} 5.5
+escaped{a="x\\"y,}",b="2"} 1.5e3 1620000000000
+"""
+
+
+def metrics_text(stalls, bucket):
+    return METRICS.replace("{stalls}", str(stalls)).replace("{bucket}", str(bucket))
+
+
+def test_parse_metrics():
+    families = parse_metrics(metrics_text(10, 20))
+    assert sorted(families) == [
+        "arangodb_aql_query_time",
+        "arangodb_rocksdb_write_stalls_total",
+        "arangodb_scheduler_queue_length",
+        "escaped",
+    ]
+
+    family = families["arangodb_scheduler_queue_length"]
+    assert family.type == "gauge"
+    assert family.help == "Server's internal queue length"
+    assert [s.value for s in family.samples] == [3, 4]
+    assert family.samples[0].labels == (
+        ("role", "COORDINATOR"),
+        ("shortname", "Crdn0001"),
+    )
+
+    family = families["arangodb_aql_query_time"]
+    assert family.type == "histogram"
+    assert len(family.samples) == 5
+
+    [sample] = families["escaped"].samples
+    assert sample.labels == (("a", 'x"y,}'), ("b", "2"))
+    assert sample.value == 1500
+    assert families["escaped"].type == "untyped"
+
+
+def test_histogram_quantile():
+    hist = Histogram("h", (), [(0.1, 50), (1.0, 90), (10.0, 100), (math.inf, 100)])
+    assert hist.quantile(0.5) == pytest.approx(0.1)
+    assert hist.quantile(0.7) == pytest.approx(0.55)
+    assert hist.quantile(0.95) == pytest.approx(5.5)
+    assert Histogram("h", (), [(math.inf, 5)]).quantile(0.5) is None
+    assert Histogram("h", (), [(1.0, 0), (math.inf, 0)]).quantile(0.5) is None
+
+    delta = hist - Histogram("h", (), [(0.1, 50), (1.0, 50), (10.0, 50), (math.inf, 50)])
+    assert delta.buckets == [(0.1, 0), (1.0, 40), (10.0, 50), (math.inf, 50)]
+
+
+def test_metrics_snapshot():
+    first = MetricsSnapshot.from_text(metrics_text(10, 20), 100.0)
+    assert first.interval is None
+    assert first.get("arangodb_scheduler_queue_length") == 7
+    assert first.get("arangodb_scheduler_queue_length", shortname="Crdn0002") == 4
+    assert first.get("arangodb_scheduler_queue_length", role="DBSERVER") is None
+    assert first.rate("arangodb_rocksdb_write_stalls_total") is None
+    assert first.rates() == {}
+    assert first.histogram("arangodb_aql_query_time").count == 20
+    assert first.quantile("arangodb_aql_query_time", 0.5) == pytest.approx(0.01)
+
+    second = MetricsSnapshot.from_text(
+        metrics_text(30, 40), 110.0, previous=first
+    )
+    assert second.interval == 10.0
+    assert second.rate("arangodb_rocksdb_write_stalls_total") == 2.0
+    assert second.rates() == {"arangodb_rocksdb_write_stalls_total": 2.0}
+    assert second.histogram("arangodb_aql_query_time", delta=True).count == 20
+    assert second.quantile("arangodb_aql_query_time", 0.5) == pytest.approx(0.505)
+    assert second.quantile("arangodb_aql_query_time", 0.5, delta=False) == (
+        pytest.approx(0.34)
+    )
+    assert second.quantile("arangodb_aql_query_time", 0.5, role="X") is None
+
+    # Counter resets are treated as a restart from zero.
+    third = MetricsSnapshot.from_text(
+        metrics_text(5, 40), 115.0, previous=second
+    )
+    assert third.rate("arangodb_rocksdb_write_stalls_total") == 1.0
+
+
+async def test_metrics_sampler(sys_db: StandardDatabase):
+    snapshots = []
+    sampler = MetricsSampler(sys_db, interval=0.1, callback=snapshots.append)
+    assert sampler.latest is None
+
+    first = await sampler.sample()
+    assert sampler.latest is first
+    assert first.interval is None
+    assert "arangodb_scheduler_queue_length" in first.names()
+    assert first.get("arangodb_scheduler_queue_length") is not None
+
+    async with sampler:
+        assert sampler.running is True
+        await asyncio.sleep(0.35)
+    assert sampler.running is False
+    assert len(snapshots) >= 3
+    assert sampler.latest.interval > 0
+    assert sampler.last_error is None
+
+
+async def test_metrics_sampler_errors():
+    class FlakyDatabase:
+        name = "flaky"
+        calls = 0
+
+        async def metrics(self):
+            self.calls += 1
+            if self.calls == 1:
+                raise httpx.ConnectError("connection refused")
+            return metrics_text(1, 10)
+
+    def callback(snapshot):
+        raise ValueError("callback failed")
+
+    sampler = MetricsSampler(FlakyDatabase(), interval=0.01, callback=callback)
+    async with sampler:
+        await asyncio.sleep(0.1)
+        assert sampler.running is True
+    assert isinstance(sampler.last_error, ValueError)
+    assert sampler.latest is not None
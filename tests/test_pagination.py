@@ -0,0 +1,37 @@
+import pytest
+
+from aioarango.pagination import Page, decode_token, encode_token, get_field
+
+
+def test_get_field():
+    doc = {"a": {"b": 1}, "c": 2}
+    assert get_field(doc, "c") == 2
+    assert get_field(doc, "a.b") == 1
+    assert get_field(doc, "a.x") is None
+    assert get_field(doc, "c.d") is None
+
+
+def test_token_round_trip():
+    token = encode_token("a.b", {"_key": "k1", "a": {"b": 1.5}}, backward=True)
+    assert "=" not in token
+    assert decode_token(token, "a.b") == (1.5, "k1", True)
+
+    token = encode_token("_key", {"_key": "k2"}, backward=False)
+    assert decode_token(token, "_key") == ("k2", "k2", False)
+
+
+def test_token_invalid():
+    token = encode_token("val", {"_key": "k1", "val": 1}, backward=False)
+    with pytest.raises(ValueError):
+        decode_token(token, "_key")
+    for bad in ["", "!!!", "e30"]:
+        with pytest.raises(ValueError):
+            decode_token(bad, "val")
+
+
+def test_page():
+    page = Page([{"_key": "1"}], next_token="t")
+    assert len(page) == 1
+    assert list(page) == [{"_key": "1"}]
+    assert page.previous_token is None
+    assert "Page" in repr(page)
@@ -0,0 +1,98 @@
+from aioarango.plan import analyze_plan
+
+PLAN = {
+    "nodes": [
+        {"type": "SingletonNode", "id": 1, "estimatedCost": 1, "estimatedNrItems": 1},
+        {
+            "type": "EnumerateCollectionNode",
+            "id": 2,
+            "dependencies": [1],
+            "estimatedCost": 1001,
+            "estimatedNrItems": 1000,
+            "collection": "students",
+        },
+        {
+            "type": "SubqueryNode",
+            "id": 3,
+            "dependencies": [2],
+            "estimatedCost": 3001,
+            "estimatedNrItems": 1000,
+            "subquery": {
+                "nodes": [
+                    {"type": "SingletonNode", "id": 7, "estimatedCost": 1},
+                    {
+                        "type": "IndexNode",
+                        "id": 8,
+                        "dependencies": [7],
+                        "estimatedCost": 2,
+                        "estimatedNrItems": 1,
+                        "collection": "courses",
+                        "indexes": [{"id": "12", "name": "idx_course"}],
+                    },
+                    {"type": "ReturnNode", "id": 9, "dependencies": [8]},
+                ]
+            },
+        },
+        {
+            "type": "SortNode",
+            "id": 4,
+            "dependencies": [3],
+            "estimatedCost": 4001,
+            "estimatedNrItems": 1000,
+            "strategy": "standard",
+        },
+        {"type": "ReturnNode", "id": 5, "dependencies": [4], "estimatedCost": 5001},
+    ],
+    "rules": ["use-indexes"],
+    "estimatedCost": 5001,
+}
+
+STATS = {
+    "execution_time": 0.1,
+    "nodes": [
+        {"id": 1, "calls": 1, "items": 1, "runtime": 0.0},
+        {"id": 2, "calls": 2, "items": 20000, "runtime": 0.03},
+        {"id": 3, "calls": 2, "items": 20000, "runtime": 0.05},
+        {"id": 7, "calls": 2, "items": 2, "runtime": 0.0},
+        {"id": 8, "calls": 2, "items": 2, "runtime": 0.01},
+        {"id": 9, "calls": 2, "items": 2, "runtime": 0.01},
+        {"id": 4, "calls": 2, "items": 20000, "runtime": 0.09},
+        {"id": 5, "calls": 2, "items": 20000, "runtime": 0.095},
+    ],
+}
+
+
+def test_analyze_plan_tree():
+    analysis = analyze_plan(PLAN)
+    assert len(analysis.nodes) == 8
+    assert analysis.root.id == 5
+    assert analysis.root.dependencies[0].type == "SortNode"
+    subquery = analysis.root.dependencies[0].dependencies[0]
+    assert subquery.subquery.id == 9
+    assert subquery.subquery.dependencies[0].indexes == ["idx_course"]
+    assert analysis.rules == ["use-indexes"]
+    assert analysis.profiled is False
+    assert analysis.execution_time is None
+    assert [node.id for node in analysis.full_scans()] == [2]
+    assert analysis.expensive_sorts() == []
+    assert analysis.estimate_mismatches() == []
+    assert analysis.hottest(1)[0].id == 3
+
+
+def test_analyze_plan_profile():
+    analysis = analyze_plan(PLAN, STATS)
+    assert analysis.profiled is True
+    assert analysis.execution_time == 0.1
+
+    nodes = {node.id: node for node in analysis}
+    assert round(nodes[3].self_time, 4) == 0.01
+    assert round(nodes[4].self_time, 4) == 0.04
+    assert [node.id for node in analysis.hottest(2)] == [4, 2]
+    assert [node.id for node in analysis.expensive_sorts()] == [4]
+    assert [node.id for node in analysis.estimate_mismatches()][:3] == [2, 3, 4]
+
+    report = analysis.report(top=3)
+    assert "Hottest nodes:" in report
+    assert "Full collection scans:\n  #2 EnumerateCollectionNode students" in report
+    assert "Expensive sorts:\n  #4 SortNode: 20000 items" in report
+    assert "estimated 1000, actual 20000 (20.0x)" in report
@@ -0,0 +1,115 @@
+import pytest
+
+from aioarango.collection import StandardCollection
+from aioarango.database import StandardDatabase
+from aioarango.exceptions import AQLQueryExecuteError
+from aioarango.querylog import QueryLog, normalize_query
+
+pytestmark = pytest.mark.asyncio
+
+
+def test_normalize_query():
+    assert normalize_query("FOR d IN col RETURN d") == "FOR d IN col RETURN d"
+    assert (
+        normalize_query(
+            """
+            FOR d IN col1 // comment
+            FILTER d.a1 == 'x\\'y' AND d.b == -1.5e3 /* block
+            comment */ AND d.c == @v1 AND d.d == "z"
+            LIMIT 10
+            RETURN d
+            """
+        )
+        == "FOR d IN col1 FILTER d.a1 == ? AND d.b == ? AND d.c == @v1 "
+        "AND d.d == ? LIMIT ? RETURN d"
+    )
+    assert normalize_query("RETURN 1") == normalize_query("RETURN  2")
+
+
+def test_query_log_record():
+    query_log = QueryLog(top_k=2, max_queries=2)
+    assert len(query_log) == 0
+    assert query_log.entry("RETURN 1") is None
+
+    for value in range(1, 5):
+        query_log.record(
+            f"FOR d IN col FILTER d.val == {value} RETURN d",
+            {"value": value},
+            {
+                "execution_time": value / 10,
+                "scanned_full": value % 2,
+                "scanned_index": 1,
+                "peakMemoryUsage": value * 100,
+            },
+            [{"code": 1, "message": "warning"}] if value == 1 else [],
+        )
+    query_log.record_error("FOR d IN col FILTER d.val == 0 RETURN d")
+
+    entry = query_log.entry("FOR d IN col FILTER d.val == 42 RETURN d")
+    assert entry.count == 4
+    assert entry.errors == 1
+
+    [row] = query_log.report()
+    assert row["query"] == "FOR d IN col FILTER d.val == ? RETURN d"
+    assert row["count"] == 4
+    assert row["errors"] == 1
+    assert row["total_time"] == pytest.approx(1.0)
+    assert row["avg_time"] == pytest.approx(0.25)
+    assert row["p50_time"] == pytest.approx(0.2)
+    assert row["p99_time"] == pytest.approx(0.4)
+    assert row["max_time"] == pytest.approx(0.4)
+    assert row["full_scans"] == 2
+    assert row["scanned_full"] == 2
+    assert row["scanned_index"] == 4
+    assert row["peak_memory"] == 400
+    assert row["warning_count"] == 1
+    assert row["warnings"] == {"warning": 1}
+    assert [s["bind_vars"] for s in row["slowest"]] == [{"value": 4}, {"value": 3}]
+
+    # Least recently executed queries are evicted first.
+    query_log.record("RETURN 1", None, {"execution_time": 1.0})
+    query_log.record("FOR d IN col RETURN d", None, {"execution_time": 2.0})
+    assert len(query_log) == 2
+    assert [row["query"] for row in query_log.report()] == [
+        "FOR d IN col RETURN d",
+        "RETURN ?",
+    ]
+    assert len(query_log.report(sort_by="count", limit=1)) == 1
+
+    query_log.clear()
+    assert query_log.report() == []
+
+
+async def test_aql_query_log(db: StandardDatabase, col: StandardCollection, docs):
+    await col.import_bulk(docs)
+    assert db.aql.query_log is None
+
+    query_log = db.aql.enable_query_log(top_k=1)
+    assert db.aql.query_log is query_log
+
+    query = f"FOR d IN {col.name} FILTER d.val > @val RETURN d"
+    for val in range(3):
+        cursor = await db.aql.execute(query, bind_vars={"val": val}, batch_size=2)
+        assert len([doc async for doc in cursor]) == len(docs) - val
+
+    with pytest.raises(AQLQueryExecuteError):
+        await db.aql.execute(f"FOR d IN {col.name} RETURN")
+
+    [row] = query_log.report(limit=1)
+    assert row["query"] == query
+    assert row["count"] == 3
+    assert row["full_scans"] == 3
+    assert row["p50_time"] > 0
+    assert len(row["slowest"]) == 1
+    assert row["slowest"][0]["bind_vars"]["val"] in {0, 1, 2}
+    assert query_log.entry(f"FOR d IN {col.name} RETURN").errors == 1
+
+    # Streaming executions are recorded once, when the cursor is depleted
+    stream_query = f"FOR d IN {col.name} RETURN d._key"
+    cursor = await db.aql.execute(stream_query, batch_size=2, stream=True)
+    assert query_log.entry(stream_query) is None
+    assert len([key async for key in cursor]) == len(docs)
+    assert query_log.entry(stream_query).count == 1
+
+    db.aql.disable_query_log()
+    assert db.aql.query_log is None
@@ -0,0 +1,156 @@
+import pytest
+
+from aioarango.client import ArangoClient
+from aioarango.collection import StandardCollection
+from aioarango.database import StandardDatabase
+from aioarango.tracing import (
+    NOOP_SPAN,
+    InMemorySpanExporter,
+    NoopTracer,
+    Tracer,
+    parse_traceparent,
+    query_hash,
+)
+from tests.helpers import generate_doc_key
+
+pytestmark = pytest.mark.asyncio
+
+
+def test_parse_traceparent():
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+    span_id = "00f067aa0ba902b7"
+    assert parse_traceparent(f"00-{trace_id}-{span_id}-01") == (trace_id, span_id, 1)
+    assert parse_traceparent(f"00-{trace_id.upper()}-{span_id}-00") == (
+        trace_id,
+        span_id,
+        0,
+    )
+    assert parse_traceparent("") is None
+    assert parse_traceparent(f"00-{trace_id}-{span_id}") is None
+    assert parse_traceparent(f"00-{'0' * 32}-{span_id}-01") is None
+    assert parse_traceparent(f"00-{'x' * 32}-{span_id}-01") is None
+
+
+def test_query_hash():
+    assert query_hash("RETURN 1") == query_hash("RETURN 1")
+    assert query_hash("RETURN 1") != query_hash("RETURN 2")
+    assert len(query_hash("RETURN 1")) == 16
+
+
+def test_tracer_span_nesting():
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporter)
+    assert tracer.current_span() is None
+
+    with tracer.span("outer", {"foo": "bar"}) as outer:
+        assert tracer.current_span() is outer
+        with tracer.span("inner") as inner:
+            assert tracer.current_span() is inner
+            inner.set_attribute("baz", 1)
+            inner.set_attribute("qux", None)
+        assert tracer.current_span() is outer
+    assert tracer.current_span() is None
+
+    assert exporter.spans == [inner, outer]
+    assert inner.trace_id == outer.trace_id
+    assert inner.parent_id == outer.span_id
+    assert outer.parent_id is None
+    assert outer.attributes == {"foo": "bar"}
+    assert inner.attributes == {"baz": 1}
+    assert outer.duration >= inner.duration >= 0
+    assert outer.traceparent == f"00-{outer.trace_id}-{outer.span_id}-01"
+
+    exporter.clear()
+    assert exporter.spans == []
+
+
+def test_tracer_span_remote_parent():
+    exporter = InMemorySpanExporter(max_spans=1)
+    tracer = Tracer(exporter)
+    traceparent = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-00"
+
+    with tracer.span("remote", parent=traceparent) as span:
+        pass
+    assert span.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+    assert span.parent_id == "00f067aa0ba902b7"
+    assert span.flags == 0
+
+    with pytest.raises(ValueError):
+        with tracer.span("failed") as span:
+            raise ValueError("boom")
+    assert exporter.spans == [span]
+    assert span.error == "ValueError: boom"
+    assert span.attributes["error"] is True
+
+    # Payload sizes are counted in bytes, not characters
+    headers = {}
+    with tracer.span("payload") as span:
+        tracer.inject(headers, '{"name":"\u00e9t\u00e9"}')
+    assert headers["traceparent"] == span.traceparent
+    assert span.attributes["http.request_bytes"] == 16
+
+
+def test_noop_tracer():
+    tracer = NoopTracer()
+    assert tracer.enabled is False
+    assert tracer.exporter is None
+    with tracer.span("foo") as span:
+        assert span is NOOP_SPAN
+        assert span.is_recording is False
+        span.set_attribute("foo", "bar")
+        assert tracer.current_span() is None
+
+    headers = {}
+    tracer.inject(headers, "{}")
+    assert headers == {}
+
+
+async def test_tracer_requests(
+    db: StandardDatabase, col: StandardCollection, username, password, docs
+):
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporter)
+    client = ArangoClient(hosts="http://127.0.0.1:8529", tracer=tracer)
+    tdb = await client.db(db.name, username, password)
+    tcol = tdb.collection(col.name)
+    await tcol.import_bulk(docs)
+
+    with tracer.span("handler") as root:
+        query = f"FOR d IN {col.name} RETURN d"
+        cursor = await tdb.aql.execute(query, batch_size=2)
+        assert len([doc async for doc in cursor]) == len(docs)
+        assert await tcol.get(generate_doc_key()) is None
+
+    spans = exporter.spans
+    assert spans[-1] is root
+    assert all(span.trace_id == root.trace_id for span in spans)
+
+    execute_span = spans[1]
+    assert execute_span.name == "arangodb.request"
+    assert execute_span.parent_id == root.span_id
+    assert execute_span.attributes["db.name"] == db.name
+    assert execute_span.attributes["http.endpoint"] == "/_api/cursor"
+    assert execute_span.attributes["arango.query_hash"] == query_hash(query)
+    assert execute_span.attributes["arango.execution_time"] >= 0
+    assert execute_span.attributes["http.response_bytes"] > 0
+
+    fetch_spans = [span for span in spans if span.name == "arangodb.cursor.fetch"]
+    assert len(fetch_spans) == 2
+    assert all(span.parent_id == root.span_id for span in fetch_spans)
+
+    get_span = spans[-2]
+    assert get_span.attributes["db.collection"] == col.name
+    assert get_span.attributes["http.status_code"] == 404
+
+    # Batch commits and stream transactions are wrapped as well.
+    exporter.clear()
+    async with tdb.begin_batch_execution() as bdb:
+        await bdb.collection(col.name).count()
+    txn_db = await tdb.begin_transaction(read=col.name)
+    await txn_db.commit_transaction()
+    names = [span.name for span in exporter.spans]
+    assert "arangodb.batch.commit" in names
+    assert "arangodb.transaction.begin" in names
+    assert "arangodb.transaction.commit" in names
+
+    await client.close()